@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import numpy as np
+import pandas as pd
+from eda_quest.backends import get_backend
+
+
+def _blocks(columns, block_size):
+    for start in range(0, len(columns), block_size):
+        yield columns[start:start + block_size]
+
+
+def _numeric_block(df, columns, method):
+    """
+    Load a block of numeric columns as a centred float matrix plus its validity mask.
+    """
+    block = get_backend(df).to_pandas(df, list(columns)).astype(float)
+    if method == 'spearman':
+        block = block.rank()
+    # Centring first keeps the sums-of-products formula numerically stable
+    values = (block - block.mean()).to_numpy()
+    mask = ~np.isnan(values)
+    return np.where(mask, values, 0.0), mask.astype(float)
+
+
+def _pairwise_correlation(x, mx, y, my):
+    """
+    Pearson correlation of every column of x with every column of y over pairwise-complete rows.
+
+    Six matrix products give the pairwise counts, sums and cross products, so no
+    per-pair Python work is needed.
+    """
+    n = mx.T @ my
+    sx = x.T @ my
+    sy = mx.T @ y
+    sxx = (x * x).T @ my
+    syy = mx.T @ (y * y)
+    sxy = x.T @ y
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = n * sxy - sx * sy
+        var = (n * sxx - sx * sx) * (n * syy - sy * sy)
+        corr = cov / np.sqrt(var)
+    corr[(n < 2) | (var <= 0)] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+def numeric_association_matrix(df, columns=None, method='pearson', block_size=256):
+    """
+    Compute Pearson or Spearman correlations for all pairs of numeric columns.
+
+    Columns are processed in blocks, so only two blocks of column data are held in
+    memory at a time and each block pair is a handful of matrix products. Missing values
+    are excluded pairwise. For Spearman, each column is ranked once; with missing values
+    this approximates re-ranking on every pair's complete rows.
+
+    Parameters:
+    - df: pd.DataFrame or polars.DataFrame
+        The DataFrame containing the data.
+    - columns: list, optional
+        Numeric columns to correlate. Default is None (all numeric columns).
+    - method: str, optional
+        'pearson' or 'spearman'. Default is 'pearson'.
+    - block_size: int, optional
+        Number of columns loaded per block. Default is 256.
+
+    Returns:
+    - pd.DataFrame
+        Square correlation matrix indexed by column name.
+    """
+    if method not in ('pearson', 'spearman'):
+        raise ValueError(f"Unknown method '{method}'. Options: 'pearson', 'spearman'.")
+    if columns is None:
+        columns = get_backend(df).numeric_columns(df)
+    columns = list(columns)
+
+    result = np.full((len(columns), len(columns)), np.nan)
+    blocks = list(_blocks(columns, block_size))
+    for i, left in enumerate(blocks):
+        x, mx = _numeric_block(df, left, method)
+        row = i * block_size
+        for j in range(i, len(blocks)):
+            right = blocks[j]
+            y, my = (x, mx) if i == j else _numeric_block(df, right, method)
+            col = j * block_size
+            corr = _pairwise_correlation(x, mx, y, my)
+            result[row:row + len(left), col:col + len(right)] = corr
+            result[col:col + len(right), row:row + len(left)] = corr.T
+    return pd.DataFrame(result, index=columns, columns=columns)
+
+
+# Columns with more categories than this are skipped by Cramér's V and the correlation ratio
+MAX_CATEGORIES = 1000
+
+# Columns whose distinct values exceed this share of their non-missing rows are skipped too:
+# on identifier-like columns every category is (nearly) a single row and both measures tend to 1
+MAX_DISTINCT_SHARE = 0.5
+
+
+def _codes(series):
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    return codes, len(uniques)
+
+
+def _usable(codes, k, max_categories):
+    # Whether a factorised column has few enough categories for a meaningful association
+    return 2 <= k <= max_categories and k <= MAX_DISTINCT_SHARE * np.count_nonzero(codes >= 0)
+
+
+def _cramers_v_block(codes_a, k_a, others):
+    """
+    Cramér's V of one factorised column against each of a block of factorised columns.
+
+    Only the observed cells of each contingency table are counted, with one `np.unique`
+    over the block's pair codes, so memory depends on the rows and the block size, not
+    on the number of categories.
+    """
+    sizes = np.array([k_b for _, k_b in others], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(k_a * sizes)])
+    codes_b = np.column_stack([codes for codes, _ in others])
+    valid = (codes_a[:, None] >= 0) & (codes_b >= 0)
+    pairs = (offsets[:-1] + codes_a[:, None].astype(np.int64) * sizes + codes_b)[valid]
+    cells, counts = np.unique(pairs, return_counts=True)
+
+    values = []
+    bounds = np.searchsorted(cells, offsets)
+    for position, k_b in enumerate(sizes):
+        table_cells = cells[bounds[position]:bounds[position + 1]] - offsets[position]
+        values.append(_cramers_v(table_cells // k_b, table_cells % k_b,
+                                 counts[bounds[position]:bounds[position + 1]], k_a, k_b))
+    return values
+
+
+def categorical_association_matrix(df, columns=None, block_size=64, max_categories=MAX_CATEGORIES):
+    """
+    Compute Cramér's V for all pairs of categorical columns.
+
+    Each column is factorised once. The contingency tables of one column against a
+    block of other columns are counted sparsely, from the category pairs that occur.
+    Columns with more than `max_categories` categories, or with distinct values for more
+    than half of their rows (identifiers), get NaN: Cramér's V means nothing for them.
+
+    Parameters:
+    - df: pd.DataFrame or polars.DataFrame
+        The DataFrame containing the data.
+    - columns: list, optional
+        Categorical columns to compare. Default is None (all object/string columns).
+    - block_size: int, optional
+        Number of columns counted per batch. Default is 64.
+    - max_categories: int, optional
+        Columns with more categories are skipped. Default is 1000.
+
+    Returns:
+    - pd.DataFrame
+        Square matrix of Cramér's V values in [0, 1].
+    """
+    backend = get_backend(df)
+    if columns is None:
+        columns = backend.object_columns(df)
+    columns = list(columns)
+    frame = backend.to_pandas(df, columns)
+    factorised = [_codes(frame[column]) for column in columns]
+    usable = [j for j, (codes, k) in enumerate(factorised) if _usable(codes, k, max_categories)]
+
+    result = np.full((len(columns), len(columns)), np.nan)
+    for position, i in enumerate(usable):
+        codes_a, k_a = factorised[i]
+        for block in _blocks(usable[position:], block_size):
+            for j, value in zip(block, _cramers_v_block(codes_a, k_a, [factorised[j] for j in block])):
+                result[i, j] = result[j, i] = value
+    return pd.DataFrame(result, index=columns, columns=columns)
+
+
+def _cramers_v(rows, cols, counts, k_a, k_b):
+    # Cramér's V from the observed cells (row code, column code, count) of a contingency table
+    n = counts.sum()
+    row_totals = np.bincount(rows, weights=counts, minlength=k_a)
+    col_totals = np.bincount(cols, weights=counts, minlength=k_b)
+    r, c = np.count_nonzero(row_totals), np.count_nonzero(col_totals)
+    if n == 0 or min(r, c) < 2:
+        return np.nan
+    # Sum of (O - E)^2 / E over all cells is the sum of O^2 / E over the observed cells minus n
+    chi2 = (counts.astype(float) ** 2 / (row_totals[rows] * col_totals[cols] / n)).sum() - n
+    return float(np.sqrt(max(chi2, 0.0) / n / (min(r, c) - 1)))
+
+
+def correlation_ratios(df, categorical_columns, numeric_columns, block_size=256, max_categories=MAX_CATEGORIES):
+    """
+    Compute the correlation ratio (eta) between categorical and numeric columns.
+
+    For each categorical column and numeric column, the per-category counts, sums and
+    sums of squares are gathered with `np.bincount`, so the extra memory is a few arrays
+    of one column's length. Categorical columns with more than `max_categories`
+    categories, or with distinct values for more than half of their rows, get NaN.
+
+    Parameters:
+    - df: pd.DataFrame or polars.DataFrame
+        The DataFrame containing the data.
+    - categorical_columns: list
+        Columns defining the groups.
+    - numeric_columns: list
+        Columns whose variance is explained by the groups.
+    - block_size: int, optional
+        Number of numeric columns per batch. Default is 256.
+    - max_categories: int, optional
+        Categorical columns with more categories are skipped. Default is 1000.
+
+    Returns:
+    - pd.DataFrame
+        Eta values in [0, 1], indexed by categorical column with numeric columns as columns.
+    """
+    backend = get_backend(df)
+    categorical_columns, numeric_columns = list(categorical_columns), list(numeric_columns)
+    categories = backend.to_pandas(df, categorical_columns)
+    factorised = [_codes(categories[column]) for column in categorical_columns]
+
+    result = np.full((len(categorical_columns), len(numeric_columns)), np.nan)
+    for block_start in range(0, len(numeric_columns), block_size):
+        block = numeric_columns[block_start:block_start + block_size]
+        values = backend.to_pandas(df, block).astype(float).to_numpy()
+        for i, (codes, k) in enumerate(factorised):
+            if not _usable(codes, k, max_categories):
+                continue
+            for position in range(values.shape[1]):
+                x = values[:, position]
+                valid = (codes >= 0) & ~np.isnan(x)
+                groups, x = codes[valid], x[valid]
+                if not len(x):
+                    continue
+                # Centring first keeps the sums of squares from cancelling for large offsets
+                x = x - x.mean()
+                counts = np.bincount(groups, minlength=k)
+                sums = np.bincount(groups, weights=x, minlength=k)
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    between = np.where(counts > 0, sums ** 2 / counts, 0.0).sum()
+                total = (x * x).sum()
+                if total > 0:
+                    result[i, block_start + position] = np.sqrt(np.clip(between / total, 0.0, 1.0))
+    return pd.DataFrame(result, index=categorical_columns, columns=numeric_columns)
+
+
+def rank_features(df, target, columns=None, method='spearman', top_k=None, block_size=256):
+    """
+    Rank features by the strength of their association with a target column.
+
+    Numeric features are scored with |Pearson| or |Spearman| against a numeric target
+    and with the correlation ratio against a categorical one. Categorical features are
+    scored with the correlation ratio against a numeric target and Cramér's V against a
+    categorical one.
+
+    Parameters:
+    - df: pd.DataFrame or polars.DataFrame
+        The DataFrame containing the data.
+    - target: str
+        The target column.
+    - columns: list, optional
+        Features to rank. Default is None (every other column).
+    - method: str, optional
+        'pearson' or 'spearman' for numeric pairs. Default is 'spearman'.
+    - top_k: int, optional
+        Keep only the k strongest features. Default is None (keep all).
+    - block_size: int, optional
+        Number of columns loaded per block. Default is 256.
+
+    Returns:
+    - pd.Series
+        Association scores in [0, 1], sorted in descending order. Features with no
+        defined score are placed last.
+    """
+    backend = get_backend(df)
+    numeric = set(backend.numeric_columns(df))
+    if columns is None:
+        columns = [column for column in backend.numeric_columns(df) + backend.object_columns(df) if column != target]
+    numeric_features = [column for column in columns if column in numeric]
+    categorical_features = [column for column in columns if column not in numeric]
+
+    scores = {}
+    if target in numeric:
+        target_values, target_mask = _numeric_block(df, [target], method)
+        for block in _blocks(numeric_features, block_size):
+            x, mx = _numeric_block(df, block, method)
+            scores.update(zip(block, np.abs(_pairwise_correlation(x, mx, target_values, target_mask)[:, 0])))
+        if categorical_features:
+            scores.update(correlation_ratios(df, categorical_features, [target], block_size)[target])
+    else:
+        if numeric_features:
+            scores.update(correlation_ratios(df, [target], numeric_features, block_size).loc[target])
+        if categorical_features:
+            # Only the target's row of the Cramér's V matrix is needed
+            frame = backend.to_pandas(df, [target] + categorical_features)
+            target_codes, k = _codes(frame[target])
+            if _usable(target_codes, k, MAX_CATEGORIES):
+                for block in _blocks(categorical_features, block_size):
+                    others = [_codes(frame[column]) for column in block]
+                    values = _cramers_v_block(target_codes, k, others)
+                    scores.update((column, value) for column, value, (codes, k_b) in zip(block, values, others)
+                                  if _usable(codes, k_b, MAX_CATEGORIES))
+
+    ranked = pd.Series(scores, index=list(columns), dtype=float).sort_values(ascending=False, na_position='last')
+    return ranked if top_k is None else ranked.head(top_k)
@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import numpy as np
+import pandas as pd
+from eda_quest.kernels import column_moments, column_quantiles
+
+DESCRIBE_INDEX = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+
+class PandasBackend:
+    """
+    Statistics and missing-value primitives implemented with pandas.
+
+    Every backend returns pandas objects for statistics so that results are identical
+    regardless of the input type, and returns frames of the input type for transforms.
+    """
+    name = 'pandas'
+
+    def num_rows(self, df):
+        return len(df)
+
+    def columns(self, df):
+        return list(df.columns)
+
+    def numeric_columns(self, df):
+        return df.select_dtypes(include=['number']).columns.tolist()
+
+    def non_numeric_columns(self, df):
+        return df.select_dtypes(exclude=['number']).columns.tolist()
+
+    def object_columns(self, df):
+        return df.select_dtypes(include=['object']).columns.tolist()
+
+    def describe(self, df):
+        return df.describe()
+
+    def info(self, df):
+        return df.info()
+
+    def nunique(self, df):
+        return df.nunique()
+
+    def null_counts(self, df):
+        return df.isnull().sum()
+
+    def duplicated_count(self, df):
+        return df.duplicated().sum()
+
+    def null_mask(self, df):
+        return df.isnull()
+
+    def column_null_mask(self, df, column):
+        return df[column].isnull().to_numpy()
+
+    def to_pandas(self, df, columns=None):
+        return df if columns is None else df[columns]
+
+    def object_frame(self, df):
+        return df[self.object_columns(df)]
+
+    def take(self, df, positions):
+        return df.take(positions)
+
+    def row_chunks(self, df, chunksize):
+        for start in range(0, len(df), chunksize):
+            yield df.iloc[start:start + chunksize]
+
+    def copy(self, df):
+        return df.copy()
+
+    def imputation_values(self, df, threshold):
+        """
+        Compute the mean/median/mode fill value of every column that has missing values.
+        """
+        values = {}
+        null_counts = df.isnull().sum()
+        numeric = [column for column in self.numeric_columns(df) if null_counts[column] > 0]
+        if numeric:
+            # Means and medians of all numeric columns in one kernel call each
+            block = df[numeric].to_numpy(dtype=np.float64, na_value=np.nan)
+            means = column_moments(block)['mean']
+            medians = column_quantiles(block, [0.5])[0]
+            for column, mean, median in zip(numeric, means, medians):
+                values[column] = mean if abs(mean - median) <= threshold else median
+        for column in self.non_numeric_columns(df):
+            if null_counts[column] > 0:
+                # An all-null column has no mode; Polars gives None as well
+                mode = df[column].mode()
+                values[column] = mode[0] if len(mode) else None
+        return values
+
+    def fillna(self, df, value):
+        return df.fillna(value)
+
+    def drop_missing(self, df, row_threshold=None, column_threshold=None):
+        """
+        Drop rows and/or columns whose missing-value counts reach the given thresholds.
+
+        Both counts are taken on the input frame before anything is dropped. Without
+        thresholds, every row holding a missing value is dropped.
+        """
+        if row_threshold is None and column_threshold is None:
+            return df.dropna(axis=0)
+
+        missing_data = df.isnull()
+        df_processed = df
+        if row_threshold is not None:
+            row_missing_counts = missing_data.sum(axis=1)
+            df_processed = df_processed[row_missing_counts < row_threshold]
+        if column_threshold is not None:
+            column_missing_counts = missing_data.sum(axis=0)
+            columns_to_drop = column_missing_counts[column_missing_counts >= column_threshold].index
+            df_processed = df_processed.drop(columns=columns_to_drop)
+        return df_processed.copy()
+
+    def percentiles(self, data, q):
+        return np.percentile(data, q)
+
+
+class PolarsBackend:
+    """
+    Statistics and missing-value primitives implemented as Polars lazy queries.
+
+    All per-column aggregations of an operation are collected in a single query, so
+    Polars evaluates them in parallel across cores. Floating point NaN is treated as
+    missing, as it is in pandas.
+    """
+    name = 'polars'
+
+    def __init__(self):
+        import polars as pl
+        self.pl = pl
+
+    def _lazy(self, df):
+        pl = self.pl
+        lf = df.lazy()
+        schema = lf.collect_schema()
+        float_columns = [name for name, dtype in schema.items() if dtype.is_float()]
+        if float_columns:
+            lf = lf.with_columns(pl.col(float_columns).fill_nan(None))
+        return lf
+
+    def _restore(self, df, lf):
+        # Mirror the input type: lazy frames stay lazy, eager frames are collected
+        return lf if isinstance(df, self.pl.LazyFrame) else lf.collect()
+
+    def _schema(self, df):
+        return df.collect_schema() if isinstance(df, self.pl.LazyFrame) else df.schema
+
+    def num_rows(self, df):
+        return self._lazy(df).select(self.pl.len()).collect().item()
+
+    def columns(self, df):
+        return self._schema(df).names()
+
+    def numeric_columns(self, df):
+        return [name for name, dtype in self._schema(df).items() if dtype.is_numeric()]
+
+    def non_numeric_columns(self, df):
+        return [name for name, dtype in self._schema(df).items() if not dtype.is_numeric()]
+
+    def object_columns(self, df):
+        pl = self.pl
+        return [name for name, dtype in self._schema(df).items() if dtype in (pl.String, pl.Categorical)]
+
+    def describe(self, df):
+        pl = self.pl
+        columns = self.numeric_columns(df)
+        if not columns:
+            return self._describe_categorical(df)
+
+        exprs = []
+        for column in columns:
+            col = pl.col(column).cast(pl.Float64)
+            exprs.extend([
+                col.count().cast(pl.Float64).alias(f'{column}\x1fcount'),
+                col.mean().alias(f'{column}\x1fmean'),
+                col.std(ddof=1).alias(f'{column}\x1fstd'),
+                col.min().alias(f'{column}\x1fmin'),
+                col.quantile(0.25, interpolation='linear').alias(f'{column}\x1f25%'),
+                col.quantile(0.5, interpolation='linear').alias(f'{column}\x1f50%'),
+                col.quantile(0.75, interpolation='linear').alias(f'{column}\x1f75%'),
+                col.max().alias(f'{column}\x1fmax'),
+            ])
+        row = self._lazy(df).select(exprs).collect().row(0, named=True)
+        data = {column: [row[f'{column}\x1f{stat}'] for stat in DESCRIBE_INDEX] for column in columns}
+        return pd.DataFrame(data, index=DESCRIBE_INDEX, dtype=float)
+
+    def _describe_categorical(self, df):
+        pl = self.pl
+        lf = self._lazy(df).with_row_index('__row__')
+        names = self._schema(df).names()
+        queries = []
+        for column in names:
+            counts = (
+                lf.filter(pl.col(column).is_not_null())
+                .group_by(column)
+                .agg(pl.len().alias('freq'), pl.col('__row__').min().alias('first'))
+                .sort(['freq', 'first'], descending=[True, False])
+            )
+            queries.append(counts.select(
+                pl.col('freq').sum().alias('count'),
+                pl.len().alias('unique'),
+                pl.col(column).first().alias('top'),
+                pl.col('freq').first().alias('freq'),
+            ))
+        # Ties for the most frequent value go to the first occurrence, as in pandas
+        data = {column: list(frame.row(0)) for column, frame in zip(names, pl.collect_all(queries))}
+        return pd.DataFrame(data, index=['count', 'unique', 'top', 'freq'], dtype=object)
+
+    def info(self, df):
+        schema = self._schema(df)
+        print(f"<polars {type(df).__name__}>")
+        print(f"Data columns (total {len(schema)} columns):")
+        for name, dtype in schema.items():
+            print(f" {name}  {dtype}")
+        return None
+
+    def nunique(self, df):
+        pl = self.pl
+        names = self._schema(df).names()
+        row = self._lazy(df).select([pl.col(name).drop_nulls().n_unique() for name in names]).collect()
+        return pd.Series(row.row(0) if names else [], index=names, dtype='int64')
+
+    def null_counts(self, df):
+        pl = self.pl
+        names = self._schema(df).names()
+        row = self._lazy(df).select(pl.all().null_count()).collect()
+        return pd.Series(row.row(0) if names else [], index=names, dtype='int64')
+
+    def duplicated_count(self, df):
+        pl = self.pl
+        lf = self._lazy(df)
+        total = lf.select(pl.len()).collect().item()
+        return total - lf.unique(maintain_order=False).select(pl.len()).collect().item()
+
+    def null_mask(self, df):
+        pl = self.pl
+        mask = self._lazy(df).select(pl.all().is_null()).collect()
+        return pd.DataFrame({name: mask[name].to_numpy() for name in mask.columns})
+
+    def column_null_mask(self, df, column):
+        pl = self.pl
+        return self._lazy(df).select(pl.col(column).is_null()).collect().to_series().to_numpy()
+
+    def to_pandas(self, df, columns=None):
+        lf = self._lazy(df)
+        if columns is not None:
+            lf = lf.select(columns)
+        return lf.collect().to_pandas()
+
+    def take(self, df, positions):
+        # Gather the rows as a pandas DataFrame; lazy frames are filtered during the scan
+        pl = self.pl
+        if isinstance(df, pl.LazyFrame):
+            row = '\x1frow'
+            df = df.with_row_index(row).filter(pl.col(row).is_in(np.asarray(positions).tolist())).drop(row)
+            return self.to_pandas(df)
+        return self.to_pandas(df[positions])
+
+    def row_chunks(self, df, chunksize):
+        # Each slice is converted to pandas on its own, so only one chunk is held at a time
+        for start in range(0, self.num_rows(df), chunksize):
+            yield self.to_pandas(df.slice(start, chunksize))
+
+    def object_frame(self, df):
+        columns = self.object_columns(df)
+        frame = self._lazy(df).select(columns).collect()
+        return pd.DataFrame({name: pd.Series(frame[name].to_list(), dtype=object) for name in columns})
+
+    def copy(self, df):
+        return df.clone()
+
+    def imputation_values(self, df, threshold):
+        pl = self.pl
+        lf = self._lazy(df)
+        null_counts = self.null_counts(df)
+        numeric = [c for c in self.numeric_columns(df) if null_counts[c] > 0]
+        other = [c for c in self.non_numeric_columns(df) if null_counts[c] > 0]
+        if not numeric and not other:
+            return {}
+
+        # One query for every mean, median and mode; Polars runs them in parallel
+        exprs = []
+        for column in numeric:
+            exprs.append(pl.col(column).cast(pl.Float64).mean().alias(f'{column}\x1fmean'))
+            exprs.append(pl.col(column).cast(pl.Float64).median().alias(f'{column}\x1fmedian'))
+        for column in other:
+            exprs.append(pl.col(column).drop_nulls().mode().sort().first().alias(f'{column}\x1fmode'))
+        row = lf.select(exprs).collect().row(0, named=True)
+
+        values = {}
+        for column in numeric:
+            # All-null columns give None; use NaN as the pandas backend does
+            mean, median = (np.nan if row[f'{column}\x1f{name}'] is None else row[f'{column}\x1f{name}']
+                            for name in ('mean', 'median'))
+            values[column] = mean if abs(mean - median) <= threshold else median
+        for column in other:
+            values[column] = row[f'{column}\x1fmode']
+        return values
+
+    def fillna(self, df, value):
+        pl = self.pl
+        lf = self._lazy(df)
+        if isinstance(value, dict):
+            lf = lf.with_columns([pl.col(column).fill_null(fill) for column, fill in value.items()])
+        else:
+            lf = lf.with_columns(pl.all().fill_null(value))
+        return self._restore(df, lf)
+
+    def drop_missing(self, df, row_threshold=None, column_threshold=None):
+        pl = self.pl
+        lf = self._lazy(df)
+        if row_threshold is None and column_threshold is None:
+            return self._restore(df, lf.drop_nulls())
+
+        columns_to_drop = []
+        if column_threshold is not None:
+            null_counts = self.null_counts(df)
+            columns_to_drop = null_counts[null_counts >= column_threshold].index.tolist()
+        if row_threshold is not None:
+            lf = lf.filter(pl.sum_horizontal(pl.all().is_null()) < row_threshold)
+        return self._restore(df, lf.drop(columns_to_drop))
+
+    def grouped_stats(self, df, by, columns, quantiles):
+        """
+        Compute grouped statistics for every column in one group_by query.
+
+        Returns a dict of stat -> pandas frame (groups x columns), like the pandas path.
+        """
+        pl = self.pl
+        numeric = set(self.numeric_columns(df))
+        exprs = [pl.len().alias('\x1fsize')]
+        for column in columns:
+            col = pl.col(column)
+            exprs.append(col.count().alias(f'{column}\x1fcount'))
+            exprs.append(col.drop_nulls().n_unique().alias(f'{column}\x1fdistinct'))
+            if column in numeric:
+                col = col.cast(pl.Float64)
+                exprs.extend([
+                    col.mean().alias(f'{column}\x1fmean'),
+                    col.std(ddof=1).alias(f'{column}\x1fstd'),
+                    col.min().alias(f'{column}\x1fmin'),
+                    col.max().alias(f'{column}\x1fmax'),
+                ])
+                exprs.extend(col.quantile(q, interpolation='linear').alias(f'{column}\x1f{q}') for q in quantiles)
+        result = (
+            self._lazy(df).group_by(by).agg(exprs)
+            .sort(by, nulls_last=True)
+            .collect()
+            .to_pandas()
+        )
+        index = pd.MultiIndex.from_frame(result[by]) if len(by) > 1 else pd.Index(result[by[0]], name=by[0])
+
+        def frame(stat, names):
+            return pd.DataFrame({column: result[f'{column}\x1f{stat}'].to_numpy() for column in names}, index=index)
+
+        numeric_columns = [column for column in columns if column in numeric]
+        size = pd.Series(result['\x1fsize'].to_numpy(), index=index)
+        count = frame('count', columns)
+        stats = {
+            'count': count,
+            'nulls': count.rsub(size, axis=0),
+            'distinct': frame('distinct', columns),
+        }
+        for stat in ('mean', 'std', 'min', 'max') + tuple(quantiles):
+            label = stat if isinstance(stat, str) else f"{stat * 100:g}%"
+            stats[label] = frame(stat, numeric_columns)
+        return stats
+
+    def percentiles(self, data, q):
+        # Match np.percentile, which propagates missing values
+        if data.null_count() > 0 or (data.dtype.is_float() and data.is_nan().any()):
+            return np.full(len(q), np.nan)
+        return np.array([data.quantile(p / 100, interpolation='linear') for p in q])
+
+
+def get_backend(data):
+    """
+    Pick the backend for a DataFrame, LazyFrame or Series based on its type.
+
+    Parameters:
+    - data: pd.DataFrame, pd.Series, polars.DataFrame, polars.LazyFrame, polars.Series or array-like
+        The data an eda_quest function was called with.
+
+    Returns:
+    - PandasBackend or PolarsBackend
+        Polars inputs get the Polars backend; everything else is handled by pandas.
+    """
+    if type(data).__module__.startswith('polars'):
+        return PolarsBackend()
+    return PandasBackend()
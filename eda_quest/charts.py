@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import io
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+from eda_quest.kernels import fixed_edge_histograms
+from eda_quest.outlier import box_summaries
+from eda_quest.utils import plotting_modules
+
+# Bump when the drawing code changes so that stale charts are not served
+CHART_VERSION = 1
+
+# Default bound on the total size of cached charts: 256 MB
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+# Share of `max_bytes` a full cache is evicted down to, so that the directory is only
+# scanned once every tenth of the bound written rather than on every put
+EVICT_TO = 0.9
+
+CHART_KINDS = ('histogram', 'bar', 'box')
+
+
+def fingerprint(*parts):
+    """
+    Hash aggregates and plot parameters into a stable hex digest.
+
+    Parameters:
+    - *parts: np.ndarray, pd.Series, pd.DataFrame or JSON-serialisable values
+        Arrays are hashed by dtype, shape and bytes; pandas objects by their values and
+        labels; anything else by its canonical JSON form.
+
+    Returns:
+    - str
+        SHA-256 hex digest.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, (pd.Series, pd.DataFrame)):
+            digest.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+            if isinstance(part, pd.DataFrame):
+                digest.update(json.dumps(list(map(str, part.columns))).encode())
+        elif isinstance(part, np.ndarray):
+            part = np.ascontiguousarray(part)
+            digest.update(f'{part.dtype.str}{part.shape}'.encode())
+            digest.update(part.tobytes())
+        else:
+            digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+        # Separate the parts so that their boundaries are part of the hash
+        digest.update(b'\x1e')
+    return digest.hexdigest()
+
+
+class ChartCache:
+    """
+    Rendered charts stored as files in a directory, evicted least recently used first
+    once their total size exceeds `max_bytes`.
+
+    The total size is scanned once when the cache is opened and then tracked in memory;
+    the directory is only scanned again when a put takes it over the bound.
+
+    Attributes:
+    - directory: str
+        Where the chart files live.
+    - max_bytes: int
+        Bound on the total size of the cached files.
+    - hits, misses: int
+        Lookups served from and missed by the cache since it was opened.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_CACHE_BYTES):
+        self.directory = os.fspath(directory)
+        self.max_bytes = int(max_bytes)
+        self.hits = self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._size = self.size()
+
+    def _path(self, key, fmt):
+        return os.path.join(self.directory, f'{key}.{fmt}')
+
+    def get(self, key, fmt='png'):
+        """
+        Return the cached chart bytes for `key`, or None on a miss.
+        """
+        path = self._path(key, fmt)
+        try:
+            with open(path, 'rb') as chart_file:
+                data = chart_file.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        # Record the access for least-recently-used eviction
+        os.utime(path)
+        self.hits += 1
+        return data
+
+    def put(self, key, data, fmt='png'):
+        """
+        Store chart bytes under `key`. If that takes the cache over `max_bytes`, least
+        recently used charts are evicted until it is back under 90% of the bound.
+        """
+        path = self._path(key, fmt)
+        try:
+            replaced = os.stat(path).st_size
+        except FileNotFoundError:
+            replaced = 0
+        temporary = f'{path}.{os.getpid()}.tmp'
+        with open(temporary, 'wb') as chart_file:
+            chart_file.write(data)
+        os.replace(temporary, path)
+        self._size += len(data) - replaced
+        if self._size > self.max_bytes:
+            self.evict(int(self.max_bytes * EVICT_TO))
+
+    def size(self):
+        """
+        Return the total size of the cached charts in bytes.
+        """
+        return sum(entry.stat().st_size for entry in os.scandir(self.directory) if entry.is_file())
+
+    def evict(self, max_bytes=None):
+        """
+        Delete least recently used charts until the cache fits in `max_bytes`.
+
+        Parameters:
+        - max_bytes: int, optional
+            Size to evict down to. Default is None (the cache's `max_bytes`).
+
+        Returns:
+        - int
+            Number of charts deleted.
+        """
+        entries = [entry for entry in os.scandir(self.directory)
+                   if entry.is_file() and not entry.name.endswith('.tmp')]
+        stats = sorted(((entry.stat(), entry.path) for entry in entries), key=lambda item: item[0].st_mtime)
+        total = sum(stat.st_size for stat, _ in stats)
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        removed = 0
+        for stat, path in stats:
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= stat.st_size
+            removed += 1
+        self._size = total
+        return removed
+
+    def clear(self):
+        """
+        Delete every cached chart.
+        """
+        for entry in os.scandir(self.directory):
+            if entry.is_file():
+                os.remove(entry.path)
+        self._size = 0
+
+
+def _aggregates(dataframe, kind, columns, bins, max_categories, max_outliers):
+    # The small per-column inputs each chart is drawn from
+    if kind == 'histogram':
+        # All columns are binned in one kernel call; infinite values are left out
+        values = dataframe[list(columns)].to_numpy(dtype=float)
+        values = np.where(np.isfinite(values), values, np.nan)
+        counts, edges = fixed_edge_histograms(values, bins=bins)
+        return {column: {'counts': counts[i], 'edges': edges[i]} for i, column in enumerate(columns)}
+    if kind == 'bar':
+        return {
+            column: {'counts': dataframe[column].astype(object).value_counts(dropna=False).head(max_categories)}
+            for column in columns
+        }
+    summaries = box_summaries(dataframe, columns, max_outliers=max_outliers)
+    return {
+        column: {
+            'summary': summaries.loc[column, ['q1', 'median', 'q3', 'whislo', 'whishi']].to_numpy(dtype=float),
+            'fliers': np.sort(summaries.loc[column, 'fliers']),
+        }
+        for column in columns
+    }
+
+
+def _draw(plt, kind, column, aggregate, width, height, dpi, fmt):
+    fig, ax = plt.subplots(figsize=(width, height), dpi=dpi)
+    try:
+        if kind == 'histogram':
+            ax.stairs(aggregate['counts'], aggregate['edges'], fill=True)
+            ax.set_title(f'Histogram: {column}')
+            ax.set_ylabel('Count')
+        elif kind == 'bar':
+            counts = aggregate['counts']
+            ax.bar([str(label) for label in counts.index], counts.to_numpy())
+            ax.set_title(f'Bar Chart: {column}')
+            ax.set_ylabel('Count')
+            ax.tick_params(axis='x', labelrotation=45)
+        else:
+            q1, median, q3, whislo, whishi = aggregate['summary']
+            stats = {'label': column, 'med': median, 'q1': q1, 'q3': q3,
+                     'whislo': whislo, 'whishi': whishi, 'fliers': aggregate['fliers']}
+            if not np.isnan(median):
+                try:
+                    ax.bxp([stats], orientation='horizontal', showfliers=True)
+                except TypeError:
+                    # matplotlib < 3.10 has no `orientation`
+                    ax.bxp([stats], vert=False, showfliers=True)
+            ax.set_title(f'Box Plot of {column}')
+            ax.set_yticks([])
+        ax.set_xlabel(column)
+        fig.tight_layout()
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt)
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
+
+
+def render_charts(dataframe, kind, columns=None, cache=None, fmt='png', bins=30, max_categories=30,
+                  max_outliers=100, width=4, height=3, dpi=100):
+    """
+    Render one chart per column as image bytes, reusing cached charts whose inputs are unchanged.
+
+    The aggregates each chart is drawn from (histogram bin counts, value counts or the
+    box summary) are computed first; their fingerprint together with the plot
+    parameters is the cache key, so only charts whose aggregates changed are drawn.
+
+    Parameters:
+    - dataframe: pd.DataFrame
+        The data to chart.
+    - kind: str
+        'histogram', 'bar' or 'box'.
+    - columns: list, optional
+        Columns to chart. Default is None (numeric columns, or object columns for 'bar').
+    - cache: ChartCache or str, optional
+        Cache, or a directory to open one in. Default is None (always render).
+    - fmt: str, optional
+        Image format understood by `savefig`, e.g. 'png' or 'svg'. Default is 'png'.
+    - bins: int, optional
+        Histogram bins. Default is 30.
+    - max_categories: int, optional
+        Most frequent values shown per bar chart. Default is 30.
+    - max_outliers: int, optional
+        Outliers drawn per box plot. Default is 100.
+    - width, height: float, optional
+        Figure size in inches. Default is 4 x 3.
+    - dpi: int, optional
+        Resolution of raster formats. Default is 100.
+
+    Returns:
+    - dict
+        Image bytes keyed by column.
+    """
+    if kind not in CHART_KINDS:
+        raise ValueError(f"Unknown chart kind {kind!r}; expected one of {', '.join(CHART_KINDS)}.")
+    if isinstance(cache, (str, os.PathLike)):
+        cache = ChartCache(cache)
+    if columns is None:
+        include = ['object'] if kind == 'bar' else [np.number]
+        columns = dataframe.select_dtypes(include=include).columns.tolist()
+
+    aggregates = _aggregates(dataframe, kind, columns, bins, max_categories, max_outliers)
+    params = {'version': CHART_VERSION, 'kind': kind, 'fmt': fmt, 'width': width, 'height': height, 'dpi': dpi}
+
+    charts, plt = {}, None
+    for column in columns:
+        aggregate = aggregates[column]
+        key = fingerprint(params, str(column), *[aggregate[name] for name in sorted(aggregate)])
+        data = cache.get(key, fmt) if cache is not None else None
+        if data is None:
+            if plt is None:
+                # Load the plotting libraries only when something has to be drawn
+                plt, _ = plotting_modules()
+            data = _draw(plt, kind, column, aggregate, width, height, dpi, fmt)
+            if cache is not None:
+                cache.put(key, data, fmt)
+        charts[column] = data
+    return charts
@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import os
+import numpy as np
+import pandas as pd
+from eda_quest.kernels import column_quantiles
+from eda_quest.profile import SKETCH_GRID, merge_sketch_rows
+
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+
+# Default number of rows read per chunk
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def is_parquet_path(path):
+    """
+    Tell Parquet files and dataset directories apart from delimited text files.
+    """
+    path = os.fspath(path)
+    return os.path.isdir(path) or path.lower().endswith(PARQUET_EXTENSIONS)
+
+
+def iter_chunks(source, chunksize=DEFAULT_CHUNKSIZE, columns=None, dtype=None):
+    """
+    Read a CSV or Parquet file as a stream of DataFrame chunks.
+
+    Parameters:
+    - source: str or os.PathLike
+        CSV file, Parquet file or Parquet dataset directory.
+    - chunksize: int, optional
+        Maximum number of rows per chunk. Default is 100,000.
+    - columns: list, optional
+        Columns to read. Default is None (all columns).
+    - dtype: dict, optional
+        Column dtypes for CSV sources, so that every chunk gets the same types. Default is None.
+
+    Yields:
+    - pd.DataFrame
+        The next chunk of rows. Parquet files lacking some of the dataset's columns
+        yield them as missing values.
+    """
+    if is_parquet_path(source):
+        import pyarrow.parquet as pq
+        from eda_quest.parquet import arrow_schema, resolve_parquet_files
+
+        names = list(columns) if columns is not None else arrow_schema(source).names
+        for path in resolve_parquet_files(source):
+            parquet_file = pq.ParquetFile(path)
+            present = [name for name in names if name in parquet_file.schema_arrow.names]
+            for batch in parquet_file.iter_batches(batch_size=chunksize, columns=present):
+                yield batch.to_pandas().reindex(columns=names)
+    else:
+        yield from pd.read_csv(source, chunksize=chunksize, usecols=columns, dtype=dtype)
+
+
+class ChunkWriter:
+    """
+    Append DataFrame chunks to a CSV or Parquet file.
+
+    The file format follows the output extension. For Parquet, every chunk is cast to
+    the schema of the first one; columns that are entirely missing in the first chunk
+    have no type there and are written as strings. Use as a context manager so the file
+    is closed.
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        self.parquet = is_parquet_path(self.path)
+        self._writer = None
+        self._schema = None
+        self._promoted = []
+        self._started = False
+
+    def write(self, chunk):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if self._writer is None:
+                schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                # All-missing object columns infer as the null type, which later values cannot be cast to
+                self._promoted = [field.name for field in schema if pa.types.is_null(field.type)]
+                for name in self._promoted:
+                    schema = schema.set(schema.get_field_index(name), pa.field(name, pa.string()))
+                self._schema = schema
+                self._writer = pq.ParquetWriter(self.path, self._schema)
+            if self._promoted:
+                chunk = chunk.copy()
+                for name in self._promoted:
+                    values = chunk[name].astype(object)
+                    chunk[name] = values.where(values.isnull(), values.astype(str))
+            table = pa.Table.from_pandas(chunk, schema=self._schema, preserve_index=False)
+            self._writer.write_table(table)
+        else:
+            chunk.to_csv(self.path, mode='a' if self._started else 'w', header=not self._started, index=False)
+        self._started = True
+
+    def close(self, columns=None):
+        # Leave a valid, empty file behind when no rows were written
+        if not self._started and columns is not None:
+            self._started = True
+            self.write(pd.DataFrame(columns=columns))
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _promote(current, dtype):
+    if current is None:
+        return dtype
+    if current == dtype:
+        return current
+    if pd.api.types.is_numeric_dtype(current) and pd.api.types.is_numeric_dtype(dtype):
+        return np.result_type(current, dtype)
+    return np.dtype(object)
+
+
+def column_null_counts(source, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Count missing values per column of a file in one streaming pass.
+
+    Parquet sources are answered from the file footers when they carry null counts.
+
+    Parameters:
+    - source: str or os.PathLike
+        CSV file, Parquet file or Parquet dataset directory.
+    - chunksize: int, optional
+        Maximum number of rows per chunk. Default is 100,000.
+
+    Returns:
+    - tuple
+        (pd.Series of null counts per column, dict of column dtypes or None for Parquet).
+    """
+    if is_parquet_path(source):
+        from eda_quest.parquet import footer_statistics
+
+        stats = footer_statistics(source)
+        if stats['Has Null Count'].astype(bool).all():
+            return stats['Null Count'].astype('int64'), None
+
+    counts, dtypes = None, {}
+    for chunk in iter_chunks(source, chunksize=chunksize):
+        chunk_counts = chunk.isnull().sum()
+        counts = chunk_counts if counts is None else counts + chunk_counts
+        for column, dtype in chunk.dtypes.items():
+            dtypes[column] = _promote(dtypes.get(column), dtype)
+    if counts is None:
+        counts = pd.Series(dtype='int64')
+    return counts.astype('int64'), (None if is_parquet_path(source) else dtypes)
+
+
+def null_counts_chunked(chunks):
+    """
+    Count missing values per column over DataFrame chunks, holding one chunk's null mask at a time.
+
+    Parameters:
+    - chunks: iterable of pd.DataFrame
+        The input chunks, e.g. from a backend's `row_chunks`.
+
+    Returns:
+    - pd.Series
+        Null counts per column.
+    """
+    counts = None
+    for chunk in chunks:
+        chunk_counts = len(chunk) - chunk.count()
+        counts = chunk_counts if counts is None else counts + chunk_counts
+    return pd.Series(dtype='int64') if counts is None else counts.astype('int64')
+
+
+def imputation_values_chunked(chunks, numeric_columns, threshold):
+    """
+    Compute the fill values of `handle_missing_values` over DataFrame chunks in one pass.
+
+    As in memory, a numeric column gets its mean, or its median when the two are more
+    than `threshold` apart, and any other column its most frequent value (the smallest
+    one on ties). Means and value counts are exact; medians are merged from per-chunk
+    101-point quantile sketches. Memory is bounded by one chunk plus the value counts
+    of the non-numeric columns.
+
+    Parameters:
+    - chunks: iterable of pd.DataFrame
+        The input chunks, e.g. from a backend's `row_chunks`.
+    - numeric_columns: list
+        Columns imputed with their mean or median.
+    - threshold: float
+        Largest mean-median gap for which the mean is used.
+
+    Returns:
+    - dict
+        Fill value of every column holding missing values.
+    """
+    nulls, sums, counts, sketch, frequencies = None, None, None, None, {}
+    for chunk in chunks:
+        chunk_nulls = len(chunk) - chunk.count()
+        nulls = chunk_nulls if nulls is None else nulls + chunk_nulls
+        if numeric_columns:
+            block = chunk[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+            chunk_counts = (~np.isnan(block)).sum(axis=0)
+            chunk_sketch = column_quantiles(block, SKETCH_GRID).T
+            if sums is None:
+                sums, counts, sketch = np.nansum(block, axis=0), chunk_counts, chunk_sketch
+            else:
+                sketch = merge_sketch_rows(sketch, chunk_sketch, counts, chunk_counts)
+                sums, counts = sums + np.nansum(block, axis=0), counts + chunk_counts
+        for column in chunk.columns.difference(numeric_columns, sort=False):
+            chunk_frequencies = chunk[column].value_counts()
+            frequencies[column] = chunk_frequencies if column not in frequencies \
+                else frequencies[column].add(chunk_frequencies, fill_value=0)
+
+    values = {}
+    if nulls is None:
+        return values
+    for position, column in enumerate(numeric_columns):
+        if nulls[column] > 0:
+            mean = sums[position] / counts[position] if counts[position] else np.nan
+            median = np.interp(0.5, SKETCH_GRID, sketch[position])
+            values[column] = mean if abs(mean - median) <= threshold else median
+    for column, column_frequencies in frequencies.items():
+        if nulls[column] > 0:
+            # Most frequent value, the smallest one on ties as in `Series.mode`
+            top = column_frequencies[column_frequencies == column_frequencies.max()].index.tolist()
+            try:
+                top = sorted(top)
+            except TypeError:
+                pass
+            values[column] = top[0] if top else None
+    return values
+
+
+def write_chunks(chunks, output, columns, fill_value=None, row_threshold=None, drop_incomplete=False):
+    """
+    Filter and fill DataFrame chunks one at a time and append them to a file.
+
+    Parameters:
+    - chunks: iterable of pd.DataFrame
+        The input chunks.
+    - output: str or os.PathLike
+        Destination file; '.parquet' / '.pq' write Parquet, anything else CSV.
+    - columns: list
+        Columns to keep.
+    - fill_value: scalar or dict, optional
+        Passed to `fillna` after filtering. Default is None (no filling).
+    - row_threshold: int, optional
+        Rows with at least this many missing values are dropped. Default is None.
+    - drop_incomplete: bool, optional
+        Whether to drop every row holding a missing value. Default is False.
+
+    Returns:
+    - tuple
+        (rows written, rows dropped).
+    """
+    rows_written = rows_dropped = 0
+    writer = ChunkWriter(output)
+    try:
+        for chunk in chunks:
+            if drop_incomplete:
+                kept = chunk.dropna(axis=0)
+            elif row_threshold is not None:
+                kept = chunk[chunk.isnull().sum(axis=1) < row_threshold]
+            else:
+                kept = chunk
+            # Columns absent from a chunk (e.g. a Parquet file lacking them) are missing values
+            kept = kept.reindex(columns=columns)
+            if fill_value is not None:
+                kept = kept.fillna(fill_value)
+            rows_dropped += len(chunk) - len(kept)
+            rows_written += len(kept)
+            if len(kept):
+                writer.write(kept)
+    finally:
+        writer.close(columns=columns)
+    return rows_written, rows_dropped
+
+
+def drop_missing_chunked(source, output, row_threshold=None, column_threshold=None, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Drop rows and columns with too many missing values from a file, out of core.
+
+    A first pass counts nulls per column to decide which columns to drop (and fixes CSV
+    dtypes across chunks). A second pass filters rows chunk by chunk and writes them
+    straight to `output`, so memory is bounded by the chunk size. Thresholds behave as
+    in `handle_missing_values`: both counts refer to the input before anything is dropped,
+    and without thresholds every row holding a missing value is dropped.
+
+    Parameters:
+    - source: str or os.PathLike
+        CSV file, Parquet file or Parquet dataset directory.
+    - output: str or os.PathLike
+        Destination file; '.parquet' / '.pq' write Parquet, anything else CSV.
+    - row_threshold: int, optional
+        Rows with at least this many missing values are dropped. Default is None.
+    - column_threshold: int, optional
+        Columns with at least this many missing values are dropped. Default is None.
+    - chunksize: int, optional
+        Maximum number of rows held in memory at a time. Default is 100,000.
+
+    Returns:
+    - dict
+        'Output' path, 'Rows Written', 'Rows Dropped' and the list of 'Columns Dropped'.
+    """
+    null_counts, dtypes = column_null_counts(source, chunksize=chunksize)
+    columns_to_drop = []
+    if column_threshold is not None:
+        columns_to_drop = null_counts[null_counts >= column_threshold].index.tolist()
+    kept_columns = [column for column in null_counts.index if column not in columns_to_drop]
+
+    # Row counts span every column, so all of them are read unless rows are kept regardless
+    read_columns = None if row_threshold is not None or column_threshold is None else kept_columns
+
+    chunks = iter_chunks(source, chunksize=chunksize, columns=read_columns, dtype=dtypes)
+    rows_written, rows_dropped = write_chunks(
+        chunks, output, kept_columns, row_threshold=row_threshold,
+        drop_incomplete=row_threshold is None and column_threshold is None,
+    )
+
+    return {
+        'Output': os.fspath(output),
+        'Rows Written': rows_written,
+        'Rows Dropped': rows_dropped,
+        'Columns Dropped': columns_to_drop,
+    }
@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import os
+import json
+import numpy as np
+import pandas as pd
+from eda_quest.backends import get_backend
+from eda_quest.chunks import DEFAULT_CHUNKSIZE, ChunkWriter, iter_chunks
+from eda_quest.profile import SKETCH_GRID, merge_quantile_sketches
+
+# Version of the serialised pipeline layout written by `CleaningPipeline.save`
+PIPELINE_VERSION = 1
+
+# Integer types tried, smallest first, when downcasting whole-number columns
+INTEGER_TYPES = ['int8', 'int16', 'int32', 'int64']
+
+
+class Impute:
+    """
+    Fill missing values, as `handle_missing_values` does.
+
+    Parameters:
+    - strategy: str, optional
+        'auto' (mean, or median when they differ by more than `threshold`), 'mean', 'median'
+        or 'constant'. Non-numeric columns get their mode unless 'constant'. Default is 'auto'.
+    - threshold: float, optional
+        Mean/median difference above which 'auto' uses the median. Default is 5.
+    - value: any, optional
+        Fill value for 'constant', where it is required. Default is None.
+    - columns: list, optional
+        Columns to fill. Default is None (all columns).
+    """
+    name = 'impute'
+
+    def __init__(self, strategy='auto', threshold=5, value=None, columns=None):
+        if strategy not in ('auto', 'mean', 'median', 'constant'):
+            raise ValueError(f"Unknown imputation strategy {strategy!r}.")
+        if strategy == 'constant' and value is None:
+            raise ValueError("Imputation strategy 'constant' needs a fill value.")
+        self.strategy = strategy
+        self.threshold = threshold
+        self.value = value
+        self.columns = columns
+
+    def config(self):
+        return {'strategy': self.strategy, 'threshold': self.threshold, 'value': self.value, 'columns': self.columns}
+
+    def finalize(self, stats, state, operations):
+        for column in self.columns or list(stats):
+            column_stats = stats[column]
+            if not column_stats['nulls'] or (not column_stats['count'] and self.strategy != 'constant'):
+                continue
+            if self.strategy == 'constant':
+                value = self.value
+            elif column_stats['numeric']:
+                mean, median = column_stats['mean'], column_stats['median']
+                if self.strategy == 'auto':
+                    value = mean if abs(mean - median) <= self.threshold else median
+                else:
+                    value = mean if self.strategy == 'mean' else median
+            else:
+                value = column_stats['mode']
+            operations[column]['fill'] = value
+            column_state = state[column]
+            column_state['nulls'] = False
+            if column_stats['numeric'] and isinstance(value, (int, float)):
+                column_state['min'] = min(column_state['min'], value)
+                column_state['max'] = max(column_state['max'], value)
+                column_state['integral'] = column_state['integral'] and float(value).is_integer()
+
+
+class CapOutliers:
+    """
+    Clip numeric columns to their IQR fences.
+
+    Parameters:
+    - whis: float, optional
+        Fences lie `whis` IQRs beyond the quartiles. Default is 1.5.
+    - columns: list, optional
+        Columns to cap. Default is None (all numeric columns).
+    """
+    name = 'cap_outliers'
+
+    def __init__(self, whis=1.5, columns=None):
+        self.whis = whis
+        self.columns = columns
+
+    def config(self):
+        return {'whis': self.whis, 'columns': self.columns}
+
+    def finalize(self, stats, state, operations):
+        for column in self.columns or [name for name, column_stats in stats.items() if column_stats['numeric']]:
+            column_stats = stats[column]
+            if not column_stats['numeric'] or not column_stats['count']:
+                continue
+            iqr = column_stats['q3'] - column_stats['q1']
+            lower, upper = column_stats['q1'] - self.whis * iqr, column_stats['q3'] + self.whis * iqr
+            operations[column]['clip'] = [lower, upper]
+            column_state = state[column]
+            # Clipped values take the fence values, which may not be whole numbers
+            if column_state['min'] < lower:
+                column_state['min'] = lower
+                column_state['integral'] = column_state['integral'] and float(lower).is_integer()
+            if column_state['max'] > upper:
+                column_state['max'] = upper
+                column_state['integral'] = column_state['integral'] and float(upper).is_integer()
+
+
+class Downcast:
+    """
+    Store columns in the smallest type that holds their cleaned values.
+
+    Whole-number columns without missing values become the smallest integer type that
+    fits their range; scoring data that is out of that range or not whole raises a
+    ValueError at `transform` rather than wrapping around. Other float columns become float32 when `float32` is set; and
+    non-numeric columns with at most `max_categories` distinct values become categorical.
+
+    Parameters:
+    - float32: bool, optional
+        Whether to store remaining float columns as float32. Default is False.
+    - max_categories: int, optional
+        Distinct-value limit for categorical columns. Default is None (no conversion).
+    - columns: list, optional
+        Columns to downcast. Default is None (all columns).
+    """
+    name = 'downcast'
+
+    def __init__(self, float32=False, max_categories=None, columns=None):
+        self.float32 = float32
+        self.max_categories = max_categories
+        self.columns = columns
+
+    def config(self):
+        return {'float32': self.float32, 'max_categories': self.max_categories, 'columns': self.columns}
+
+    def finalize(self, stats, state, operations):
+        for column in self.columns or list(stats):
+            column_stats, column_state = stats[column], state[column]
+            if not column_stats['count'] or column_stats['boolean']:
+                continue
+            if column_stats['numeric']:
+                if column_state['integral'] and not column_state['nulls']:
+                    for dtype in INTEGER_TYPES:
+                        info = np.iinfo(dtype)
+                        if info.min <= column_state['min'] and column_state['max'] <= info.max:
+                            operations[column]['dtype'] = dtype
+                            break
+                elif self.float32:
+                    operations[column]['dtype'] = 'float32'
+            elif self.max_categories is not None and len(column_stats['counts']) <= self.max_categories:
+                operations[column]['dtype'] = 'category'
+                operations[column]['categories'] = sorted(column_stats['counts'], key=str)
+
+
+STEPS = {step.name: step for step in (Impute, CapOutliers, Downcast)}
+
+
+def _to_builtin(value):
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _column_key(column):
+    # Column labels are stored as JSON values, not object keys, so that their type survives a round trip
+    column = _to_builtin(column)
+    if column is not None and not isinstance(column, (str, int, float, bool)):
+        raise ValueError(f"Cannot serialise the pipeline: column label {column!r} is not a string or a number.")
+    return column
+
+
+def _to_integer(values, column, dtype):
+    """
+    Cast a column to the fitted integer type, refusing values the type cannot hold.
+    """
+    present = values.dropna().to_numpy(dtype=float)
+    info = np.iinfo(dtype)
+    if len(present) and (present.min() < info.min or present.max() > info.max or np.any(np.mod(present, 1))):
+        raise ValueError(f"Column {column!r} holds values that do not fit the fitted type {dtype} "
+                         f"(range {present.min():g} to {present.max():g}); refit the pipeline on this data.")
+    # Unseen missing values at scoring time: use the nullable integer type
+    return values.astype(dtype.capitalize() if len(present) < len(values) else dtype)
+
+
+class CleaningPipeline:
+    """
+    A declarative chain of cleaning steps fitted in one pass and applied in another.
+
+    `fit` reads the data once, chunk by chunk, collecting the statistics every step
+    needs (counts, means, min/max, quantile sketches and value counts). The steps then
+    resolve, in order, into one operation list per column: a fill value, clip bounds and
+    a target dtype. `transform` applies all of them to each chunk in a single fused
+    step, so no intermediate copy of the whole frame is made. Fitted pipelines can be
+    saved as JSON and loaded at scoring time.
+
+    Statistics are taken on the input data, so e.g. the outlier fences ignore imputed
+    values; medians and quartiles are exact for data fitted in one chunk and merged
+    from quantile sketches otherwise.
+
+    Parameters:
+    - steps: list
+        `Impute`, `CapOutliers` and `Downcast` instances, applied in order.
+
+    Attributes:
+    - operations: dict
+        Fitted operations keyed by column, empty until `fit` is called.
+    """
+
+    def __init__(self, steps):
+        self.steps = list(steps)
+        self.operations = {}
+
+    @staticmethod
+    def _chunks(data, chunksize):
+        if isinstance(data, (str, os.PathLike)):
+            return iter_chunks(data, chunksize=chunksize)
+        if hasattr(data, 'columns'):
+            return get_backend(data).row_chunks(data, chunksize)
+        return iter(data)
+
+    def fit(self, data, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Collect the statistics of every step in one pass and resolve the operations.
+
+        Parameters:
+        - data: pd.DataFrame, polars.DataFrame, str, os.PathLike or iterable of pd.DataFrame
+            The data, a CSV / Parquet path or a stream of chunks.
+        - chunksize: int, optional
+            Rows per chunk for frames and paths. Default is 100,000.
+
+        Returns:
+        - CleaningPipeline
+            The pipeline itself.
+        """
+        partials = {}
+        for chunk in self._chunks(data, chunksize):
+            for column in chunk.columns:
+                _accumulate(partials.setdefault(column, _empty_partial()), chunk[column])
+        stats = {column: _finish(partial) for column, partial in partials.items()}
+
+        state = {
+            column: {'min': column_stats.get('min'), 'max': column_stats.get('max'),
+                     'integral': column_stats.get('integral', False), 'nulls': column_stats['nulls'] > 0}
+            for column, column_stats in stats.items()
+        }
+        self.operations = {column: {} for column in stats}
+        for step in self.steps:
+            step.finalize(stats, state, self.operations)
+        return self
+
+    def transform_chunk(self, chunk):
+        """
+        Apply every fitted operation to one pandas chunk.
+        """
+        columns = {}
+        for column in chunk.columns:
+            values = chunk[column]
+            operations = self.operations.get(column, {})
+            if 'fill' in operations:
+                values = values.fillna(operations['fill'])
+            if 'clip' in operations:
+                values = values.clip(*operations['clip'])
+            if operations.get('dtype') == 'category':
+                values = values.astype(pd.CategoricalDtype(operations['categories']))
+            elif operations.get('dtype') in INTEGER_TYPES:
+                values = _to_integer(values, column, operations['dtype'])
+            elif 'dtype' in operations:
+                values = values.astype(operations['dtype'])
+            columns[column] = values
+        return pd.DataFrame(columns, index=chunk.index)
+
+    def transform(self, data, output=None, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Clean the data chunk by chunk in one fused pass.
+
+        Parameters:
+        - data: pd.DataFrame, polars.DataFrame, str, os.PathLike or iterable of pd.DataFrame
+            The data to clean.
+        - output: str or os.PathLike, optional
+            CSV or Parquet file to write the cleaned chunks to. Default is None (return a DataFrame).
+        - chunksize: int, optional
+            Rows per chunk for frames and paths. Default is 100,000.
+
+        Returns:
+        - pd.DataFrame or dict
+            The cleaned DataFrame, or 'Output' and 'Rows Written' when writing to a file.
+        """
+        if not self.operations:
+            raise ValueError("The pipeline has not been fitted; call fit first.")
+        chunks = (self.transform_chunk(chunk) for chunk in self._chunks(data, chunksize))
+        if output is None:
+            cleaned = list(chunks)
+            return pd.concat(cleaned) if cleaned else pd.DataFrame(columns=list(self.operations))
+
+        rows_written = 0
+        with ChunkWriter(output) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+                rows_written += len(chunk)
+        return {'Output': os.fspath(output), 'Rows Written': rows_written}
+
+    def fit_transform(self, data, output=None, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Fit on the data, then transform it. Streams of chunks cannot be read twice; pass a frame or a path.
+        """
+        return self.fit(data, chunksize=chunksize).transform(data, output=output, chunksize=chunksize)
+
+    def to_dict(self):
+        """
+        Return the steps and fitted operations as a JSON-compatible dict.
+
+        Operations are stored as [column, operations] pairs so that numeric column labels
+        keep their type; labels other than strings and numbers raise a ValueError.
+        """
+        return {
+            'version': PIPELINE_VERSION,
+            'steps': [{'name': step.name, **step.config()} for step in self.steps],
+            'operations': [
+                [_column_key(column),
+                 {key: ([_to_builtin(item) for item in value] if isinstance(value, list) else _to_builtin(value))
+                  for key, value in operations.items()}]
+                for column, operations in self.operations.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, spec):
+        """
+        Rebuild a pipeline from `to_dict` output.
+        """
+        if spec.get('version') != PIPELINE_VERSION:
+            raise ValueError(f"Unsupported pipeline version {spec.get('version')!r}; expected {PIPELINE_VERSION}.")
+        steps = []
+        for step in spec['steps']:
+            config = dict(step)
+            steps.append(STEPS[config.pop('name')](**config))
+        pipeline = cls(steps)
+        pipeline.operations = {column: operations for column, operations in spec['operations']}
+        return pipeline
+
+    def save(self, path):
+        """
+        Write the fitted pipeline to a JSON file.
+        """
+        with open(path, 'w') as pipeline_file:
+            json.dump(self.to_dict(), pipeline_file)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a pipeline written by `save`.
+        """
+        with open(path) as pipeline_file:
+            return cls.from_dict(json.load(pipeline_file))
+
+
+def _empty_partial():
+    return {'numeric': True, 'boolean': False, 'count': 0, 'nulls': 0, 'sum': 0.0, 'min': np.inf, 'max': -np.inf,
+            'integral': True, 'sketches': [], 'sketch_counts': [], 'counts': {}}
+
+
+def _accumulate(partial, values):
+    # Mergeable statistics of one chunk of one column
+    present = values.dropna()
+    partial['count'] += len(present)
+    partial['nulls'] += len(values) - len(present)
+    if pd.api.types.is_bool_dtype(values):
+        partial['boolean'] = True
+    if partial['numeric'] and pd.api.types.is_numeric_dtype(values) and not partial['boolean']:
+        if len(present):
+            numbers = present.to_numpy(dtype=float)
+            partial['sum'] += numbers.sum()
+            partial['min'] = min(partial['min'], numbers.min())
+            partial['max'] = max(partial['max'], numbers.max())
+            partial['integral'] = partial['integral'] and bool(np.all(np.mod(numbers, 1) == 0))
+            partial['sketches'].append(np.quantile(numbers, SKETCH_GRID))
+            partial['sketch_counts'].append(len(numbers))
+    else:
+        # Value counts are kept for non-numeric columns only, for their mode and categories
+        partial['numeric'] = False
+        for value, count in present.value_counts().items():
+            partial['counts'][value] = partial['counts'].get(value, 0) + int(count)
+
+
+def _finish(partial):
+    stats = {'numeric': partial['numeric'], 'boolean': partial['boolean'], 'count': partial['count'],
+             'nulls': partial['nulls'], 'counts': partial['counts']}
+    if partial['numeric'] and partial['count']:
+        q1, median, q3 = merge_quantile_sketches(partial['sketches'], partial['sketch_counts'], probs=[0.25, 0.5, 0.75])
+        stats.update({
+            'mean': partial['sum'] / partial['count'], 'median': float(median), 'q1': float(q1), 'q3': float(q3),
+            'min': float(partial['min']), 'max': float(partial['max']), 'integral': partial['integral'],
+        })
+    if partial['counts']:
+        # Most frequent value, ties broken like `Series.mode`, which sorts the values
+        stats['mode'] = min(partial['counts'].items(), key=lambda item: (-item[1], str(item[0])))[0]
+    return stats
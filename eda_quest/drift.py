@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import numpy as np
+import pandas as pd
+from eda_quest.profile import SKETCH_GRID, load_profile
+
+# Floor for bin proportions so that PSI stays finite for empty bins
+PSI_EPSILON = 1e-4
+
+
+def _sketch(entry):
+    if entry.get('sketch') is None:
+        return None
+    values = np.array([np.nan if value is None else value for value in entry['sketch']], dtype=float)
+    return None if np.isnan(values).all() else values
+
+
+def _cdf(sketch, points):
+    # Right-continuous step CDF: the grid probability of the last sketch point <= each point.
+    # Interpolating instead would spread the mass of tied points (discrete columns) over a range.
+    count = np.searchsorted(sketch, points, side='right')
+    return np.where(count > 0, SKETCH_GRID[np.maximum(count - 1, 0)], 0.0)
+
+
+def _psi(expected, actual):
+    expected = np.clip(np.asarray(expected, dtype=float), PSI_EPSILON, None)
+    actual = np.clip(np.asarray(actual, dtype=float), PSI_EPSILON, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def numeric_drift(baseline, current, bins=10):
+    """
+    Compare two numeric column profiles through their quantile sketches.
+
+    Parameters:
+    - baseline: dict
+        Column entry of the baseline profile.
+    - current: dict
+        Column entry of the current profile.
+    - bins: int, optional
+        Number of baseline-quantile bins used for PSI. Default is 10.
+
+    Returns:
+    - dict
+        'PSI', 'KS' (largest CDF gap) and 'Wasserstein' (mean absolute quantile gap).
+    """
+    base, cur = _sketch(baseline), _sketch(current)
+    if base is None or cur is None:
+        return {'PSI': np.nan, 'KS': np.nan, 'Wasserstein': np.nan}
+
+    # PSI over bins whose edges are the baseline quantiles
+    edges = np.unique(np.interp(np.linspace(0, 1, bins + 1)[1:-1], SKETCH_GRID, base))
+    expected = np.diff(np.concatenate([[0.0], _cdf(base, edges), [1.0]]))
+    actual = np.diff(np.concatenate([[0.0], _cdf(cur, edges), [1.0]]))
+
+    points = np.union1d(base, cur)
+    ks = float(np.max(np.abs(_cdf(base, points) - _cdf(cur, points))))
+    # Area between the quantile functions, by the trapezoidal rule
+    gap = np.abs(base - cur)
+    wasserstein = float(np.sum((gap[1:] + gap[:-1]) / 2 * np.diff(SKETCH_GRID)))
+    return {'PSI': _psi(expected, actual), 'KS': ks, 'Wasserstein': wasserstein}
+
+
+def categorical_drift(baseline, current):
+    """
+    Compare two categorical column profiles through their category frequencies.
+
+    A category is compared on its own when both profiles know its frequency, i.e. it is
+    among their top values or the profile kept every value. The rest are pooled into
+    one 'other' bucket.
+
+    Parameters:
+    - baseline: dict
+        Column entry of the baseline profile.
+    - current: dict
+        Column entry of the current profile.
+
+    Returns:
+    - dict
+        'PSI', 'Category Shift' (total variation distance) and 'Largest Shift', the
+        category whose share moved most.
+    """
+    base_total, cur_total = baseline['count'], current['count']
+    if not base_total or not cur_total:
+        return {'PSI': np.nan, 'Category Shift': np.nan, 'Largest Shift': None}
+
+    def known(entry, category):
+        return category in entry['top'] or len(entry['top']) == entry['distinct']
+
+    categories = sorted(category for category in set(baseline['top']) | set(current['top'])
+                        if known(baseline, category) and known(current, category))
+    expected = [baseline['top'].get(category, 0) / base_total for category in categories]
+    actual = [current['top'].get(category, 0) / cur_total for category in categories]
+    expected.append(1.0 - sum(expected))
+    actual.append(1.0 - sum(actual))
+
+    shifts = np.abs(np.array(actual) - np.array(expected))
+    largest = categories[int(np.argmax(shifts[:-1]))] if categories else None
+    return {'PSI': _psi(expected, actual), 'Category Shift': float(shifts.sum() / 2), 'Largest Shift': largest}
+
+
+def compare_profiles(baseline, current, bins=10):
+    """
+    Build a drift report between two persisted profiles.
+
+    Only the profiles are used, so neither raw dataset is rescanned.
+
+    Parameters:
+    - baseline: dict or str
+        Baseline profile from `profile_dataframe`, or a path to one saved with `save_profile`.
+    - current: dict or str
+        Profile to compare against the baseline, or a path to one.
+    - bins: int, optional
+        Number of baseline-quantile bins used for numeric PSI. Default is 10.
+
+    Returns:
+    - pd.DataFrame
+        One row per column with 'Status' ('both', 'added' or 'removed'), 'Type', null
+        rates and their delta, 'PSI', 'KS', 'Wasserstein', 'Category Shift' and
+        'Largest Shift'. Sorted by PSI in descending order.
+    """
+    if isinstance(baseline, str):
+        baseline = load_profile(baseline)
+    if isinstance(current, str):
+        current = load_profile(current)
+
+    base_columns, cur_columns = baseline['columns'], current['columns']
+    names = list(base_columns) + [name for name in cur_columns if name not in base_columns]
+
+    rows = {}
+    for name in names:
+        base, cur = base_columns.get(name), cur_columns.get(name)
+        row = {
+            'Status': 'both' if base and cur else ('removed' if base else 'added'),
+            'Type': (base or cur)['type'],
+            'Null Rate Baseline': base['nulls'] / baseline['num_rows'] if base and baseline['num_rows'] else np.nan,
+            'Null Rate Current': cur['nulls'] / current['num_rows'] if cur and current['num_rows'] else np.nan,
+        }
+        row['Null Rate Delta'] = row['Null Rate Current'] - row['Null Rate Baseline']
+        if base and cur and base['type'] == cur['type'] == 'numeric':
+            row.update(numeric_drift(base, cur, bins=bins))
+        elif base and cur and base['type'] == cur['type'] == 'categorical':
+            row.update(categorical_drift(base, cur))
+        rows[name] = row
+
+    columns = ['Status', 'Type', 'Null Rate Baseline', 'Null Rate Current', 'Null Rate Delta',
+               'PSI', 'KS', 'Wasserstein', 'Category Shift', 'Largest Shift']
+    report = pd.DataFrame.from_dict(rows, orient='index').reindex(columns=columns)
+    return report.sort_values(by='PSI', ascending=False, na_position='last')
@@ -1,9 +1,17 @@
 # -*- coding: utf-8 -*-
 
 # Import the necessary libraries
-import re
-from IPython.display import display
-from eda_quest.utils import styled_dataframe
+import os
+import pandas as pd
+from eda_quest.backends import get_backend
+from eda_quest.chunks import (DEFAULT_CHUNKSIZE, drop_missing_chunked, imputation_values_chunked, iter_chunks,
+                              null_counts_chunked, write_chunks)
+from eda_quest.memory import plan_operation
+from eda_quest.missingness import MissingnessIndex
+from eda_quest.profile import grouped_summary
+from eda_quest.quality import feature_quality_report
+from eda_quest.sampling import draw_sample, resolve_sample
+from eda_quest.utils import styled_dataframe, is_arrow_source, display, plotting_modules
 
 def display_dataframe(df, title="DataFrame Preview", head_rows=5, sample_rows=5, tail_rows=5):
     """
@@ -38,36 +46,80 @@ def display_dataframe(df, title="DataFrame Preview", head_rows=5, sample_rows=5,
     # Display the tail of the DataFrame
     styled_dataframe(df.tail(tail_rows))
 
-def dataframe_summary(df):
+def dataframe_summary(df, plot_histograms=True, by=None, fast=False, sample=None, memory_budget=None):
     """
     Perform basic exploratory data analysis (EDA) on a Pandas DataFrame.
 
+    Parquet files, Parquet dataset directories and pyarrow Tables are also accepted.
+    For those, row counts, null counts and min/max are read from the file footers and
+    only the columns needing quantiles or distinct counts are decoded.
+
     Parameters:
-    df (DataFrame): The DataFrame to analyze.
+    df (DataFrame, str, list or pyarrow.Table): The DataFrame or Parquet source to analyze.
+        Polars DataFrames and LazyFrames are computed with multithreaded Polars queries.
+    plot_histograms (bool, optional): Whether to draw a histogram per numeric column. Set to False
+        to skip loading matplotlib, e.g. in batch jobs. Default is True.
+    by (str or list, optional): Column(s) to segment by. When given, every group is profiled in a
+        single groupby pass (see `eda_quest.profile.grouped_summary`), and CSV/Parquet paths or
+        iterables of chunks are streamed. Default is None.
+    fast (bool, optional): Compute everything on a cached random sample of 100,000 rows instead of
+        scanning all rows (see `eda_quest.sampling.draw_sample`). Parquet sources, already answered
+        from their footers, are not sampled. Default is False.
+    sample (int or DataFrameSample, optional): Sample size to use instead of the default, or a sample
+        drawn beforehand, e.g. a stratified one. Default is None.
+    memory_budget (int or str, optional): Bytes (or e.g. '2GB') the summary may allocate. When the
+        estimate from the frame's dtypes and shape exceeds it, the summary runs on as many sampled
+        rows as fit (see `eda_quest.memory.plan_operation`). Default is None (the budget set with
+        `set_memory_budget`, unlimited unless set).
 
     Returns:
     dict: A dictionary containing various EDA statistics and information.
+        With `by`, a tidy DataFrame indexed by group and column instead.
+        When sampling, 'Sample Size' and 'Estimates' are added: means and null rates with
+        95% confidence intervals for the full frame. With a budget, 'Execution Plan' is added.
     """
+    if by is not None:
+        if isinstance(df, (str, os.PathLike)):
+            df = iter_chunks(df)
+        return grouped_summary(df, by)
+
+    if is_arrow_source(df):
+        from eda_quest.parquet import parquet_summary
+        return parquet_summary(df)
+
+    # Work on a cached sample in fast mode, or when the memory budget calls for it
+    drawn = resolve_sample(df, fast=fast, sample=sample)
+    plan = plan_operation('dataframe_summary', df, memory_budget) if drawn is None else None
+    if plan is not None and plan.strategy == 'sampled':
+        drawn = draw_sample(df, size=plan.rows)
+    if drawn is not None:
+        df = drawn.frame
+
+    backend = get_backend(df)
+
     # Summary statistics
-    summary_stats = df.describe()
+    summary_stats = backend.describe(df)
 
     # Data types and missing values
-    data_info = df.info()
+    data_info = backend.info(df)
 
     # Number of unique values in each column
-    num_unique = df.nunique()
+    num_unique = backend.nunique(df)
 
     # Check for missing values
-    missing_values = df.isnull().sum()
+    missing_values = backend.null_counts(df)
 
     # Check for duplicated rows
-    num_duplicates = df.duplicated().sum()
+    num_duplicates = backend.duplicated_count(df)
 
     # Basic histogram for numeric columns
-    numeric_columns = df.select_dtypes(include=['number'])
+    numeric_columns = backend.numeric_columns(df)
     histograms = {}
-    for column in numeric_columns.columns:
-        histograms[column] = df[column].plot(kind='hist', title=column)
+    if plot_histograms and numeric_columns:
+        # Fail with a hint about the plotting extra if matplotlib is missing
+        plotting_modules()
+        for column in numeric_columns:
+            histograms[column] = backend.to_pandas(df, [column])[column].plot(kind='hist', title=column)
     
     # Create a dictionary to store the EDA results
     eda_results = {
@@ -79,111 +131,120 @@ def dataframe_summary(df):
         'Histograms': histograms,
     }
 
+    if drawn is not None:
+        eda_results['Sample Size'] = {'Rows': len(drawn.frame), 'Population Rows': drawn.population}
+        eda_results['Estimates'] = {
+            'Means': drawn.estimate_means(),
+            'Null Rates': drawn.estimate_null_rates(),
+        }
+    if plan is not None:
+        eda_results['Execution Plan'] = plan
+
     return eda_results
 
 
-def visualize_missing_data(df, height=None, width=None, heatmap=True, cmap='YlGnBu'):
+def visualize_missing_data(df, height=None, width=None, heatmap=True, cmap='YlGnBu', render=True, fast=False, sample=None,
+                           memory_budget=None, missing_index=None):
     """
     Visualize missing data in a DataFrame, inspect categorical features, and provide insights.
 
     Parameters:
-    - df: pd.DataFrame
-        The DataFrame to analyze.
+    - df: pd.DataFrame, str, list or pyarrow.Table
+        The DataFrame to analyze. For Parquet sources and pyarrow Tables the missing-data
+        table is answered from the footers, and only string columns (and, for the heatmap,
+        partially missing columns) are decoded.
     - height: int, optional
         The height of the figure for the heatmap. Default is None.
     - width: int, optional
         The width of the figure for the heatmap. Default is None.
     - heatmap: bool, optional
         Whether to display a heatmap of missing data. Default is True.
+    - render: bool, optional
+        Whether to print the missing-data table and the per-feature analysis. Default is True.
+    - fast: bool, optional
+        Whether to analyze a cached random sample of 100,000 rows. Counts then refer to the
+        sample and 'Percent Missing' is an estimate. Default is False.
+    - sample: int or DataFrameSample, optional
+        Sample size to use instead of the default, or a sample drawn beforehand. Default is None.
+    - memory_budget: int or str, optional
+        Bytes (or e.g. '2GB') the null mask and heatmap may take. Over budget, missing counts
+        are taken column by column and the heatmap shows as many sampled rows as fit; the
+        chosen plan is printed and available from `eda_quest.memory.last_plan`. Default is None.
+    - missing_index: MissingnessIndex, optional
+        Packed null bitmaps of `df`, e.g. shared with `handle_missing_values`. The counts and
+        the heatmap are read from it. Default is None (built here, once). Not used when sampling.
 
     Returns:
-    - None
+    - QualityReport
+        The feature checks, exportable with `to_frame` or `to_json`.
     """
-    # Check for missing values
-    missing_data = df.isnull()
-    total_missing = missing_data.sum()
-    percent_missing = (missing_data.sum() / len(df)) * 100
+    drawn = None if is_arrow_source(df) else resolve_sample(df, fast=fast, sample=sample)
+    plan = None
+    if drawn is not None:
+        df = drawn.frame
+
+    if is_arrow_source(df):
+        from eda_quest import parquet
+
+        # Answer the missing-data table from the footers and decode only what the checks need
+        missing_info = parquet.missing_info(df)
+        missing_data = parquet.null_mask(df) if heatmap else None
+        source = df
+        df = parquet.string_frame(source)
+        typed_numeric_features = parquet.numeric_columns(source)
+    else:
+        backend = get_backend(df)
+        plan = plan_operation('visualize_missing_data', df, memory_budget, heatmap=heatmap) if drawn is None else None
+
+        # Check for missing values
+        if plan is not None and plan.strategy == 'sampled':
+            # Exact counts chunk by chunk, each chunk's mask as large as the sampled heatmap
+            if heatmap:
+                # Samples are pandas frames whatever the input type
+                sampled = draw_sample(df, size=plan.rows).frame
+                missing_data = get_backend(sampled).null_mask(sampled)
+            else:
+                missing_data = None
+            total_missing = null_counts_chunked(backend.row_chunks(df, max(plan.rows, 1)))
+        else:
+            # Counts and heatmap come from one packed index rather than separate null masks
+            index = _missingness_index(df, backend, missing_index) if drawn is None else None
+            if index is not None:
+                total_missing = index.column_null_counts()
+                missing_data = index.to_mask() if heatmap else None
+                if missing_data is not None and backend.name == 'pandas':
+                    missing_data.index = df.index
+            else:
+                missing_data = backend.null_mask(df) if heatmap else None
+                total_missing = missing_data.sum() if missing_data is not None else backend.null_counts(df)
+        percent_missing = (total_missing / backend.num_rows(df)) * 100
+
+        # Create a summary DataFrame
+        missing_info = pd.DataFrame({'Total Missing': total_missing, 'Percent Missing': percent_missing})
+        missing_info = missing_info[missing_info['Total Missing'] > 0].sort_values(by='Percent Missing', ascending=False)
+        typed_numeric_features = []
 
-    # Create a summary DataFrame
-    missing_info = pd.DataFrame({'Total Missing': total_missing, 'Percent Missing': percent_missing})
-    missing_info = missing_info[missing_info['Total Missing'] > 0].sort_values(by='Percent Missing', ascending=False)
+        if backend.name != 'pandas':
+            # Typed numeric columns cannot hold non-numeric entries; only string columns need decoding
+            typed_numeric_features = backend.numeric_columns(df)
+            df = backend.object_frame(df)
 
     # Display missing data info
-    print("\033[1mMissing Data Information\033[0m")
-    display(missing_info)
-
-    # Analyze categorical features
-    categorical_features = df.select_dtypes(include=['object']).columns.tolist()
-    if categorical_features:
-        print("\n\033[1mCategorical Feature Analysis\033[0m")
-        for feature in categorical_features:
-            unique_values = df[feature].unique()
-            print(f"\n\033[1mFeature: {feature}\033[0m")
-            print(f"Number of Unique Values: {len(unique_values)}")
-            print("Unique Values:", unique_values)
-            
-            # Check for special characters in categorical data
-            special_characters = ['!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '-', '_', '+', '=', '{', '}', '[', ']', '|', '\\', ';', ':', "'", '"', '<', '>', ',', '.', '?', '/', '~', '`']
-            has_special_characters = any(df[feature].str.contains('|'.join(map(re.escape, special_characters)), na=False))
-            if has_special_characters:
-                print("\n\033[1mSpecial Characters Detected!\033[0m")
-                print("Recommendation: Consider removing or replacing special characters.")
-            else:
-                print("\n\033[1mNo Special Characters Detected\033[0m")
-                
-            # Check for consistent binary values
-            if len(unique_values) == 2:
-                print("\n\033[1mBinary feature detected\033[0m.")
-                print("Recommendation: Check if binary values are consistent (e.g., 'Yes'/'No', 'True'/'False').")
-            else:
-                print("\n\033[1mNo binary feature detected\033[0m.")
-                
-            # Check cardinality and provide recommendations
-            if len(unique_values) < 10:
-                print("\n\033[1mLow cardinality feature detected\033[0m.")
-                print("Recommendation: Check for consistency and consider one-hot encoding.")
-            else:
-                print("\n\033[1mHigh cardinality feature detected\033[0m.")
-                print("Recommendation: Review and possibly reduce cardinality through grouping or feature engineering.")
-            
-            # Check for inconsistent capitalization
-            unique_values_lower = [value.lower() for value in unique_values if isinstance(value, str)]
-            unique_values_lower_set = set(unique_values_lower)
-            if len(unique_values_lower_set) != len(unique_values):
-                print("Inconsistent Capitalization Detected!")
-                print("Recommendation: Standardize capitalization (e.g., convert all values to lowercase).")
-
-            # Check for redundant or similar categories
-            def is_similar(value1, value2):
-                return value1.lower().replace(" ", "") == value2.lower().replace(" ", "")
-
-            similar_categories = []
-            for i, value1 in enumerate(unique_values):
-                for j, value2 in enumerate(unique_values):
-                    if i != j and is_similar(str(value1), str(value2)):
-                        similar_categories.append((value1, value2))
-            if similar_categories:
-                print("Redundant or Similar Categories Detected!")
-                print("Recommendation: Consolidate similar categories into a single category.")
-                print("Similar Category Pairs:")
-                for pair in similar_categories:
-                    print(pair)
-               
-    # Check numerical features for non-numeric entries
-    numerical_features = df.select_dtypes(include=['number']).columns.tolist()
-    if numerical_features:
-        print("\n\033[1mNumerical Feature Analysis\033[0m")
-        for feature in numerical_features:
-            if df[feature].apply(lambda x: isinstance(x, (int, float))).all():
-                print(f"\n\033[1mFeature: {feature}\033[0m")
-                print("All entries are numeric.")
-            else:
-                print(f"\n\033[1mFeature: {feature}\033[0m")
-                print("Non-numeric entries detected.")
-                print("Recommendation: Check and clean non-numeric entries if necessary.")
+    if render:
+        if plan is not None:
+            print(plan)
+        print("\033[1mMissing Data Information\033[0m")
+        display(missing_info)
+
+    # Run the categorical and numerical feature checks in one batched pass
+    numerical_features = df.select_dtypes(include=['number']).columns.tolist() + typed_numeric_features
+    report = feature_quality_report(df, numerical_features=numerical_features)
+    if render:
+        report.render()
                 
     # Create and display a heatmap
     if heatmap:
+        plt, sns = plotting_modules()
         if height and width:
             plt.figure(figsize=(width, height))
         elif height:
@@ -198,14 +259,29 @@ def visualize_missing_data(df, height=None, width=None, heatmap=True, cmap='YlGn
         plt.ylabel('Rows')
         plt.show()
 
+    return report
+
+
+def _missingness_index(df, backend, missing_index):
+    # The packed null bitmaps of a frame: the one passed in, checked against the frame, or a new one.
+    # Lazy Polars frames are not indexed, since every column would rerun the query.
+    if missing_index is not None:
+        missing_index.check_matches(backend.columns(df), backend.num_rows(df))
+        return missing_index
+    if hasattr(df, 'collect'):
+        return None
+    return MissingnessIndex.from_frame(df)
 
-def handle_missing_values(df, strategy='auto', default_value=None, threshold=5, row_threshold=None, column_threshold=None):
+
+def handle_missing_values(df, strategy='auto', default_value=None, threshold=5, row_threshold=None, column_threshold=None,
+                          output=None, chunksize=DEFAULT_CHUNKSIZE, memory_budget=None, missing_index=None):
     """
     Handle missing values in a DataFrame using different strategies.
 
     Parameters:
-    - df: pd.DataFrame
-        The DataFrame to perform missing value treatment on.
+    - df: pd.DataFrame, polars.DataFrame, polars.LazyFrame, str or os.PathLike
+        The DataFrame to perform missing value treatment on. The result has the same type.
+        A CSV or Parquet path is processed out of core, chunk by chunk, with strategy 'drop'.
     - strategy: str, optional
         The missing value handling strategy. Options: 'auto', 'fill', 'impute', 'drop'.
         Default is 'auto'.
@@ -221,83 +297,98 @@ def handle_missing_values(df, strategy='auto', default_value=None, threshold=5,
     - column_threshold: int, optional
         Maximum number of missing values allowed in a column before dropping it (for 'auto' and 'drop' strategies).
         Default is None (no column dropping).
+    - output: str or os.PathLike, optional
+        Destination CSV or Parquet file when `df` is a path, or when the result of an
+        in-memory frame does not fit in `memory_budget`. Default is None.
+    - chunksize: int, optional
+        Rows held in memory at a time when writing to `output`. Default is 100,000.
+    - memory_budget: int or str, optional
+        Bytes (or e.g. '2GB') the result and its null mask may take. Over budget, the frame is
+        processed chunk by chunk and written to `output` instead of being copied; imputation
+        medians are then merged from per-chunk quantile sketches. Default is None (the budget
+        set with `set_memory_budget`, unlimited unless set).
+    - missing_index: MissingnessIndex, optional
+        Packed null bitmaps of `df`, e.g. shared with `visualize_missing_data`. With strategy
+        'drop', pandas frames take the rows and columns to drop from it. Default is None
+        (the frame's own null scan is used).
 
     Returns:
     - pd.DataFrame
         The DataFrame with missing values handled based on the specified strategy.
-    """
-    df_processed = df.copy()
+        For path inputs and over-budget frames, a dict describing what was written (see
+        `drop_missing_chunked`).
 
-    # Automatically identify numeric and categorical columns
-    numeric_columns = df.select_dtypes(include=['number']).columns
-    categorical_columns = df.select_dtypes(exclude=['number']).columns
-    
-    if strategy == 'auto':
-        for column in numeric_columns:
-            if df[column].isnull().sum() > 0:
-                if abs(df[column].mean() - df[column].median()) <= threshold:
-                    df_processed[column].fillna(df[column].mean(), inplace=True)
-                else:
-                    df_processed[column].fillna(df[column].median(), inplace=True)
-        
-        for column in categorical_columns:
-            if df[column].isnull().sum() > 0:
-                df_processed[column].fillna(df[column].mode()[0], inplace=True)  # Fill with mode for categorical columns
+    Raises:
+    - MemoryError
+        If the result would not fit in `memory_budget` and no `output` is given.
+    """
+    if isinstance(df, (str, os.PathLike)):
+        if strategy != 'drop':
+            raise ValueError("File inputs are only supported with strategy='drop'.")
+        if output is None:
+            raise ValueError("An output path is required when the input is a file.")
+        return drop_missing_chunked(df, output, row_threshold=row_threshold,
+                                    column_threshold=column_threshold, chunksize=chunksize)
+
+    backend = get_backend(df)
+
+    plan = plan_operation('handle_missing_values', df, memory_budget)
+    if plan is not None and plan.strategy == 'on-disk':
+        if output is None:
+            raise MemoryError(f"{plan!r} does not fit; pass output= to write the result chunk by chunk.")
+        return _handle_missing_on_disk(df, backend, plan, output, chunksize, strategy, default_value,
+                                       threshold, row_threshold, column_threshold)
+
+    if strategy in ('auto', 'impute'):
+        # Mean or median for numeric columns, mode for categorical columns
+        df_processed = backend.fillna(df, backend.imputation_values(df, threshold))
     
     elif strategy == 'fill' and default_value is not None:
-        df_processed.fillna(default_value, inplace=True)
-    
-    elif strategy == 'impute':
-        for column in numeric_columns:
-            if df[column].isnull().sum() > 0:
-                if abs(df[column].mean() - df[column].median()) <= threshold:
-                    df_processed[column].fillna(df[column].mean(), inplace=True)
-                else:
-                    df_processed[column].fillna(df[column].median(), inplace=True)
-        
-        for column in categorical_columns:
-            if df[column].isnull().sum() > 0:
-                df_processed[column].fillna(df[column].mode()[0], inplace=True)
+        df_processed = backend.fillna(df, default_value)
                 
     elif strategy == 'drop':
-        if row_threshold is not None and column_threshold is not None:
-            # Scenario 1: Drop rows and columns based on both row_threshold and column_threshold
-
-            # Calculate the total number of missing values in each row and column
-            row_missing_counts = df_processed.isnull().sum(axis=1)
-            column_missing_counts = df_processed.isnull().sum(axis=0)
-
-            # Drop rows exceeding the row_threshold
-            rows_to_drop = row_missing_counts[row_missing_counts >= row_threshold].index
-            df_processed.drop(index=rows_to_drop, inplace=True)
-
-            # Drop columns exceeding the column_threshold
-            columns_to_drop = column_missing_counts[column_missing_counts >= column_threshold].index
-            df_processed.drop(columns=columns_to_drop, inplace=True)
-
-        elif row_threshold is not None:
-            # Scenario 2: Drop rows based on row_threshold
-
-            # Calculate the total number of missing values in each row
-            row_missing_counts = df_processed.isnull().sum(axis=1)
-
-            # Drop rows exceeding the row_threshold
-            rows_to_drop = row_missing_counts[row_missing_counts >= row_threshold].index
-            df_processed.drop(index=rows_to_drop, inplace=True)
-
-        elif column_threshold is not None:
-            # Scenario 3: Drop columns based on column_threshold
-
-            # Calculate the total number of missing values in each column
-            column_missing_counts = df_processed.isnull().sum(axis=0)
+        # Rows and columns reaching their thresholds are dropped; without thresholds,
+        # all rows with any missing values are dropped
+        if backend.name == 'pandas' and missing_index is not None:
+            # Reuse the bitmaps the caller already built instead of scanning the frame again
+            index = _missingness_index(df, backend, missing_index)
+            keep_rows, columns_to_drop = index.drop_selection(row_threshold, column_threshold)
+            df_processed = df.loc[keep_rows].drop(columns=columns_to_drop)
+        else:
+            # Without a shared index, the backend's own null scan is cheaper than building one
+            df_processed = backend.drop_missing(df, row_threshold=row_threshold, column_threshold=column_threshold)
 
-            # Drop columns exceeding the column_threshold
-            columns_to_drop = column_missing_counts[column_missing_counts >= column_threshold].index
-            df_processed.drop(columns=columns_to_drop, inplace=True)
+    else:
+        df_processed = backend.copy(df)
 
-        else:
-            # Scenario 4: Drop all rows with any missing values (default behavior)
+    return df_processed
 
-            df_processed.dropna(axis=0, inplace=True)
 
-    return df_processed
\ No newline at end of file
+def _handle_missing_on_disk(df, backend, plan, output, chunksize, strategy, default_value, threshold,
+                            row_threshold, column_threshold):
+    # Same strategies as in memory, with statistics gathered chunk by chunk in a first pass
+    columns = backend.columns(df)
+    fill_value, columns_to_drop, drop_incomplete = None, [], False
+    if strategy in ('auto', 'impute'):
+        fill_value = imputation_values_chunked(backend.row_chunks(df, chunksize), backend.numeric_columns(df),
+                                               threshold)
+    elif strategy == 'fill' and default_value is not None:
+        fill_value = default_value
+    elif strategy == 'drop':
+        if column_threshold is not None:
+            null_counts = null_counts_chunked(backend.row_chunks(df, chunksize))
+            columns_to_drop = null_counts[null_counts >= column_threshold].index.tolist()
+        drop_incomplete = row_threshold is None and column_threshold is None
+
+    kept_columns = [column for column in columns if column not in columns_to_drop]
+    rows_written, rows_dropped = write_chunks(
+        backend.row_chunks(df, chunksize), output, kept_columns, fill_value=fill_value,
+        row_threshold=row_threshold if strategy == 'drop' else None, drop_incomplete=drop_incomplete,
+    )
+    return {
+        'Output': os.fspath(output),
+        'Rows Written': rows_written,
+        'Rows Dropped': rows_dropped,
+        'Columns Dropped': columns_to_drop,
+        'Execution Plan': plan,
+    }
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import types
+import warnings
+import importlib.util
+import numpy as np
+from eda_quest.utils import optional_import
+
+ENGINES = ('auto', 'numba', 'numpy')
+
+# Above this many quantiles per call, the Numba kernel sorts each column once instead
+# of partitioning it once per quantile
+PARTITION_QUANTILES = 4
+
+# Compiled Numba kernels, filled on first use
+_COMPILED = {}
+
+
+def numba_available():
+    """
+    Tell whether the optional Numba kernels can be used, without importing Numba.
+    """
+    return importlib.util.find_spec('numba') is not None
+
+
+def _engine(engine):
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown kernel engine {engine!r}; expected one of {', '.join(ENGINES)}.")
+    if engine == 'auto':
+        return 'numba' if numba_available() else 'numpy'
+    return engine
+
+
+def _as_columns(values):
+    # Columns of a 2-D float array; a 1-D input is one column
+    values = np.asarray(values, dtype=np.float64)
+    return values[:, None] if values.ndim == 1 else values
+
+
+# Pure-Python kernels, compiled with numba.njit on first use. Each loops over the
+# columns with `prange`, which is range here and numba.prange in the compiled copies,
+# and over the rows once.
+prange = range
+
+
+def _moments_kernel(values):
+    num_columns = values.shape[1]
+    out = np.empty((5, num_columns))
+    for j in prange(num_columns):
+        count, mean, m2 = 0, 0.0, 0.0
+        low, high = np.inf, -np.inf
+        for i in range(values.shape[0]):
+            x = values[i, j]
+            if x == x:
+                # Welford's update of the mean and the sum of squared deviations
+                count += 1
+                delta = x - mean
+                mean += delta / count
+                m2 += delta * (x - mean)
+                low = min(low, x)
+                high = max(high, x)
+        out[0, j] = count
+        out[1, j] = mean if count else np.nan
+        out[2, j] = m2 if count else np.nan
+        out[3, j] = low if count else np.nan
+        out[4, j] = high if count else np.nan
+    return out
+
+
+def _quantiles_kernel(values, q):
+    num_columns = values.shape[1]
+    out = np.empty((len(q), num_columns))
+    for j in prange(num_columns):
+        buffer = np.empty(values.shape[0])
+        n = 0
+        for i in range(values.shape[0]):
+            x = values[i, j]
+            if x == x:
+                buffer[n] = x
+                n += 1
+        # Many quantiles share one sort; a few each take a linear-time partition
+        present = np.sort(buffer[:n]) if len(q) > PARTITION_QUANTILES else buffer[:n]
+        for k in range(len(q)):
+            if n == 0:
+                out[k, j] = np.nan
+                continue
+            # Linear interpolation between the order statistics around q * (n - 1)
+            position = q[k] * (n - 1)
+            lower = int(np.floor(position))
+            if len(q) > PARTITION_QUANTILES:
+                value = present[lower]
+                if lower + 1 < n and position > lower:
+                    value = value + (present[lower + 1] - value) * (position - lower)
+            else:
+                part = np.partition(present, lower)
+                value = part[lower]
+                if lower + 1 < n and position > lower:
+                    upper = np.min(part[lower + 1:])
+                    value = value + (upper - value) * (position - lower)
+            out[k, j] = value
+    return out
+
+
+def _histograms_kernel(values, edges):
+    num_columns, bins = values.shape[1], edges.shape[1] - 1
+    out = np.zeros((num_columns, bins), dtype=np.int64)
+    for j in prange(num_columns):
+        low, high = edges[j, 0], edges[j, bins]
+        norm = bins / (high - low)
+        for i in range(values.shape[0]):
+            x = values[i, j]
+            if x == x and low <= x <= high:
+                # Same index arithmetic and edge correction as np.histogram
+                index = min(int((x - low) * norm), bins - 1)
+                if x < edges[j, index]:
+                    index -= 1
+                elif index != bins - 1 and x >= edges[j, index + 1]:
+                    index += 1
+                out[j, index] += 1
+    return out
+
+
+def _compiled(name, parallel=True):
+    if (name, parallel) not in _COMPILED:
+        numba = optional_import('numba')
+        kernel = {'moments': _moments_kernel, 'quantiles': _quantiles_kernel, 'histograms': _histograms_kernel}[name]
+        # Compile a copy whose `prange` is numba's, leaving the module's pure-Python kernels untouched
+        kernel = types.FunctionType(kernel.__code__, {**globals(), 'prange': numba.prange if parallel else range},
+                                    kernel.__name__)
+        _COMPILED[name, parallel] = numba.njit(parallel=parallel, cache=True)(kernel)
+    return _COMPILED[name, parallel]
+
+
+def column_moments(values, engine='auto'):
+    """
+    Count, mean, sum of squared deviations, min and max of every column in one pass.
+
+    Parameters:
+    - values: array-like
+        2-D array with one column per variable (or a 1-D array). NaN is missing.
+    - engine: str, optional
+        'numba', 'numpy' or 'auto' (Numba when installed). Default is 'auto'.
+
+    Returns:
+    - dict
+        'count', 'mean', 'm2', 'min' and 'max' arrays, NaN for columns without values.
+    """
+    values = _as_columns(values)
+    if _engine(engine) == 'numba':
+        count, mean, m2, low, high = _compiled('moments')(values)
+        return {'count': count.astype(np.int64), 'mean': mean, 'm2': m2, 'min': low, 'max': high}
+
+    count = np.count_nonzero(~np.isnan(values), axis=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        mean = np.nanmean(values, axis=0)
+        return {
+            'count': count,
+            'mean': mean,
+            'm2': np.where(count > 0, np.nansum((values - mean) ** 2, axis=0), np.nan),
+            'min': np.nanmin(values, axis=0) if values.shape[0] else np.full(values.shape[1], np.nan),
+            'max': np.nanmax(values, axis=0) if values.shape[0] else np.full(values.shape[1], np.nan),
+        }
+
+
+def column_quantiles(values, q, engine='auto'):
+    """
+    Quantiles of every column with linear interpolation, ignoring NaN.
+
+    For up to four quantiles the Numba kernel selects the needed order statistics with
+    a partition instead of sorting each column; for more, e.g. a 101-point sketch, it
+    sorts each column once.
+
+    Parameters:
+    - values: array-like
+        2-D array with one column per variable (or a 1-D array).
+    - q: array-like
+        Probabilities in [0, 1].
+    - engine: str, optional
+        'numba', 'numpy' or 'auto' (Numba when installed). Default is 'auto'.
+
+    Returns:
+    - np.ndarray
+        Array of shape (len(q), number of columns).
+    """
+    values = _as_columns(values)
+    q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+    if _engine(engine) == 'numba':
+        return _compiled('quantiles')(values, q)
+    if not values.shape[0]:
+        return np.full((len(q), values.shape[1]), np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.nanquantile(values, q, axis=0)
+
+
+def fixed_edge_histograms(values, bins=30, ranges=None, engine='auto'):
+    """
+    Histograms of every column over equal-width bins, computed for all columns at once.
+
+    Parameters:
+    - values: array-like
+        2-D array with one column per variable (or a 1-D array). NaN is ignored.
+    - bins: int, optional
+        Number of bins per column. Default is 30.
+    - ranges: tuple of array-like, optional
+        (lows, highs) of every column. Default is None (each column's min and max).
+    - engine: str, optional
+        'numba', 'numpy' or 'auto' (Numba when installed). Default is 'auto'.
+
+    Returns:
+    - tuple
+        (counts of shape (columns, bins), edges of shape (columns, bins + 1)), matching
+        `np.histogram` column by column.
+    """
+    values = _as_columns(values)
+    if ranges is None:
+        moments = column_moments(values, engine=engine)
+        lows, highs = moments['min'], moments['max']
+    else:
+        lows, highs = (np.asarray(bound, dtype=np.float64) for bound in ranges)
+    # Empty and constant columns get the unit-width range np.histogram uses
+    empty = np.isnan(lows)
+    lows, highs = np.where(empty, 0.0, lows), np.where(empty, 1.0, highs)
+    constant = lows == highs
+    lows, highs = np.where(constant, lows - 0.5, lows), np.where(constant, highs + 0.5, highs)
+    edges = np.linspace(lows, highs, bins + 1, axis=1)
+
+    if _engine(engine) == 'numba':
+        return _compiled('histograms')(values, edges), edges
+
+    # Bin indices as np.histogram computes them, corrected against the edges for rounding
+    with np.errstate(invalid='ignore'):
+        valid = (values >= lows) & (values <= highs)
+        index = np.floor((np.where(valid, values, lows) - lows) * (bins / (highs - lows))).astype(np.int64)
+    index = np.clip(index, 0, bins - 1)
+    edges_by_row = edges.T
+    index -= np.where(valid, values, lows) < np.take_along_axis(edges_by_row, index, axis=0)
+    index += (np.where(valid, values, lows) >= np.take_along_axis(edges_by_row, index + 1, axis=0)) & (index != bins - 1)
+
+    # One bincount over all columns: every column's bins are offset into its own block
+    flat = (index + np.arange(values.shape[1]) * bins)[valid]
+    counts = np.bincount(flat, minlength=values.shape[1] * bins).reshape(values.shape[1], bins)
+    return counts, edges
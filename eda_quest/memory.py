@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import re
+import numpy as np
+from eda_quest.backends import get_backend
+
+# Rows whose string sizes are measured to estimate the size of object columns
+STRING_SAMPLE_ROWS = 1000
+
+# Fewest rows a sampled plan works on, however small the budget
+MIN_PLAN_ROWS = 1000
+
+# Multipliers of the units accepted by `parse_budget`
+UNITS = {'': 1, 'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3, 'TB': 1024 ** 4}
+
+# Budget used when a function is called without `memory_budget`
+_DEFAULT_BUDGET = None
+
+# Plan chosen by the most recent budgeted operation
+_LAST_PLAN = None
+
+
+def parse_budget(budget):
+    """
+    Turn a budget such as 2_000_000_000, '512MB' or '1.5 GB' into bytes.
+
+    Parameters:
+    - budget: int, float, str or None
+        The budget. None means unlimited.
+
+    Returns:
+    - int or None
+        The budget in bytes.
+    """
+    if budget is None or isinstance(budget, (int, float)):
+        return None if budget is None else int(budget)
+    match = re.fullmatch(r'\s*([\d.]+)\s*([KMGT]?B?)\s*', budget.upper())
+    if match is None:
+        raise ValueError(f"Invalid memory budget {budget!r}; use bytes or a string like '512MB'.")
+    number, unit = match.groups()
+    if unit and not unit.endswith('B'):
+        unit += 'B'
+    return int(float(number) * UNITS[unit])
+
+
+def set_memory_budget(budget):
+    """
+    Set the memory budget used by `dataframe_summary`, `visualize_missing_data` and
+    `handle_missing_values` when they are called without `memory_budget`.
+
+    Parameters:
+    - budget: int, str or None
+        Bytes or a string like '4GB'. None removes the budget.
+
+    Returns:
+    - None
+    """
+    global _DEFAULT_BUDGET
+    _DEFAULT_BUDGET = parse_budget(budget)
+
+
+def last_plan():
+    """
+    Return the `ExecutionPlan` chosen by the most recent budgeted operation, or None.
+    """
+    return _LAST_PLAN
+
+
+def _format_bytes(value):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(value) < 1024:
+            return f'{value:.1f} {unit}'
+        value /= 1024
+    return f'{value:.1f} TB'
+
+
+class ExecutionPlan:
+    """
+    How a budgeted operation is run, and why.
+
+    Attributes:
+    - operation: str
+        'dataframe_summary', 'visualize_missing_data' or 'handle_missing_values'.
+    - strategy: str
+        'in-memory', 'sampled' or 'on-disk'.
+    - estimated_bytes: int
+        Estimated peak of the memory the in-memory variant would allocate.
+    - budget: int
+        The budget in bytes.
+    - rows: int or None
+        Rows used by a sampled plan.
+    """
+
+    def __init__(self, operation, strategy, estimated_bytes, budget, rows=None):
+        self.operation = operation
+        self.strategy = strategy
+        self.estimated_bytes = int(estimated_bytes)
+        self.budget = budget
+        self.rows = rows
+
+    def to_dict(self):
+        """
+        Return the plan as a plain dict.
+        """
+        return {
+            'Operation': self.operation,
+            'Strategy': self.strategy,
+            'Estimated Bytes': self.estimated_bytes,
+            'Budget Bytes': self.budget,
+            'Rows': self.rows,
+        }
+
+    def __repr__(self):
+        text = (f"ExecutionPlan({self.operation}: {self.strategy}, estimated "
+                f"{_format_bytes(self.estimated_bytes)} for a budget of {_format_bytes(self.budget)}")
+        return text + (f", {self.rows} rows)" if self.rows is not None else ")")
+
+
+def frame_footprint(df):
+    """
+    Estimate the size of a frame from its dtypes and shape, without copying it.
+
+    Numeric and boolean columns are sized exactly; object and string columns from the
+    deep size of their first rows, as are lazy Polars frames.
+
+    Parameters:
+    - df: pd.DataFrame, polars.DataFrame or polars.LazyFrame
+        The frame.
+
+    Returns:
+    - dict
+        'Rows', 'Columns', 'Bytes' and 'Numeric Bytes' (the numeric columns alone).
+    """
+    backend = get_backend(df)
+    rows = backend.num_rows(df)
+    numeric = backend.numeric_columns(df)
+    if backend.name == 'pandas':
+        usage = df.memory_usage(index=False, deep=False)
+        numeric_bytes = int(usage[numeric].sum())
+        other = [column for column in df.columns if column not in numeric]
+        head = df[other].head(STRING_SAMPLE_ROWS)
+        other_bytes = int(head.memory_usage(index=False, deep=True).sum() / max(len(head), 1) * rows)
+    else:
+        # Eager frames know their size; lazy ones are sized from their first rows
+        frame = df if not hasattr(df, 'collect') else df.head(STRING_SAMPLE_ROWS).collect()
+        scale = rows / max(frame.height, 1)
+        numeric_bytes = int(frame.select(numeric).estimated_size() * scale)
+        other_bytes = int(frame.estimated_size() * scale) - numeric_bytes
+    return {'Rows': rows, 'Columns': len(backend.columns(df)), 'Bytes': numeric_bytes + other_bytes,
+            'Numeric Bytes': numeric_bytes}
+
+
+def estimate_peak(operation, footprint, heatmap=True):
+    """
+    Estimate the memory an operation allocates on top of its input.
+
+    These are deliberately coarse upper bounds: 'dataframe_summary' holds a float copy
+    of the numeric block plus its sorted copy for the percentiles, a null mask and row
+    hashes; 'visualize_missing_data' holds a boolean null mask and, for the heatmap, the
+    float matrix seaborn draws; 'handle_missing_values' holds a null mask and the result.
+
+    Parameters:
+    - operation: str
+        One of the budgeted operations.
+    - footprint: dict
+        Output of `frame_footprint`.
+    - heatmap: bool, optional
+        Whether `visualize_missing_data` draws the heatmap. Default is True.
+
+    Returns:
+    - int
+        Estimated bytes.
+    """
+    rows, columns = footprint['Rows'], footprint['Columns']
+    if operation == 'dataframe_summary':
+        return 2 * footprint['Numeric Bytes'] + rows * columns + 16 * rows
+    if operation == 'visualize_missing_data':
+        return rows * columns * (9 if heatmap else 1)
+    if operation == 'handle_missing_values':
+        return footprint['Bytes'] + rows * columns
+    raise ValueError(f"Unknown operation {operation!r}.")
+
+
+def plan_operation(operation, df, memory_budget=None, heatmap=True):
+    """
+    Choose how to run an operation so that it stays within a memory budget.
+
+    Within budget the operation runs in memory. Otherwise summaries and the missing-data
+    heatmap run on as many sampled rows as the budget allows, and missing-value handling
+    is streamed chunk by chunk to a file. The plan is remembered for `last_plan`.
+
+    Parameters:
+    - operation: str
+        'dataframe_summary', 'visualize_missing_data' or 'handle_missing_values'.
+    - df: pd.DataFrame, polars.DataFrame or polars.LazyFrame
+        The input frame.
+    - memory_budget: int or str, optional
+        Budget in bytes or a string like '2GB'. Default is None (the budget set with
+        `set_memory_budget`).
+    - heatmap: bool, optional
+        Whether `visualize_missing_data` draws the heatmap. Default is True.
+
+    Returns:
+    - ExecutionPlan or None
+        None when there is no budget, in which case nothing is estimated.
+    """
+    global _LAST_PLAN
+    budget = parse_budget(memory_budget) if memory_budget is not None else _DEFAULT_BUDGET
+    if budget is None:
+        return None
+
+    footprint = frame_footprint(df)
+    estimate = estimate_peak(operation, footprint, heatmap=heatmap)
+    if estimate <= budget:
+        plan = ExecutionPlan(operation, 'in-memory', estimate, budget)
+    elif operation == 'handle_missing_values':
+        plan = ExecutionPlan(operation, 'on-disk', estimate, budget)
+    else:
+        per_row = estimate / max(footprint['Rows'], 1)
+        rows = int(np.clip(budget // max(per_row, 1), MIN_PLAN_ROWS, footprint['Rows']))
+        plan = ExecutionPlan(operation, 'sampled', estimate, budget, rows=rows)
+    _LAST_PLAN = plan
+    return plan
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import os
+import json
+import numpy as np
+import pandas as pd
+from eda_quest.backends import get_backend
+
+# Number of set bits in every possible byte value
+POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+# Cells (columns x rows) unpacked per step, e.g. 8 * 65536 rows of 32 columns; wider
+# indexes take proportionally fewer rows so that a step's block stays the same size
+CELLS_PER_STEP = 32 * 8 * 65536
+
+
+class MissingnessIndex:
+    """
+    Missing-value bitmaps for every column of a table, packed eight rows per byte.
+
+    The bitmaps take 1/8 of the memory of a boolean `isnull()` frame and can be saved
+    to disk and memory-mapped. Counts, missing patterns and the nullity co-occurrence
+    matrix are computed from the packed bits in bounded-size steps.
+
+    Attributes:
+    - columns: list
+        Column names, one bitmap row each.
+    - num_rows: int
+        Number of rows indexed.
+    - bits: np.ndarray
+        uint8 array of shape (len(columns), ceil(num_rows / 8)).
+    """
+
+    def __init__(self, columns, num_rows, bits):
+        self.columns = list(columns)
+        self.num_rows = int(num_rows)
+        self.bits = bits
+
+    @classmethod
+    def from_frame(cls, data):
+        """
+        Build the index from a DataFrame or an iterable of DataFrame chunks.
+
+        Parameters:
+        - data: pd.DataFrame, polars.DataFrame or iterable of DataFrames
+            The table to index. Chunks must share the same columns.
+
+        Returns:
+        - MissingnessIndex
+            The packed index.
+        """
+        chunks = [data] if hasattr(data, 'columns') else data
+        columns, packed, carry, num_rows = None, [], None, 0
+        for chunk in chunks:
+            backend = get_backend(chunk)
+            if columns is None:
+                columns = list(chunk.columns)
+                carry = np.zeros((len(columns), 0), dtype=bool)
+            chunk_rows = backend.num_rows(chunk)
+            num_rows += chunk_rows
+
+            # Only whole bytes are packed; leftover rows carry over to the next chunk
+            total = carry.shape[1] + chunk_rows
+            whole = total - total % 8
+            block = np.empty((len(columns), whole // 8), dtype=np.uint8)
+            next_carry = np.empty((len(columns), total - whole), dtype=bool)
+            for i, column in enumerate(columns):
+                # One column's mask at a time rather than a full boolean frame
+                mask = np.concatenate([carry[i], backend.column_null_mask(chunk, column)])
+                block[i] = np.packbits(mask[:whole])
+                next_carry[i] = mask[whole:]
+            packed.append(block)
+            carry = next_carry
+        if columns is None:
+            columns = []
+        elif carry.shape[1]:
+            packed.append(np.packbits(carry, axis=1))
+        bits = np.hstack(packed) if packed else np.zeros((len(columns), 0), dtype=np.uint8)
+        return cls(columns, num_rows, bits)
+
+    def save(self, path):
+        """
+        Write the index to a directory as `bits.npy` plus `index.json`.
+
+        Parameters:
+        - path: str
+            Directory to write to. It is created if needed.
+
+        Returns:
+        - None
+        """
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, 'bits.npy'), self.bits)
+        with open(os.path.join(path, 'index.json'), 'w') as index_file:
+            json.dump({'columns': self.columns, 'num_rows': self.num_rows}, index_file)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Load an index written by `save`.
+
+        Parameters:
+        - path: str
+            Directory holding the index.
+        - mmap: bool, optional
+            Whether to memory-map the bitmaps instead of reading them. Default is True.
+
+        Returns:
+        - MissingnessIndex
+            The loaded index.
+        """
+        with open(os.path.join(path, 'index.json')) as index_file:
+            meta = json.load(index_file)
+        bits = np.load(os.path.join(path, 'bits.npy'), mmap_mode='r' if mmap else None)
+        return cls(meta['columns'], meta['num_rows'], bits)
+
+    def _unpacked_steps(self):
+        # Yield (start_row, bool block of shape columns x rows) in bounded-size steps
+        step = max(1, CELLS_PER_STEP // (8 * max(len(self.columns), 1)))
+        for start in range(0, self.bits.shape[1], step):
+            block = np.unpackbits(self.bits[:, start:start + step], axis=1).astype(bool)
+            first_row = start * 8
+            yield first_row, block[:, :max(0, min(block.shape[1], self.num_rows - first_row))]
+
+    def column_null_counts(self):
+        """
+        Return the number of missing values per column.
+
+        Returns:
+        - pd.Series
+            Counts indexed by column name.
+        """
+        counts = POPCOUNT[self.bits].sum(axis=1, dtype=np.int64) if self.bits.size else np.zeros(len(self.columns), dtype=np.int64)
+        return pd.Series(counts, index=self.columns, dtype='int64')
+
+    def row_null_counts(self):
+        """
+        Return the number of missing values per row.
+
+        Returns:
+        - np.ndarray
+            int array of length num_rows.
+        """
+        counts = np.zeros(self.num_rows, dtype=np.int64)
+        for first_row, block in self._unpacked_steps():
+            counts[first_row:first_row + block.shape[1]] = block.sum(axis=0)
+        return counts
+
+    def pattern_frequencies(self, top=None):
+        """
+        Count how often each combination of missing columns occurs across rows.
+
+        Parameters:
+        - top: int, optional
+            Return only the most frequent patterns. Default is None (all patterns).
+
+        Returns:
+        - pd.DataFrame
+            One boolean column per indexed column plus 'Count', sorted by frequency.
+        """
+        totals = {}
+        for _, block in self._unpacked_steps():
+            # Each row's pattern, packed across columns, is a compact hashable key
+            keys = np.packbits(block.T, axis=1)
+            patterns, counts = np.unique(keys, axis=0, return_counts=True)
+            for pattern, count in zip(patterns, counts):
+                key = pattern.tobytes()
+                totals[key] = totals.get(key, 0) + int(count)
+
+        ordered = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        if top is not None:
+            ordered = ordered[:top]
+        rows = [np.unpackbits(np.frombuffer(key, dtype=np.uint8))[:len(self.columns)].astype(bool) for key, _ in ordered]
+        frame = pd.DataFrame(rows, columns=self.columns) if rows else pd.DataFrame(columns=self.columns, dtype=bool)
+        frame['Count'] = [count for _, count in ordered]
+        return frame
+
+    def cooccurrence(self):
+        """
+        Count, for every pair of columns, the rows where both are missing.
+
+        Returns:
+        - pd.DataFrame
+            Square matrix of counts; the diagonal holds each column's missing count.
+        """
+        counts = np.zeros((len(self.columns), len(self.columns)), dtype=np.float64)
+        for _, block in self._unpacked_steps():
+            block = block.astype(np.float32)
+            counts += block @ block.T
+        return pd.DataFrame(counts.round().astype(np.int64), index=self.columns, columns=self.columns)
+
+    def nullity_correlation(self):
+        """
+        Return the correlation between the missingness indicators of every pair of columns.
+
+        Columns that are never or always missing have no defined correlation (NaN).
+
+        Returns:
+        - pd.DataFrame
+            Square matrix of Pearson correlations of the null indicators.
+        """
+        n = self.num_rows
+        both = self.cooccurrence().to_numpy(dtype=float)
+        p = np.diag(both) / n if n else np.zeros(len(self.columns))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = (both / n - np.outer(p, p)) / np.sqrt(np.outer(p * (1 - p), p * (1 - p)))
+        return pd.DataFrame(np.clip(corr, -1.0, 1.0), index=self.columns, columns=self.columns)
+
+    def to_mask(self, columns=None, rows=None):
+        """
+        Unpack the bitmaps into a boolean frame, e.g. for the missing-data heatmap.
+
+        Parameters:
+        - columns: list, optional
+            Columns to unpack. Default is None (all columns).
+        - rows: array-like, optional
+            Sorted row positions to unpack, e.g. those of a sample. Default is None (all rows).
+
+        Returns:
+        - pd.DataFrame
+            Boolean frame with True where a value is missing.
+        """
+        columns = self.columns if columns is None else list(columns)
+        positions = [self.columns.index(column) for column in columns]
+        bits = self.bits[positions]
+        if rows is not None:
+            # Pick each row's bit straight from its byte, without unpacking the other rows
+            rows = np.asarray(rows, dtype=np.int64)
+            unpacked = ((bits[:, rows // 8] >> (7 - rows % 8).astype(np.uint8)) & 1).astype(bool)
+            return pd.DataFrame(unpacked.T, columns=columns)
+        unpacked = np.unpackbits(bits, axis=1, count=self.num_rows).astype(bool) \
+            if positions else np.zeros((0, self.num_rows), dtype=bool)
+        return pd.DataFrame(unpacked.T, columns=columns)
+
+    def drop_selection(self, row_threshold=None, column_threshold=None):
+        """
+        Select what `handle_missing_values(strategy='drop')` drops, from the bitmaps.
+
+        Both counts are taken before anything is dropped. Without thresholds, every row
+        holding a missing value is dropped.
+
+        Parameters:
+        - row_threshold: int, optional
+            Rows with at least this many missing values are dropped. Default is None.
+        - column_threshold: int, optional
+            Columns with at least this many missing values are dropped. Default is None.
+
+        Returns:
+        - tuple
+            (boolean np.ndarray of the rows to keep, list of the columns to drop).
+        """
+        columns_to_drop = []
+        if column_threshold is not None:
+            counts = self.column_null_counts()
+            columns_to_drop = counts[counts >= column_threshold].index.tolist()
+        if row_threshold is None and column_threshold is None:
+            keep_rows = self.row_null_counts() == 0
+        elif row_threshold is not None:
+            keep_rows = self.row_null_counts() < row_threshold
+        else:
+            keep_rows = np.ones(self.num_rows, dtype=bool)
+        return keep_rows, columns_to_drop
+
+    def check_matches(self, columns, num_rows):
+        """
+        Raise a ValueError unless the index was built for a table with these columns and rows.
+        """
+        if list(columns) != self.columns or int(num_rows) != self.num_rows:
+            raise ValueError(f"The missingness index covers {self.num_rows} rows of {len(self.columns)} columns, "
+                             f"not the {num_rows} rows of {len(list(columns))} columns given.")
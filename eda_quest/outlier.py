@@ -1,11 +1,127 @@
 # Import libraries
 import numpy as np
+import pandas as pd
+from eda_quest.backends import get_backend
+from eda_quest.kernels import column_quantiles
 
-def detect_outliers_iqr(data):
-    Q1 = np.percentile(data, 25)
-    Q3 = np.percentile(data, 75)
+# Quantiles computed for every column in the single quantile pass of `box_summaries`
+BOX_QUANTILES = [0.0, 0.25, 0.5, 0.75, 1.0]
+
+
+def box_summaries(df, columns=None, whis=1.5, max_outliers=None):
+    """
+    Compute five-number summaries, IQR fences and whisker ends for numeric columns.
+
+    All quantiles come from one quantile pass over the columns (`eda_quest.kernels`),
+    and the whisker ends, outlier counts and (optionally) the outliers to draw from one
+    masked pass. Missing values are ignored.
+
+    Parameters:
+    - df: pd.DataFrame
+        The DataFrame to summarise.
+    - columns: list, optional
+        Numeric columns to summarise. Default is None (all numeric columns).
+    - whis: float, optional
+        Fences lie `whis` IQRs beyond the quartiles, as in `matplotlib`. Default is 1.5.
+    - max_outliers: int, optional
+        When set, a 'fliers' column holds each column's outliers to draw, capped as in
+        `outlier_sample`. Default is None (no 'fliers' column).
+
+    Returns:
+    - pd.DataFrame
+        One row per column with 'count', 'min', 'q1', 'median', 'q3', 'max', 'iqr',
+        'lower_fence', 'upper_fence', 'whislo', 'whishi' and 'outliers'.
+    """
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns.tolist()
+    values = df[list(columns)].astype(float)
+
+    quantiles = pd.DataFrame(column_quantiles(values.to_numpy(), BOX_QUANTILES).T, index=values.columns,
+                             columns=['min', 'q1', 'median', 'q3', 'max'])
+    summaries = quantiles.assign(count=values.count())
+    summaries['iqr'] = summaries['q3'] - summaries['q1']
+    summaries['lower_fence'] = summaries['q1'] - whis * summaries['iqr']
+    summaries['upper_fence'] = summaries['q3'] + whis * summaries['iqr']
+
+    # Whiskers end at the most extreme values still inside the fences
+    below = values.lt(summaries['lower_fence'], axis=1)
+    above = values.gt(summaries['upper_fence'], axis=1)
+    outside = below | above
+    inside = values.where(~outside)
+    summaries['whislo'] = inside.min()
+    summaries['whishi'] = inside.max()
+    summaries['outliers'] = outside.sum().astype('int64')
+
+    order = ['count', 'min', 'q1', 'median', 'q3', 'max', 'iqr', 'lower_fence', 'upper_fence',
+             'whislo', 'whishi', 'outliers']
+    if max_outliers is not None:
+        # Gather every outlier from the mask at once, grouped by column, then cap each group
+        rows, positions = np.nonzero(outside.to_numpy().T)
+        outliers = values.to_numpy()[positions, rows]
+        bounds = np.searchsorted(rows, np.arange(len(values.columns) + 1))
+        summaries['fliers'] = [_capped(outliers[start:end], max_outliers)
+                               for start, end in zip(bounds[:-1], bounds[1:])]
+        order.append('fliers')
+    return summaries[order]
+
+
+def _capped(outliers, max_outliers, seed=0):
+    if len(outliers) <= max_outliers:
+        return outliers
+    rng = np.random.default_rng(seed)
+    sampled = rng.choice(outliers, max(max_outliers - 2, 0), replace=False)
+    return np.concatenate([[outliers.min(), outliers.max()], sampled])[:max_outliers]
+
+
+def outlier_sample(column, summary, max_outliers=100, seed=0):
+    """
+    Pick the outliers of a column to draw: all of them up to `max_outliers`, else a
+    random sample that always keeps the two most extreme values.
+
+    Parameters:
+    - column: pd.Series
+        The column's values.
+    - summary: pd.Series
+        The column's row of `box_summaries`.
+    - max_outliers: int, optional
+        Maximum number of outliers returned. Default is 100.
+    - seed: int, optional
+        Seed of the random generator. Default is 0.
+
+    Returns:
+    - np.ndarray
+        The outlier values to draw.
+    """
+    values = column.to_numpy(dtype=float)
+    outliers = values[(values < summary['lower_fence']) | (values > summary['upper_fence'])]
+    return _capped(outliers, max_outliers, seed=seed)
+
+
+def detect_outliers_iqr(data, summaries=None):
+    """
+    Flag values outside the 1.5 IQR fences.
+
+    Without `summaries`, the fences are computed from all values of `data` together, so a
+    DataFrame is checked against one set of fences. With `summaries`, every column of
+    the DataFrame is checked against its own fences.
+
+    Parameters:
+    - data: pd.Series, polars.Series, array-like or pd.DataFrame
+        The values to check.
+    - summaries: pd.DataFrame, optional
+        Precomputed `box_summaries` of a DataFrame, e.g. the ones returned by `box_plots`,
+        giving per-column fences without computing the quantiles again. Default is None.
+
+    Returns:
+    - Boolean mask of the same shape as `data`, True for outliers.
+    """
+    if summaries is not None:
+        values = data[summaries.index]
+        return values.lt(summaries['lower_fence'], axis=1) | values.gt(summaries['upper_fence'], axis=1)
+
+    Q1, Q3 = get_backend(data).percentiles(data, [25, 75])
     IQR = Q3 - Q1
     lower_bound = Q1 - 1.5 * IQR
     upper_bound = Q3 + 1.5 * IQR
     outliers = (data < lower_bound) | (data > upper_bound)
-    return outliers
\ No newline at end of file
+    return outliers
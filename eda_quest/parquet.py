@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import os
+import glob
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+
+def resolve_parquet_files(source):
+    """
+    Expand a Parquet source into the list of files it refers to.
+
+    Parameters:
+    - source: str, os.PathLike or list
+        A Parquet file, a directory holding a (possibly partitioned) Parquet dataset,
+        or a list of either.
+
+    Returns:
+    - list
+        Sorted list of Parquet file paths.
+    """
+    if isinstance(source, (list, tuple)):
+        files = []
+        for item in source:
+            files.extend(resolve_parquet_files(item))
+        return files
+
+    source = os.fspath(source)
+    if os.path.isdir(source):
+        pattern = os.path.join(source, '**', '*.parquet')
+        return sorted(glob.glob(pattern, recursive=True))
+    return [source]
+
+
+def _is_numeric(arrow_type):
+    return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type)
+
+
+def _is_string(arrow_type):
+    return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type) or pa.types.is_dictionary(arrow_type)
+
+
+def arrow_schema(source):
+    """
+    Return the Arrow schema of a Parquet source or pyarrow Table without reading column data.
+
+    Parameters:
+    - source: str, os.PathLike, list or pyarrow.Table
+        The Parquet source to inspect.
+
+    Returns:
+    - pyarrow.Schema
+        The unified schema. Columns are ordered by first appearance across files.
+    """
+    if isinstance(source, pa.Table):
+        return source.schema
+    fields = {}
+    for path in resolve_parquet_files(source):
+        for field in pq.read_schema(path):
+            fields.setdefault(field.name, field)
+    return pa.schema(list(fields.values()))
+
+
+def footer_statistics(source):
+    """
+    Collect per-column row counts, null counts and min/max values from Parquet footers.
+
+    Only the file footers are read. For a pyarrow Table the null counts come from the
+    array metadata and min/max from a single vectorised kernel per column.
+
+    Parameters:
+    - source: str, os.PathLike, list or pyarrow.Table
+        The Parquet source to inspect.
+
+    Returns:
+    - pd.DataFrame
+        One row per column with 'Rows', 'Null Count', 'Min' and 'Max', plus
+        'Has Null Count' and 'Has Min Max' flags telling whether every row group
+        carried the statistic. Missing statistics are reported as None.
+    """
+    schema = arrow_schema(source)
+
+    if isinstance(source, pa.Table):
+        records = {}
+        for name in schema.names:
+            column = source.column(name)
+            minimum = maximum = None
+            if column.null_count < len(column) and (_is_numeric(column.type) or pa.types.is_string(column.type)):
+                min_max = pc.min_max(column)
+                minimum, maximum = min_max['min'].as_py(), min_max['max'].as_py()
+            records[name] = {
+                'Rows': source.num_rows,
+                'Null Count': column.null_count,
+                'Min': minimum,
+                'Max': maximum,
+                'Has Null Count': True,
+                'Has Min Max': True,
+            }
+        return pd.DataFrame.from_dict(records, orient='index')
+
+    records = {name: {'Rows': 0, 'Null Count': 0, 'Min': None, 'Max': None,
+                      'Has Null Count': True, 'Has Min Max': True} for name in schema.names}
+    for path in resolve_parquet_files(source):
+        metadata = pq.read_metadata(path)
+        seen = set()
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            for j in range(row_group.num_columns):
+                chunk = row_group.column(j)
+                name = chunk.path_in_schema
+                if name not in records:
+                    # Nested leaves are not summarised from footers
+                    continue
+                seen.add(name)
+                record = records[name]
+                stats = chunk.statistics
+                if stats is None or not stats.has_null_count:
+                    record['Has Null Count'] = False
+                    record['Has Min Max'] = False
+                    continue
+                record['Null Count'] += stats.null_count
+                if stats.has_min_max:
+                    if record['Min'] is None or stats.min < record['Min']:
+                        record['Min'] = stats.min
+                    if record['Max'] is None or stats.max > record['Max']:
+                        record['Max'] = stats.max
+                elif stats.null_count < row_group.num_rows:
+                    record['Has Min Max'] = False
+
+        # A column absent from a file contributes only nulls for that file's rows
+        for name, record in records.items():
+            record['Rows'] += metadata.num_rows
+            if name not in seen:
+                record['Null Count'] += metadata.num_rows
+
+    return pd.DataFrame.from_dict(records, orient='index')
+
+
+def open_parquet_files(source):
+    """
+    Open every file of a Parquet source once, parsing each footer a single time.
+
+    Parameters:
+    - source: str, os.PathLike, list or pyarrow.Table
+        The Parquet source to open.
+
+    Returns:
+    - list or None
+        One `pyarrow.parquet.ParquetFile` per file, in `resolve_parquet_files` order.
+        None for a pyarrow Table, which has no files.
+    """
+    if isinstance(source, pa.Table):
+        return None
+    return [pq.ParquetFile(path) for path in resolve_parquet_files(source)]
+
+
+def read_columns(source, names, schema=None, files=None):
+    """
+    Decode several columns of a Parquet source, reading each file once.
+
+    Parameters:
+    - source: str, os.PathLike, list or pyarrow.Table
+        The Parquet source to read from.
+    - names: list
+        The columns to decode.
+    - schema: pyarrow.Schema, optional
+        Precomputed output of `arrow_schema`, to avoid re-reading footers. Default is None.
+    - files: list, optional
+        Precomputed output of `open_parquet_files`, to avoid reopening the files. Default is None.
+
+    Returns:
+    - dict
+        Maps each name to a pyarrow.ChunkedArray, with nulls standing in for files that
+        lack the column.
+    """
+    names = list(names)
+    if isinstance(source, pa.Table):
+        return {name: source.column(name) for name in names}
+
+    if schema is None:
+        schema = arrow_schema(source)
+    if files is None:
+        files = open_parquet_files(source) if names else []
+    types = {name: schema.field(name).type for name in names}
+    chunks = {name: [] for name in names}
+    for parquet_file in files:
+        present = [name for name in names if name in parquet_file.schema_arrow.names]
+        table = parquet_file.read(columns=present) if present else None
+        for name in names:
+            if name in present:
+                chunks[name].extend(table.column(name).cast(types[name]).chunks)
+            else:
+                chunks[name].append(pa.nulls(parquet_file.metadata.num_rows, type=types[name]))
+    return {name: pa.chunked_array(chunks[name], type=types[name]) for name in names}
+
+
+def read_column(source, name, schema=None, files=None):
+    """
+    Decode a single column of a Parquet source.
+
+    Parameters:
+    - source: str, os.PathLike, list or pyarrow.Table
+        The Parquet source to read from.
+    - name: str
+        The column to decode.
+    - schema: pyarrow.Schema, optional
+        Precomputed output of `arrow_schema`, to avoid re-reading footers. Default is None.
+    - files: list, optional
+        Precomputed output of `open_parquet_files`, to avoid reopening the files. Default is None.
+
+    Returns:
+    - pyarrow.ChunkedArray
+        The column data, with nulls standing in for files that lack the column.
+    """
+    return read_columns(source, [name], schema, files)[name]
+
+
+def missing_info(source):
+    """
+    Build the missing-data table of `visualize_missing_data` from Parquet footers.
+
+    Columns whose footers lack null counts are decoded to count their nulls.
+
+    Parameters:
+    - source: str, os.PathLike, list or pyarrow.Table
+        The Parquet source to inspect.
+
+    Returns:
+    - pd.DataFrame
+        'Total Missing' and 'Percent Missing' for columns with at least one missing value,
+        sorted by 'Percent Missing' in descending order.
+    """
+    stats = footer_statistics(source)
+    schema = arrow_schema(source)
+    total_missing = stats['Null Count'].astype('int64')
+    unknown = stats.index[~stats['Has Null Count'].astype(bool)]
+    for name, column in read_columns(source, unknown, schema).items():
+        total_missing[name] = column.null_count
+
+    num_rows = int(stats['Rows'].max()) if len(stats) else 0
+    percent_missing = (total_missing / num_rows) * 100 if num_rows else total_missing * 0.0
+
+    info = pd.DataFrame({'Total Missing': total_missing, 'Percent Missing': percent_missing})
+    return info[info['Total Missing'] > 0].sort_values(by='Percent Missing', ascending=False)
+
+
+def null_mask(source, stats=None):
+    """
+    Build the boolean missing-value frame used for the missing-data heatmap.
+
+    Columns the footers report as fully populated or fully missing are filled
+    without decoding. Only the remaining columns are read.
+
+    Parameters:
+    - source: str, os.PathLike, list or pyarrow.Table
+        The Parquet source to inspect.
+    - stats: pd.DataFrame, optional
+        Precomputed output of `footer_statistics`. Default is None.
+
+    Returns:
+    - pd.DataFrame
+        Boolean frame with True where a value is missing.
+    """
+    if stats is None:
+        stats = footer_statistics(source)
+    schema = arrow_schema(source)
+    num_rows = int(stats['Rows'].max()) if len(stats) else 0
+
+    known = stats['Has Null Count'].astype(bool)
+    undecided = stats.index[~(known & stats['Null Count'].isin([0, num_rows]))]
+    decoded = read_columns(source, undecided, schema)
+
+    mask = {}
+    for name, record in stats.iterrows():
+        if name in decoded:
+            mask[name] = pd.Series(pc.is_null(decoded[name]).to_numpy(zero_copy_only=False))
+        else:
+            mask[name] = pd.Series(record['Null Count'] == num_rows, index=pd.RangeIndex(num_rows))
+    return pd.DataFrame(mask, index=pd.RangeIndex(num_rows))
+
+
+def string_frame(source):
+    """
+    Decode only the string columns of a Parquet source into a DataFrame.
+
+    Parameters:
+    - source: str, os.PathLike, list or pyarrow.Table
+        The Parquet source to read from.
+
+    Returns:
+    - pd.DataFrame
+        Object-dtype frame holding the string columns.
+    """
+    schema = arrow_schema(source)
+    names = [field.name for field in schema if _is_string(field.type)]
+    columns = {name: pd.Series(column.to_pylist(), dtype=object)
+               for name, column in read_columns(source, names, schema).items()}
+    return pd.DataFrame(columns)
+
+
+def numeric_columns(source):
+    """
+    List the numeric columns of a Parquet source from its schema.
+
+    Parameters:
+    - source: str, os.PathLike, list or pyarrow.Table
+        The Parquet source to inspect.
+
+    Returns:
+    - list
+        Names of integer, floating point and decimal columns.
+    """
+    return [field.name for field in arrow_schema(source) if _is_numeric(field.type)]
+
+
+def parquet_summary(source):
+    """
+    Compute the `dataframe_summary` results for a Parquet source or pyarrow Table.
+
+    Row counts, null counts and min/max are answered from the footers. Numeric
+    columns are decoded for mean, standard deviation and quartiles, and other columns
+    only when their distinct count cannot be inferred from the footers. All decoded
+    columns are read together, opening each file once.
+
+    Parameters:
+    - source: str, os.PathLike, list or pyarrow.Table
+        The Parquet source to analyze.
+
+    Returns:
+    - dict
+        Same keys as `dataframe_summary`. 'Number of Duplicates' is None because it
+        needs every row decoded, and 'Histograms' is empty.
+    """
+    stats = footer_statistics(source)
+    schema = arrow_schema(source)
+
+    # Columns the footers cannot answer: unknown null counts, numeric statistics and
+    # distinct counts other than the trivial all-null or single-value cases
+    unknown = stats.index[~stats['Has Null Count'].astype(bool)]
+    single = stats['Has Min Max'].astype(bool) & stats['Min'].notna() & (stats['Min'] == stats['Max'])
+    needed = [field.name for field in schema
+              if field.name in unknown or _is_numeric(field.type)
+              or not (single[field.name] or stats.loc[field.name, 'Null Count'] == stats.loc[field.name, 'Rows'])]
+    decoded = read_columns(source, needed, schema)
+
+    missing_values = stats['Null Count'].astype('int64')
+    for name in unknown:
+        missing_values[name] = decoded[name].null_count
+
+    summary = {}
+    num_unique = {}
+    for field in schema:
+        name = field.name
+        record = stats.loc[name]
+        rows = int(record['Rows'])
+        non_null = rows - int(missing_values[name])
+
+        if _is_numeric(field.type):
+            column = decoded[name]
+            quartiles = [None, None, None]
+            if non_null:
+                quartiles = pc.quantile(column, q=[0.25, 0.5, 0.75], interpolation='linear').to_pylist()
+            has_min_max = record['Has Min Max'] and record['Min'] is not None
+            summary[name] = {
+                'count': float(non_null),
+                'mean': pc.mean(column).as_py(),
+                'std': pc.stddev(column, ddof=1).as_py(),
+                'min': record['Min'] if has_min_max else pc.min(column).as_py(),
+                '25%': quartiles[0],
+                '50%': quartiles[1],
+                '75%': quartiles[2],
+                'max': record['Max'] if has_min_max else pc.max(column).as_py(),
+            }
+            num_unique[name] = pc.count_distinct(column, mode='only_valid').as_py()
+        elif non_null == 0:
+            num_unique[name] = 0
+        elif record['Has Min Max'] and record['Min'] is not None and record['Min'] == record['Max']:
+            num_unique[name] = 1
+        else:
+            num_unique[name] = pc.count_distinct(decoded[name], mode='only_valid').as_py()
+
+    summary_stats = pd.DataFrame(summary, index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'], dtype=float)
+
+    return {
+        'Summary Statistics': summary_stats,
+        'Data Types and Missing Values': None,
+        'Number of Unique Values': pd.Series(num_unique, index=schema.names, dtype='int64'),
+        'Missing Values': missing_values.reindex(schema.names),
+        'Number of Duplicates': None,
+        'Histograms': {},
+    }
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import os
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from eda_quest.chunks import DEFAULT_CHUNKSIZE, iter_chunks
+from eda_quest.profile import merge_profiles, profile_dataframe
+
+# Seconds a blocked reader waits before checking whether the pipeline was stopped
+PUT_TIMEOUT = 0.1
+
+
+def _put(chunks, item, stop):
+    # Block while the queue is full, but give up once the pipeline is stopped
+    while not stop.is_set():
+        try:
+            chunks.put(item, timeout=PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _read_file(path, chunks, stop, chunksize, columns):
+    # Parse one file into the shared queue, then signal the end of the file with None
+    try:
+        for chunk in iter_chunks(path, chunksize=chunksize, columns=columns):
+            if not _put(chunks, (path, chunk), stop):
+                return
+    finally:
+        _put(chunks, (path, None), stop)
+
+
+def profile_files(paths, chunksize=DEFAULT_CHUNKSIZE, columns=None, top_k=50, read_workers=4,
+                  profile_workers=None, max_pending=None, return_files=False):
+    """
+    Profile a dataset made of many CSV or Parquet files concurrently.
+
+    Files are read and parsed into chunks by a thread pool, since reading is I/O-bound,
+    and the chunks are profiled by a process pool, since profiling is CPU-bound. Parsed
+    chunks wait in a bounded queue and at most `max_pending` chunks are being profiled
+    at a time, so memory stays flat at about `2 * max_pending` chunks regardless of the
+    number or size of the files. Chunk profiles are merged with `merge_profiles` into
+    one profile per file and one for the whole dataset.
+
+    Parameters:
+    - paths: list of str or os.PathLike
+        CSV files, Parquet files or Parquet dataset directories.
+    - chunksize: int, optional
+        Maximum number of rows per chunk. Default is 100,000.
+    - columns: list, optional
+        Columns to read. Default is None (all columns).
+    - top_k: int, optional
+        Number of most frequent values kept per non-numeric column. Default is 50.
+    - read_workers: int, optional
+        Number of reader threads. Default is 4.
+    - profile_workers: int, optional
+        Number of profiling processes. Default is None (one per CPU). With 0, chunks are
+        profiled in the calling process.
+    - max_pending: int, optional
+        Bound on queued and in-flight chunks. Default is None (twice the number of workers).
+    - return_files: bool, optional
+        Whether to also return the per-file profiles. Default is False.
+
+    Returns:
+    - dict or tuple
+        The dataset profile, or (dataset profile, dict of profiles by path) when
+        `return_files` is True.
+    """
+    paths = [os.fspath(path) for path in paths]
+    if profile_workers is None:
+        profile_workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = 2 * max(profile_workers, 1)
+
+    chunks = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+    parts = {path: [] for path in paths}
+    pending = {}
+
+    def collect(done):
+        for future in done:
+            parts[pending.pop(future)].append(future.result())
+
+    pool_context = ProcessPoolExecutor(max_workers=profile_workers) if profile_workers else nullcontext()
+    with ThreadPoolExecutor(max_workers=read_workers) as readers, pool_context as pool:
+        reads = [readers.submit(_read_file, path, chunks, stop, chunksize, columns) for path in paths]
+        try:
+            remaining = len(paths)
+            while remaining:
+                path, chunk = chunks.get()
+                if chunk is None:
+                    remaining -= 1
+                elif pool is None:
+                    parts[path].append(profile_dataframe(chunk, top_k=top_k))
+                else:
+                    if len(pending) >= max_pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    pending[pool.submit(profile_dataframe, chunk, top_k=top_k)] = path
+            collect(wait(pending).done)
+            # Surface errors raised while reading
+            for read in reads:
+                read.result()
+        except BaseException:
+            stop.set()
+            raise
+
+    files = {path: merge_profiles(parts[path], top_k=top_k) for path in paths}
+    dataset = merge_profiles(files.values(), top_k=top_k)
+    return (dataset, files) if return_files else dataset
@@ -1,7 +1,10 @@
 
 # Import the necessary libraries
-import seaborn as sns
-import matplotlib.pyplot as plt
+import numpy as np
+from eda_quest.association import rank_features
+from eda_quest.outlier import box_summaries
+from eda_quest.sampling import sampled_frame
+from eda_quest.utils import plotting_modules
 
 
 def bar_plots(
@@ -10,7 +13,9 @@ def bar_plots(
     hue=None, 
     subplot_height=3, 
     subplot_width=4, 
-    plots_per_row=2
+    plots_per_row=2,
+    fast=False,
+    sample=None
 ) -> None:
     """
     Generates bar charts for categorical columns in a DataFrame.
@@ -26,6 +31,12 @@ def bar_plots(
     Returns:
         None
     """
+    # Load the plotting libraries on first use
+    plt, sns = plotting_modules()
+
+    # Plot a cached random sample of the rows in fast mode
+    dataframe = sampled_frame(dataframe, fast=fast, sample=sample)
+
     # If categorical_columns is None, get categorical columns from the DataFrame
     if categorical_columns is None:
         categorical_columns = dataframe.select_dtypes(include=['object']).columns.tolist()
@@ -70,7 +81,9 @@ def histogram_plots(
     kde=False, 
     subplot_height=2, 
     subplot_width=4, 
-    plots_per_row=2
+    plots_per_row=2,
+    fast=False,
+    sample=None
 ) -> None:
     """
     Generate histogram plots for numeric columns in a given DataFrame.
@@ -86,6 +99,12 @@ def histogram_plots(
     Returns:
         None
     """
+    # Load the plotting libraries on first use
+    plt, sns = plotting_modules()
+
+    # Plot a cached random sample of the rows in fast mode
+    dataframe = sampled_frame(dataframe, fast=fast, sample=sample)
+
     # If numeric_columns is None, get the numeric columns in the DataFrame
     if numeric_columns is None:
         numeric_columns = dataframe.select_dtypes(include=[np.number]).columns
@@ -134,7 +153,9 @@ def count_plots(
     categorical_columns=None, 
     subplot_height=3, 
     subplot_width=4, 
-    plots_per_row=2
+    plots_per_row=2,
+    fast=False,
+    sample=None
 ) -> None:
     """
     Generate a count plot for each categorical column in the given DataFrame.
@@ -151,6 +172,12 @@ def count_plots(
     Returns:
         None
     """
+    # Load the plotting libraries on first use
+    plt, sns = plotting_modules()
+
+    # Plot a cached random sample of the rows in fast mode
+    dataframe = sampled_frame(dataframe, fast=fast, sample=sample)
+
     # If categorical_columns is None, get the categorical columns in the DataFrame
     if categorical_columns is None:
         categorical_columns = dataframe.select_dtypes(include=['object']).columns.tolist()
@@ -190,7 +217,11 @@ def scatter_plots(
     hue=None, 
     subplot_height=3, 
     subplot_width=6, 
-    plots_per_row=2
+    plots_per_row=2,
+    top_k=None,
+    method='spearman',
+    fast=False,
+    sample=None
 ) -> None:
     """
     Create scatter plots for numeric columns in a dataframe against a target column.
@@ -204,15 +235,29 @@ def scatter_plots(
         subplot_height (int): Optional. The height of each subplot in inches.
         subplot_width (int): Optional. The width of each subplot in inches.
         plots_per_row (int): Optional. The number of plots per row.
+        top_k (int): Optional. Only plot the k columns most strongly associated with the target,
+                     strongest first. If None, all columns are plotted in their original order.
+        method (str): Optional. 'pearson' or 'spearman', used to rank columns when top_k is set.
         
     Returns:
         None
     """
+    # Load the plotting libraries on first use
+    plt, sns = plotting_modules()
+
+    # Plot a cached random sample of the rows in fast mode
+    dataframe = sampled_frame(dataframe, fast=fast, sample=sample)
+
     # If numeric_columns is None, get the numeric columns in the DataFrame excluding the target column
     if numeric_columns is None:
         numeric_columns = [col for col in dataframe.columns if col != target_column 
                            and np.issubdtype(dataframe[col].dtype, np.number)]
 
+    # Keep only the features most associated with the target
+    if top_k is not None:
+        numeric_columns = rank_features(dataframe, target_column, columns=numeric_columns,
+                                        method=method, top_k=top_k).index.tolist()
+
     # Calculate the number of rows needed for the subplots
     num_rows = len(numeric_columns) // plots_per_row + (len(numeric_columns) % plots_per_row > 0)
 
@@ -248,44 +293,80 @@ def box_plots(
     numeric_columns=None, 
     subplot_height=3, 
     subplot_width=10, 
-    plots_per_row=2
-) -> None:
+    plots_per_row=2,
+    max_outliers=100,
+    fast=False,
+    sample=None
+):
     """
     Generates a set of box plots for numeric columns in a given DataFrame.
 
+    The boxes are drawn with `ax.bxp` from `eda_quest.outlier.box_summaries`, computed for
+    all columns in one vectorised quantile pass, so the raw columns are never handed to
+    the plotting libraries and drawing cost depends on the number of columns only.
+
     Parameters:
     - dataframe: The DataFrame containing the data for the box plots.
     - numeric_columns: A list of column names containing numeric data. If None, all numeric columns in the DataFrame will be used.
     - subplot_height: The height of each subplot in inches. Default is 3.
     - subplot_width: The width of each subplot in inches. Default is 10.
     - plots_per_row: The number of box plots to display per row. Default is 2.
+    - max_outliers: The maximum number of outliers drawn per box; beyond it a random sample including the extremes is drawn. Default is 100.
+    - fast: Whether to plot a cached random sample of the rows. Default is False.
+    - sample: Sample size to use instead of the default, or a sample from `draw_sample`. Default is None.
 
     Returns:
-    None
+    pd.DataFrame: The box summaries, which `detect_outliers_iqr` accepts as `summaries`.
     """
+    # Load the plotting libraries on first use
+    plt, _ = plotting_modules()
+
+    # Plot a cached random sample of the rows in fast mode
+    dataframe = sampled_frame(dataframe, fast=fast, sample=sample)
+
     # If numeric_columns is None, get the numeric columns in the DataFrame
     if numeric_columns is None:
-        numeric_columns = dataframe.select_dtypes(include=[np.number]).columns
+        numeric_columns = dataframe.select_dtypes(include=[np.number]).columns.tolist()
+
+    # Five-number summaries, fences, whisker ends and the outliers to draw for all columns at once
+    summaries = box_summaries(dataframe, numeric_columns, max_outliers=max_outliers)
 
     # Calculate the number of rows needed for the subplots
-    num_rows = len(numeric_columns) // plots_per_row + (len(numeric_columns) % plots_per_row)
+    num_rows = len(numeric_columns) // plots_per_row + (len(numeric_columns) % plots_per_row > 0)
 
     # Calculate the total figure height based on the number of rows and subplot height
     fig_height = num_rows * subplot_height
 
     # Calculate the number of columns based on the specified plots_per_row
-    num_cols = min(plots_per_row, len(numeric_columns))
+    num_cols = max(1, min(plots_per_row, len(numeric_columns)))
 
-    # Create subplots with the specified height and width
-    fig, axes = plt.subplots(nrows=num_rows, ncols=num_cols, figsize=(subplot_width * num_cols, fig_height))
+    # Create subplots with the specified height and width; axes stay 2-D for a single row or column
+    fig, axes = plt.subplots(nrows=max(num_rows, 1), ncols=num_cols, figsize=(subplot_width * num_cols, max(fig_height, subplot_height)), squeeze=False)
 
-    # Loop through each numeric column and create a box plot
+    # Loop through each numeric column and draw its box from the summary
     for i, col in enumerate(numeric_columns):
         row = i // num_cols  # Calculate the row index
         col_num = i % num_cols  # Calculate the column index
-        sns.boxplot(data=dataframe, x=col, ax=axes[row, col_num])
+        summary = summaries.loc[col]
         axes[row, col_num].set_title(f'Box Plot of {col}')
         axes[row, col_num].set_xlabel(col)
+        if not summary['count']:
+            continue
+        stats = {
+            'label': col,
+            'med': summary['median'],
+            'q1': summary['q1'],
+            'q3': summary['q3'],
+            'whislo': summary['whislo'],
+            'whishi': summary['whishi'],
+            'fliers': summary['fliers'],
+        }
+        try:
+            axes[row, col_num].bxp([stats], orientation='horizontal', showfliers=True)
+        except TypeError:
+            # matplotlib < 3.10 has no `orientation`
+            axes[row, col_num].bxp([stats], vert=False, showfliers=True)
+        axes[row, col_num].set_yticks([])
 
     # Remove empty subplots if the number of plots is odd
     if len(numeric_columns) % num_cols != 0:
@@ -293,4 +374,5 @@ def box_plots(
             fig.delaxes(axes[num_rows - 1, j])
 
     plt.tight_layout()
-    plt.show()
\ No newline at end of file
+    plt.show()
+    return summaries
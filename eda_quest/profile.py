@@ -0,0 +1,557 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import json
+import numpy as np
+import pandas as pd
+from eda_quest.backends import get_backend
+
+# Probabilities at which quantile sketches are kept
+SKETCH_GRID = np.linspace(0.0, 1.0, 101)
+
+# Odd 64-bit multiplier (golden ratio) mixing a value's hash with its group's hash
+HASH_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def quantile_label(q):
+    """
+    Format a quantile the way `describe` does, e.g. 0.25 -> '25%'.
+    """
+    return f"{q * 100:g}%"
+
+
+def merge_quantile_sketches(sketches, counts, probs=SKETCH_GRID, grid=SKETCH_GRID):
+    """
+    Merge quantile sketches of disjoint parts of a column into quantiles of the whole.
+
+    Each sketch holds the values of one part at the probabilities in `grid`. The parts'
+    CDFs, interpolated between sketch points, are mixed in proportion to their counts
+    and the mixture is inverted at `probs`.
+
+    Parameters:
+    - sketches: list of np.ndarray
+        Sorted values at `grid` for each part.
+    - counts: list of int
+        Number of non-missing values in each part.
+    - probs: array-like, optional
+        Probabilities to return. Default is the 101-point sketch grid.
+    - grid: array-like, optional
+        Probabilities the sketches were taken at. Default is the 101-point sketch grid.
+
+    Returns:
+    - np.ndarray
+        Values at `probs`, NaN if all parts are empty.
+    """
+    parts = [(np.asarray(sketch, dtype=float), count) for sketch, count in zip(sketches, counts)
+             if count > 0 and not np.isnan(sketch).all()]
+    probs = np.asarray(probs, dtype=float)
+    if not parts:
+        return np.full(len(probs), np.nan)
+    if len(parts) == 1:
+        return np.interp(probs, grid, parts[0][0])
+
+    points = np.unique(np.concatenate([sketch for sketch, _ in parts]))
+    total = sum(count for _, count in parts)
+    cdf = np.zeros(len(points))
+    for sketch, count in parts:
+        cdf += count * np.interp(points, sketch, grid, left=0.0, right=1.0)
+    cdf /= total
+    # Flat stretches of the CDF would make the inversion ambiguous
+    cdf, first = np.unique(cdf, return_index=True)
+    return np.interp(probs, cdf, points[first])
+
+
+def _interp_rows(x, xp, fp):
+    """
+    `np.interp` applied row by row: `x` is (rows, m), `xp` and `fp` are (rows, k) and
+    every row of `xp` is non-decreasing. Values outside a row's `xp` take its first or
+    last `fp`.
+    """
+    rows, k = xp.shape
+    # Rescale every row to [0, 1] and shift it by 2 * row so one searchsorted covers all rows
+    lo = np.minimum(xp[:, :1], x.min(axis=1, keepdims=True))
+    span = np.maximum(xp[:, -1:], x.max(axis=1, keepdims=True)) - lo
+    span[span == 0] = 1.0
+    offset = 2.0 * np.arange(rows)[:, None]
+    position = np.searchsorted(((xp - lo) / span + offset).ravel(), ((x - lo) / span + offset).ravel(),
+                               side='right').reshape(x.shape) - k * np.arange(rows)[:, None]
+
+    lower = np.clip(position - 1, 0, k - 2)
+    x0, x1 = np.take_along_axis(xp, lower, axis=1), np.take_along_axis(xp, lower + 1, axis=1)
+    f0, f1 = np.take_along_axis(fp, lower, axis=1), np.take_along_axis(fp, lower + 1, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weight = np.where(x1 > x0, np.clip((x - x0) / (x1 - x0), 0.0, 1.0), 0.0)
+    values = f0 + weight * (f1 - f0)
+    values = np.where(position == 0, fp[:, :1], values)
+    return np.where(position == k, fp[:, -1:], values)
+
+
+def merge_sketch_rows(sketch_a, sketch_b, count_a, count_b):
+    """
+    Merge two quantile sketches per row, e.g. one row per group, in one vectorised pass.
+
+    Row by row, this is `merge_quantile_sketches([sketch_a[i], sketch_b[i]], [count_a[i], count_b[i]])`
+    on the 101-point sketch grid.
+
+    Parameters:
+    - sketch_a, sketch_b: np.ndarray
+        (rows x 101) sketches; rows of empty parts may be NaN.
+    - count_a, count_b: np.ndarray
+        Number of non-missing values behind each row of `sketch_a` and `sketch_b`.
+
+    Returns:
+    - np.ndarray
+        (rows x 101) merged sketches, NaN for rows where both parts are empty.
+    """
+    sketch_a, sketch_b = np.asarray(sketch_a, dtype=float), np.asarray(sketch_b, dtype=float)
+    count_a, count_b = np.asarray(count_a, dtype=float), np.asarray(count_b, dtype=float)
+    merged = np.where((count_a > 0)[:, None], sketch_a, np.where((count_b > 0)[:, None], sketch_b, np.nan))
+    both = (count_a > 0) & (count_b > 0)
+    if both.any():
+        a, b = sketch_a[both], sketch_b[both]
+        n_a, n_b = count_a[both][:, None], count_b[both][:, None]
+        grid = np.broadcast_to(SKETCH_GRID, a.shape)
+        points = np.sort(np.concatenate([a, b], axis=1), axis=1)
+        cdf = (n_a * _interp_rows(points, a, grid) + n_b * _interp_rows(points, b, grid)) / (n_a + n_b)
+        merged[both] = _interp_rows(grid, cdf, points)
+    return merged
+
+
+def _sketch_quantile(sketches, q):
+    # Value at probability q of every row of a (rows x 101) sketch array
+    position = np.interp(q, SKETCH_GRID, np.arange(len(SKETCH_GRID)))
+    lower = min(int(position), len(SKETCH_GRID) - 2)
+    return sketches[:, lower] + (position - lower) * (sketches[:, lower + 1] - sketches[:, lower])
+
+
+def _row_hashes(values):
+    """
+    64-bit hash of every row of a Series or DataFrame. Numbers are hashed as floats so
+    that e.g. 1 and 1.0 match across chunks read with different dtypes.
+    """
+    def hashable(series):
+        numeric = pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+        return series.astype(float) if numeric else series
+
+    if isinstance(values, pd.DataFrame):
+        values = pd.DataFrame({column: hashable(values[column]) for column in values.columns})
+    else:
+        values = hashable(values)
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+def _numeric(df, columns):
+    return [column for column in columns
+            if pd.api.types.is_numeric_dtype(df[column]) and not pd.api.types.is_bool_dtype(df[column])]
+
+
+def _tidy(stats, columns, quantiles):
+    """
+    Turn a dict of stat -> (groups x columns) frames into a tidy (group, column) x stat frame.
+    """
+    order = ['count', 'nulls', 'mean', 'std', 'min'] + [quantile_label(q) for q in quantiles] + ['max', 'distinct']
+    groups = stats['count'].index
+    keys = [group if isinstance(group, tuple) else (group,) for group in groups]
+    index = pd.MultiIndex.from_tuples(
+        [key + (column,) for key in keys for column in columns],
+        names=list(groups.names) + ['column'],
+    )
+
+    tidy = {}
+    for stat in order:
+        values = stats[stat].reindex(index=groups, columns=columns).to_numpy(dtype=float)
+        tidy[stat] = pd.Series(values.reshape(-1), index=index)
+    result = pd.DataFrame(tidy)
+    for stat in ('count', 'nulls', 'distinct'):
+        result[stat] = result[stat].astype('int64')
+    return result
+
+
+def _grouped_frames(df, by, columns, quantiles):
+    """
+    Compute every grouped statistic from one pandas GroupBy object.
+    """
+    grouped = df.groupby(by, sort=True, dropna=False, observed=True)
+    numeric = _numeric(df, columns)
+    size = grouped.size()
+    count = grouped[columns].count()
+    stats = {
+        'count': count,
+        'nulls': count.rsub(size, axis=0),
+        'mean': grouped[numeric].mean(),
+        'std': grouped[numeric].std(),
+        'min': grouped[numeric].min(),
+        'max': grouped[numeric].max(),
+        'distinct': grouped[columns].nunique(),
+    }
+    if quantiles:
+        values = grouped[numeric].quantile(list(quantiles))
+        for q in quantiles:
+            stats[quantile_label(q)] = values.xs(q, level=-1)
+    return stats
+
+
+def grouped_summary(data, by, columns=None, quantiles=(0.25, 0.5, 0.75)):
+    """
+    Profile every group of a DataFrame in a single groupby-aggregate pass.
+
+    Counts, missing values, mean, standard deviation, min/max, quantiles and distinct
+    counts are computed for every (group, column) pair from one grouping of the data
+    instead of one scan per group. Polars inputs run all aggregations in one
+    multithreaded query.
+
+    An iterable of chunks (e.g. from `eda_quest.chunks.iter_chunks`) is profiled in
+    streaming fashion: counts, moments and min/max are merged exactly, and quantiles
+    are merged from 101-point per-chunk sketches. Distinct counts are exact (up to
+    64-bit hash collisions): every distinct (group, value) pair is kept as one hash in a
+    set per column, about 100 bytes of memory per pair, and each chunk only looks up its
+    own pairs.
+
+    Parameters:
+    - data: pd.DataFrame, polars.DataFrame, polars.LazyFrame or iterable of pd.DataFrame
+        The data to profile.
+    - by: str or list
+        Column(s) to group by.
+    - columns: list, optional
+        Columns to profile. Default is None (every column not in `by`).
+    - quantiles: tuple, optional
+        Quantiles to report for numeric columns. Default is (0.25, 0.5, 0.75).
+
+    Returns:
+    - pd.DataFrame
+        Tidy frame indexed by the group key(s) and 'column', with one column per statistic.
+        Statistics that do not apply to a column (e.g. mean of text) are NaN.
+    """
+    keys = [by] if isinstance(by, str) else list(by)
+    if not hasattr(data, 'columns'):
+        return _streaming_grouped_summary(data, keys, columns, quantiles)
+
+    backend = get_backend(data)
+    if columns is None:
+        columns = [column for column in backend.columns(data) if column not in keys]
+    columns = list(columns)
+
+    if backend.name == 'pandas':
+        stats = _grouped_frames(data, keys, columns, quantiles)
+    else:
+        stats = backend.grouped_stats(data, keys, columns, quantiles)
+    return _tidy(stats, columns, quantiles)
+
+
+def _chunk_partials(chunk, keys, columns, numeric, seen):
+    """
+    Mergeable statistics of one chunk: counts, mean, sum of squared deviations,
+    min/max, a quantile sketch and the number of values not seen in earlier chunks
+    per (group, column).
+
+    `seen` maps every column to the set of hashed (group, value) pairs seen so far and
+    is updated in place.
+    """
+    grouped = chunk.groupby(keys, sort=True, dropna=False, observed=True)
+    size = grouped.size()
+    count = grouped[columns].count()
+    partials = {
+        'size': size,
+        'count': count,
+        'mean': grouped[numeric].mean(),
+        'm2': grouped[numeric].var(ddof=0).mul(count[numeric]),
+        'min': grouped[numeric].min(),
+        'max': grouped[numeric].max(),
+        'distinct': {},
+        'sketch': {},
+    }
+
+    codes, group_hashes = grouped.ngroup().to_numpy(), _row_hashes(chunk[keys])
+    for column in columns:
+        valid = chunk[column].notna().to_numpy()
+        pairs = _row_hashes(chunk[column][valid]) * HASH_MIX ^ group_hashes[valid]
+        pairs, first = np.unique(pairs, return_index=True)
+        known = seen.setdefault(column, set())
+        new = np.fromiter((pair not in known for pair in pairs.tolist()), dtype=bool, count=len(pairs))
+        known.update(pairs[new].tolist())
+        partials['distinct'][column] = np.bincount(codes[valid][first[new]], minlength=len(size))
+    partials['distinct'] = pd.DataFrame(partials['distinct'], index=size.index, columns=columns)
+    if numeric:
+        sketch = grouped[numeric].quantile(list(SKETCH_GRID))
+        for column in numeric:
+            partials['sketch'][column] = sketch[column].unstack(level=-1).reindex(index=size.index,
+                                                                                 columns=SKETCH_GRID)
+    return partials
+
+
+def _merge_partials(left, right, numeric):
+    index = left['size'].index.union(right['size'].index)
+
+    def aligned(side, stat):
+        return side[stat].reindex(index)
+
+    n_a, n_b = aligned(left, 'count').fillna(0), aligned(right, 'count').fillna(0)
+    merged = {
+        'size': aligned(left, 'size').fillna(0) + aligned(right, 'size').fillna(0),
+        'count': n_a + n_b,
+        'distinct': aligned(left, 'distinct').fillna(0) + aligned(right, 'distinct').fillna(0),
+        'sketch': {},
+    }
+
+    # Chan et al. parallel update of the mean and the sum of squared deviations
+    na, nb = n_a[numeric], n_b[numeric]
+    total = (na + nb).where(na + nb > 0)
+    mean_a, mean_b = aligned(left, 'mean').fillna(0), aligned(right, 'mean').fillna(0)
+    delta = mean_b - mean_a
+    merged['mean'] = mean_a + delta * nb / total
+    merged['m2'] = aligned(left, 'm2').fillna(0) + aligned(right, 'm2').fillna(0) + delta ** 2 * na * nb / total
+
+    for stat, combine in (('min', np.fmin), ('max', np.fmax)):
+        values = combine(aligned(left, stat).to_numpy(dtype=float), aligned(right, stat).to_numpy(dtype=float))
+        merged[stat] = pd.DataFrame(values, index=index, columns=numeric)
+
+    for column in numeric:
+        rows = merge_sketch_rows(left['sketch'][column].reindex(index).to_numpy(dtype=float),
+                                 right['sketch'][column].reindex(index).to_numpy(dtype=float),
+                                 na[column].to_numpy(), nb[column].to_numpy())
+        merged['sketch'][column] = pd.DataFrame(rows, index=index, columns=SKETCH_GRID)
+    return merged
+
+
+def _restrict_partials(partials, numeric):
+    # Drop the numeric statistics of columns that turned out not to be numeric
+    restricted = {**partials, 'sketch': {column: partials['sketch'][column] for column in numeric}}
+    for stat in ('mean', 'm2', 'min', 'max'):
+        restricted[stat] = partials[stat][numeric]
+    return restricted
+
+
+def _streaming_grouped_summary(chunks, keys, columns, quantiles):
+    partials, numeric, seen = None, None, {}
+    for chunk in chunks:
+        if columns is None:
+            columns = [column for column in chunk.columns if column not in keys]
+        # Chunks are typed one at a time (e.g. a CSV column that is empty in the first
+        # chunk reads as float), so a column stays numeric only while every chunk agrees
+        chunk_numeric = _numeric(chunk, columns)
+        if numeric is None:
+            numeric = chunk_numeric
+        elif not set(numeric) <= set(chunk_numeric):
+            numeric = [column for column in numeric if column in chunk_numeric]
+            if partials is not None:
+                partials = _restrict_partials(partials, numeric)
+        current = _chunk_partials(chunk, keys, columns, numeric, seen)
+        partials = current if partials is None else _merge_partials(partials, current, numeric)
+
+    if partials is None:
+        return pd.DataFrame()
+
+    index = partials['size'].index
+    count = partials['count'].reindex(index).fillna(0)
+    stats = {
+        'count': count,
+        'nulls': count.rsub(partials['size'], axis=0),
+        'mean': partials['mean'],
+        'std': ((partials['m2'] / (count[numeric] - 1)).where(count[numeric] > 1)) ** 0.5,
+        'min': partials['min'],
+        'max': partials['max'],
+        'distinct': partials['distinct'],
+    }
+    for q in quantiles:
+        stats[quantile_label(q)] = pd.DataFrame({
+            column: _sketch_quantile(partials['sketch'][column].to_numpy(dtype=float), q)
+            for column in numeric
+        }, index=index)
+    return _tidy(stats, columns, quantiles)
+
+
+# Version of the persisted profile layout written by `save_profile`
+PROFILE_VERSION = 1
+
+
+def _finite(value):
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+
+def profile_dataframe(df, top_k=50):
+    """
+    Build a compact, persistable profile of a DataFrame.
+
+    Numeric columns keep their count, mean, sum of squared deviations, min/max and a
+    101-point quantile sketch; other columns keep their distinct count and the
+    frequencies of their `top_k` most common values. Profiles can be compared with
+    `eda_quest.drift.compare_profiles` without going back to the raw data.
+
+    Parameters:
+    - df: pd.DataFrame or polars.DataFrame
+        The DataFrame to profile.
+    - top_k: int, optional
+        Number of most frequent values kept per non-numeric column. Default is 50.
+
+    Returns:
+    - dict
+        JSON-serialisable profile with 'version', 'num_rows' and per-column entries under 'columns'.
+    """
+    backend = get_backend(df)
+    if backend.name != 'pandas':
+        df = backend.to_pandas(df)
+
+    numeric = _numeric(df, list(df.columns))
+    counts = df.count()
+    sketches = df[numeric].quantile(list(SKETCH_GRID)) if numeric else None
+    means, variances = df[numeric].mean(), df[numeric].var(ddof=0)
+    minimums, maximums = df[numeric].min(), df[numeric].max()
+
+    columns = {}
+    for column in df.columns:
+        count = int(counts[column])
+        entry = {'count': count, 'nulls': len(df) - count}
+        if column in numeric:
+            entry.update({
+                'type': 'numeric',
+                'mean': _finite(means[column]) if count else None,
+                'm2': _finite(variances[column] * count) if count else None,
+                'min': _finite(minimums[column]) if count else None,
+                'max': _finite(maximums[column]) if count else None,
+                'sketch': [_finite(value) for value in sketches[column]] if count else None,
+            })
+        else:
+            frequencies = df[column].value_counts()
+            top = frequencies.head(top_k)
+            entry.update({
+                'type': 'categorical',
+                'distinct': int(len(frequencies)),
+                'top': {str(value): int(frequency) for value, frequency in top.items()},
+                'other': int(count - top.sum()),
+            })
+        columns[str(column)] = entry
+
+    return {'version': PROFILE_VERSION, 'num_rows': int(len(df)), 'columns': columns}
+
+
+def _merge_numeric(entries):
+    count = sum(entry['count'] for entry in entries)
+    merged = {'type': 'numeric', 'count': count, 'nulls': sum(entry['nulls'] for entry in entries)}
+    parts = [entry for entry in entries if entry['count']]
+    if not parts:
+        merged.update({'mean': None, 'm2': None, 'min': None, 'max': None, 'sketch': None})
+        return merged
+
+    # Chan et al. parallel update of the mean and the sum of squared deviations
+    n, mean, m2 = 0, 0.0, 0.0
+    for entry in parts:
+        delta = entry['mean'] - mean
+        total = n + entry['count']
+        mean += delta * entry['count'] / total
+        m2 += entry['m2'] + delta ** 2 * n * entry['count'] / total
+        n = total
+
+    sketches = [np.array([np.nan if value is None else value for value in entry['sketch']], dtype=float)
+                for entry in parts]
+    merged.update({
+        'mean': _finite(mean),
+        'm2': _finite(m2),
+        'min': min(entry['min'] for entry in parts),
+        'max': max(entry['max'] for entry in parts),
+        'sketch': [_finite(value) for value in
+                   merge_quantile_sketches(sketches, [entry['count'] for entry in parts])],
+    })
+    return merged
+
+
+def _merge_categorical(entries, top_k):
+    count = sum(entry['count'] for entry in entries)
+    totals = {}
+    for entry in entries:
+        for value, frequency in entry.get('top', {}).items():
+            totals[value] = totals.get(value, 0) + frequency
+    top = dict(sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top_k])
+
+    # The union of the values is exact only when every part kept all of its values
+    complete = all(len(entry.get('top', {})) == entry.get('distinct', 0) for entry in entries)
+    distinct = len(totals) if complete else max(entry.get('distinct', 0) for entry in entries)
+    return {
+        'type': 'categorical',
+        'count': count,
+        'nulls': sum(entry['nulls'] for entry in entries),
+        'distinct': distinct,
+        'top': top,
+        'other': count - sum(top.values()),
+    }
+
+
+def merge_profiles(profiles, top_k=50):
+    """
+    Merge profiles of disjoint parts of a dataset (files, chunks) into one profile.
+
+    Counts, means and sums of squared deviations merge exactly; quantile sketches are
+    merged with `merge_quantile_sketches`. Category frequencies are summed over the
+    values each part kept, so they are exact only when the parts kept all of their
+    values, and the distinct count is otherwise a lower bound.
+
+    Parameters:
+    - profiles: iterable of dict
+        Outputs of `profile_dataframe`.
+    - top_k: int, optional
+        Number of most frequent values kept per non-numeric column. Default is 50.
+
+    Returns:
+    - dict
+        The merged profile, with the layout of `profile_dataframe`.
+    """
+    profiles = list(profiles)
+    num_rows = sum(profile['num_rows'] for profile in profiles)
+    names = []
+    for profile in profiles:
+        names.extend(name for name in profile['columns'] if name not in names)
+
+    columns = {}
+    for name in names:
+        entries = []
+        for profile in profiles:
+            entry = profile['columns'].get(name)
+            if entry is None:
+                # A part without the column contributes missing values only
+                entry = {'type': None, 'count': 0, 'nulls': profile['num_rows']}
+            entries.append(entry)
+        # Parts holding only missing values do not decide the column type
+        types = {entry['type'] for entry in entries if entry['count']} or \
+            {entry['type'] for entry in entries if entry['type']}
+        if types == {'numeric'}:
+            columns[name] = _merge_numeric(entries)
+        else:
+            columns[name] = _merge_categorical(entries, top_k)
+
+    return {'version': PROFILE_VERSION, 'num_rows': num_rows, 'columns': columns}
+
+
+def save_profile(profile, path):
+    """
+    Write a profile to a JSON file.
+
+    Parameters:
+    - profile: dict
+        Output of `profile_dataframe`.
+    - path: str
+        Destination file.
+
+    Returns:
+    - None
+    """
+    with open(path, 'w') as profile_file:
+        json.dump(profile, profile_file)
+
+
+def load_profile(path):
+    """
+    Read a profile written by `save_profile`.
+
+    Parameters:
+    - path: str
+        The profile file.
+
+    Returns:
+    - dict
+        The profile.
+    """
+    with open(path) as profile_file:
+        profile = json.load(profile_file)
+    if profile.get('version') != PROFILE_VERSION:
+        raise ValueError(f"Unsupported profile version {profile.get('version')!r}; expected {PROFILE_VERSION}.")
+    return profile
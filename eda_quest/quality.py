@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import re
+import json
+import pandas as pd
+
+SPECIAL_CHARACTERS = ['!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '-', '_', '+', '=', '{', '}', '[', ']', '|', '\\', ';', ':', "'", '"', '<', '>', ',', '.', '?', '/', '~', '`']
+SPECIAL_CHARACTERS_PATTERN = '|'.join(map(re.escape, SPECIAL_CHARACTERS))
+
+# Features with fewer unique values than this are reported as low cardinality
+LOW_CARDINALITY_THRESHOLD = 10
+
+
+class QualityReport:
+    """
+    Columnar result of the categorical and numerical feature checks.
+
+    Attributes:
+    - categorical: pd.DataFrame
+        One row per categorical feature with 'Unique Values', 'Binary', 'Low Cardinality',
+        'Special Characters', 'Inconsistent Capitalization', 'Similar Categories' and
+        'Sample Values'.
+    - numerical: pd.DataFrame
+        One row per numerical feature with 'All Numeric'.
+    """
+
+    def __init__(self, categorical, numerical):
+        self.categorical = categorical
+        self.numerical = numerical
+
+    def to_frame(self):
+        """
+        Return both tables stacked into one DataFrame indexed by feature.
+
+        Returns:
+        - pd.DataFrame
+            All checks, with a 'Feature Type' column and None where a check does not apply.
+        """
+        categorical = self.categorical.assign(**{'Feature Type': 'categorical'})
+        numerical = self.numerical.assign(**{'Feature Type': 'numerical'})
+        frame = pd.concat([categorical, numerical]).astype(object)
+        return frame.where(frame.notna(), None)
+
+    def to_dict(self):
+        """
+        Return the report as a JSON-compatible dict keyed by feature type and feature.
+        """
+        def records(frame):
+            return {
+                feature: {key: _to_builtin(value) for key, value in row.items()}
+                for feature, row in frame.to_dict(orient='index').items()
+            }
+        return {'categorical': records(self.categorical), 'numerical': records(self.numerical)}
+
+    def to_json(self, path=None, **kwargs):
+        """
+        Serialise the report to JSON.
+
+        Parameters:
+        - path: str, optional
+            File to write to. Default is None (return the JSON string).
+        - **kwargs:
+            Passed to `json.dumps`.
+
+        Returns:
+        - str or None
+            The JSON string when no path is given.
+        """
+        text = json.dumps(self.to_dict(), **kwargs)
+        if path is None:
+            return text
+        with open(path, 'w') as report_file:
+            report_file.write(text)
+
+    def render(self):
+        """
+        Print the report with recommendations, one section per feature.
+
+        Returns:
+        - None
+        """
+        if len(self.categorical):
+            print("\n\033[1mCategorical Feature Analysis\033[0m")
+        for feature, row in self.categorical.iterrows():
+            print(f"\n\033[1mFeature: {feature}\033[0m")
+            print(f"Number of Unique Values: {row['Unique Values']}")
+            print("Sample Values:", row['Sample Values'])
+
+            if row['Special Characters']:
+                print("\n\033[1mSpecial Characters Detected!\033[0m")
+                print("Recommendation: Consider removing or replacing special characters.")
+            else:
+                print("\n\033[1mNo Special Characters Detected\033[0m")
+
+            if row['Binary']:
+                print("\n\033[1mBinary feature detected\033[0m.")
+                print("Recommendation: Check if binary values are consistent (e.g., 'Yes'/'No', 'True'/'False').")
+            else:
+                print("\n\033[1mNo binary feature detected\033[0m.")
+
+            if row['Low Cardinality']:
+                print("\n\033[1mLow cardinality feature detected\033[0m.")
+                print("Recommendation: Check for consistency and consider one-hot encoding.")
+            else:
+                print("\n\033[1mHigh cardinality feature detected\033[0m.")
+                print("Recommendation: Review and possibly reduce cardinality through grouping or feature engineering.")
+
+            if row['Inconsistent Capitalization']:
+                print("Inconsistent Capitalization Detected!")
+                print("Recommendation: Standardize capitalization (e.g., convert all values to lowercase).")
+
+            if row['Similar Categories']:
+                print("Redundant or Similar Categories Detected!")
+                print("Recommendation: Consolidate similar categories into a single category.")
+                print("Similar Category Pairs:")
+                for pair in row['Similar Categories']:
+                    print(pair)
+
+        if len(self.numerical):
+            print("\n\033[1mNumerical Feature Analysis\033[0m")
+        for feature, row in self.numerical.iterrows():
+            print(f"\n\033[1mFeature: {feature}\033[0m")
+            if row['All Numeric']:
+                print("All entries are numeric.")
+            else:
+                print("Non-numeric entries detected.")
+                print("Recommendation: Check and clean non-numeric entries if necessary.")
+
+
+def _to_builtin(value):
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(item) for item in value]
+    # NaN, pd.NA and NaT have no JSON form
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    if hasattr(value, 'item'):
+        return value.item()
+    return value
+
+
+def _categorical_checks(df, features, sample_size):
+    columns = ['Unique Values', 'Binary', 'Low Cardinality', 'Special Characters',
+               'Inconsistent Capitalization', 'Similar Categories', 'Sample Values']
+    if not features:
+        return pd.DataFrame(columns=columns)
+
+    # Work on distinct values only: every check below is a property of the value set
+    uniques = {feature: pd.unique(df[feature].to_numpy(dtype=object)) for feature in features}
+    num_unique = pd.Series({feature: len(values) for feature, values in uniques.items()}, dtype='int64')
+
+    # One long table of (feature, value) for the non-null string values of every feature
+    labels, values = [], []
+    for feature, feature_values in uniques.items():
+        strings = [value for value in feature_values if isinstance(value, str)]
+        labels.extend([feature] * len(strings))
+        values.extend(strings)
+    long = pd.DataFrame({'feature': labels, 'value': pd.Series(values, dtype=object)})
+    long['lower'] = long['value'].str.lower()
+    long['key'] = long['lower'].str.replace(' ', '', regex=False)
+    long['special'] = long['value'].str.contains(SPECIAL_CHARACTERS_PATTERN, regex=True)
+
+    grouped = long.groupby('feature', sort=False)
+    special = grouped['special'].any().reindex(features, fill_value=False)
+    capitalization = (grouped['lower'].nunique() != grouped['value'].nunique()).reindex(features, fill_value=False)
+
+    # Values sharing a case- and space-insensitive key are similar categories
+    similar = {feature: [] for feature in features}
+    duplicated_keys = long[long.duplicated(['feature', 'key'], keep=False)]
+    for (feature, _), group in duplicated_keys.groupby(['feature', 'key'], sort=False):
+        group_values = group['value'].tolist()
+        similar[feature].extend(
+            (first, second) for i, first in enumerate(group_values) for second in group_values[i + 1:]
+        )
+
+    return pd.DataFrame({
+        'Unique Values': num_unique,
+        'Binary': num_unique == 2,
+        'Low Cardinality': num_unique < LOW_CARDINALITY_THRESHOLD,
+        'Special Characters': special.astype(bool),
+        'Inconsistent Capitalization': capitalization.astype(bool),
+        'Similar Categories': pd.Series(similar, dtype=object),
+        'Sample Values': pd.Series({feature: list(values[:sample_size]) for feature, values in uniques.items()}, dtype=object),
+    }, index=features, columns=columns)
+
+
+def _numerical_checks(df, features):
+    all_numeric = {}
+    for feature in features:
+        if feature not in df.columns or pd.api.types.is_numeric_dtype(df[feature]):
+            # Numeric dtypes (and typed sources whose columns were not decoded) cannot hold other entries
+            all_numeric[feature] = True
+        else:
+            column = df[feature]
+            all_numeric[feature] = bool(pd.to_numeric(column, errors='coerce').notna().eq(column.notna()).all())
+    return pd.DataFrame({'All Numeric': pd.Series(all_numeric, dtype=bool)}, index=list(features))
+
+
+def feature_quality_report(df, categorical_features=None, numerical_features=None, sample_size=10):
+    """
+    Run the categorical and numerical feature checks for all columns in one batched pass.
+
+    Checks are computed on the distinct values of each column, stacked into a single
+    table so that the string tests run as one vectorised operation over all features.
+
+    Parameters:
+    - df: pd.DataFrame
+        The DataFrame to check.
+    - categorical_features: list, optional
+        Columns to check as categorical. Default is None (all object columns).
+    - numerical_features: list, optional
+        Columns to check for non-numeric entries. Default is None (all numeric columns).
+        Columns not present in `df` are taken to come from a typed source and pass.
+    - sample_size: int, optional
+        Number of distinct values kept per categorical feature for display. Default is 10.
+
+    Returns:
+    - QualityReport
+        The results, which can be rendered or exported with `to_frame` / `to_json`.
+    """
+    if categorical_features is None:
+        categorical_features = df.select_dtypes(include=['object']).columns.tolist()
+    if numerical_features is None:
+        numerical_features = df.select_dtypes(include=['number']).columns.tolist()
+    return QualityReport(
+        _categorical_checks(df, list(categorical_features), sample_size),
+        _numerical_checks(df, list(numerical_features)),
+    )
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import weakref
+from statistics import NormalDist
+import numpy as np
+import pandas as pd
+from eda_quest.backends import get_backend
+
+# Rows drawn when fast mode is requested without an explicit sample size
+DEFAULT_SAMPLE_SIZE = 100_000
+
+# Samples already drawn, keyed by the id of the source frame and the sampling settings
+_SAMPLE_CACHE = {}
+
+
+class DataFrameSample:
+    """
+    A uniform or stratified random sample of a DataFrame, with design-based estimates.
+
+    Estimates are ratio estimators over the strata, so null rates, category frequencies
+    and means of partially missing columns all come with a standard error and a normal
+    confidence interval that includes the finite-population correction.
+
+    Attributes:
+    - frame: pd.DataFrame
+        The sampled rows.
+    - population: int
+        Number of rows in the source frame.
+    - strata: np.ndarray
+        Stratum code of every sampled row (all zeros for a uniform sample).
+    - stratum_sizes: np.ndarray
+        Number of source rows in every stratum.
+    """
+
+    def __init__(self, frame, population, strata=None, stratum_sizes=None):
+        self.frame = frame
+        self.population = int(population)
+        self.strata = np.zeros(len(frame), dtype=np.int64) if strata is None else np.asarray(strata)
+        self.stratum_sizes = np.array([population]) if stratum_sizes is None else np.asarray(stratum_sizes)
+
+    @property
+    def fraction(self):
+        """
+        Share of the source rows that were sampled.
+        """
+        return len(self.frame) / self.population if self.population else 1.0
+
+    def _estimate(self, numerator, denominator, confidence):
+        # Ratio of estimated totals, with a linearised variance summed over strata
+        numerator = pd.DataFrame(numerator).astype(float)
+        denominator = pd.DataFrame(denominator, index=numerator.index, columns=numerator.columns).astype(float)
+        strata = pd.Series(self.strata, index=numerator.index)
+        present = np.unique(self.strata)
+        weights = self.stratum_sizes[present] / self.population
+
+        numerator_means = numerator.groupby(strata).mean().to_numpy()
+        denominator_means = denominator.groupby(strata).mean().to_numpy()
+        scale = weights @ denominator_means
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ratio = (weights @ numerator_means) / scale
+            residuals = (numerator - denominator * ratio) / scale
+
+        grouped = residuals.groupby(strata)
+        sizes = grouped.size().to_numpy()
+        correction = 1 - sizes / self.stratum_sizes[present]
+        variances = grouped.var(ddof=1).fillna(0).to_numpy()
+        variance = (weights ** 2 * correction / sizes) @ variances
+        error = np.sqrt(np.clip(variance, 0, None))
+
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        return pd.DataFrame({
+            'Estimate': ratio,
+            'Std Error': error,
+            'Lower': ratio - z * error,
+            'Upper': ratio + z * error,
+        }, index=numerator.columns)
+
+    def estimate_means(self, columns=None, confidence=0.95):
+        """
+        Estimate the mean of numeric columns over their non-missing values.
+
+        Parameters:
+        - columns: list, optional
+            Columns to estimate. Default is None (all numeric columns).
+        - confidence: float, optional
+            Confidence level of the intervals. Default is 0.95.
+
+        Returns:
+        - pd.DataFrame
+            'Estimate', 'Std Error', 'Lower' and 'Upper' per column.
+        """
+        if columns is None:
+            columns = self.frame.select_dtypes(include=['number']).columns.tolist()
+        values = self.frame[columns].astype(float)
+        return self._estimate(values.fillna(0), values.notna(), confidence)
+
+    def estimate_null_rates(self, columns=None, confidence=0.95):
+        """
+        Estimate the share of missing values per column.
+
+        Parameters:
+        - columns: list, optional
+            Columns to estimate. Default is None (all columns).
+        - confidence: float, optional
+            Confidence level of the intervals. Default is 0.95.
+
+        Returns:
+        - pd.DataFrame
+            'Estimate', 'Std Error', 'Lower' and 'Upper' per column.
+        """
+        nulls = self.frame.isnull() if columns is None else self.frame[columns].isnull()
+        return self._estimate(nulls, np.ones(nulls.shape), confidence)
+
+    def estimate_frequencies(self, column, top=None, confidence=0.95):
+        """
+        Estimate the share of rows holding each value of a column.
+
+        Parameters:
+        - column: str
+            The column to estimate.
+        - top: int, optional
+            Keep only the most frequent values. Default is None (all values seen in the sample).
+        - confidence: float, optional
+            Confidence level of the intervals. Default is 0.95.
+
+        Returns:
+        - pd.DataFrame
+            'Estimate', 'Std Error', 'Lower' and 'Upper' per value, most frequent first.
+        """
+        indicators = pd.get_dummies(self.frame[column].astype(object), dtype=float)
+        estimates = self._estimate(indicators, np.ones(indicators.shape), confidence)
+        estimates = estimates.sort_values(by='Estimate', ascending=False)
+        return estimates if top is None else estimates.head(top)
+
+
+def _positions(codes, stratum_sizes, size, rng):
+    # Proportional allocation, with at least one row from every stratum
+    allocation = np.maximum(1, np.round(size * stratum_sizes / stratum_sizes.sum())).astype(np.int64)
+    allocation = np.minimum(allocation, stratum_sizes)
+    order = np.argsort(codes, kind='stable')
+    starts = np.concatenate([[0], np.cumsum(stratum_sizes)[:-1]])
+    positions = [
+        order[start + rng.choice(stratum_size, allocated, replace=False)]
+        for start, stratum_size, allocated in zip(starts, stratum_sizes, allocation)
+    ]
+    return np.concatenate(positions)
+
+
+def draw_sample(df, size=DEFAULT_SAMPLE_SIZE, stratify=None, seed=0):
+    """
+    Draw a uniform or stratified random sample of rows, reusing a cached one if possible.
+
+    Samples are cached per source frame and settings for as long as the frame is alive,
+    so repeated calls in a notebook draw the sample once. A frame modified in place
+    after sampling keeps returning the old sample; call `clear_sample_cache` then.
+
+    Parameters:
+    - df: pd.DataFrame, polars.DataFrame or polars.LazyFrame
+        The frame to sample.
+    - size: int, optional
+        Number of rows to draw. Default is 100,000. Frames with fewer rows are used whole.
+    - stratify: str or list, optional
+        Column(s) whose values define strata, sampled proportionally with at least one
+        row each so that rare groups are represented. Default is None (uniform sample).
+    - seed: int, optional
+        Seed of the random generator. Default is 0.
+
+    Returns:
+    - DataFrameSample
+        The sample, with its frame as a pandas DataFrame in source row order.
+    """
+    strata_columns = None if stratify is None else ([stratify] if isinstance(stratify, str) else list(stratify))
+    key = (id(df), size, None if strata_columns is None else tuple(strata_columns), seed)
+    cached = _SAMPLE_CACHE.get(key)
+    if cached is not None and cached[0]() is df:
+        return cached[1]
+
+    backend = get_backend(df)
+    population = backend.num_rows(df)
+    rng = np.random.default_rng(seed)
+    if strata_columns is None:
+        strata, stratum_sizes = None, None
+        positions = np.arange(population) if size >= population else rng.choice(population, size, replace=False)
+    else:
+        keys = backend.to_pandas(df, strata_columns)
+        codes = keys.groupby(strata_columns, sort=False, dropna=False).ngroup().to_numpy()
+        stratum_sizes = np.bincount(codes)
+        positions = _positions(codes, stratum_sizes, min(size, population), rng)
+        strata = codes[positions]
+
+    order = np.argsort(positions, kind='stable')
+    positions = positions[order]
+    if strata is not None:
+        strata = strata[order]
+    sample = DataFrameSample(backend.take(df, positions), population, strata, stratum_sizes)
+
+    try:
+        # Drop the cache entry when the source frame is garbage collected
+        reference = weakref.ref(df, lambda _: _SAMPLE_CACHE.pop(key, None))
+    except TypeError:
+        return sample
+    _SAMPLE_CACHE[key] = (reference, sample)
+    return sample
+
+
+def clear_sample_cache():
+    """
+    Forget all cached samples.
+    """
+    _SAMPLE_CACHE.clear()
+
+
+def resolve_sample(df, fast=False, sample=None):
+    """
+    Turn the `fast` / `sample` arguments of the EDA functions into a sample.
+
+    Parameters:
+    - df: DataFrame
+        The frame the EDA function was called with.
+    - fast: bool, optional
+        Whether to use a cached sample of the default size. Default is False.
+    - sample: int or DataFrameSample, optional
+        Sample size to draw, or a sample from `draw_sample` (e.g. a stratified one). Default is None.
+
+    Returns:
+    - DataFrameSample or None
+        None when neither argument asks for sampling.
+    """
+    if isinstance(sample, DataFrameSample):
+        return sample
+    if sample is not None:
+        return draw_sample(df, size=int(sample))
+    if fast:
+        return draw_sample(df)
+    return None
+
+
+def sampled_frame(df, fast=False, sample=None):
+    """
+    Return the rows an EDA function should work on: the sample in fast mode, else `df`.
+    """
+    drawn = resolve_sample(df, fast=fast, sample=sample)
+    return df if drawn is None else drawn.frame
@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import os
+import json
+import socket
+import argparse
+import threading
+import socketserver
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+import pandas as pd
+from eda_quest.charts import CHART_KINDS, render_charts
+from eda_quest.chunks import is_parquet_path
+from eda_quest.drift import compare_profiles
+from eda_quest.profile import profile_dataframe
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Parsed datasets and computed results kept in memory by default
+DEFAULT_MAX_DATASETS = 8
+DEFAULT_MAX_RESULTS = 256
+
+# Content types of the image formats `plot` can return
+IMAGE_TYPES = {'png': 'image/png', 'svg': 'image/svg+xml', 'pdf': 'application/pdf', 'jpg': 'image/jpeg'}
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache.
+
+    Values are computed once per key: concurrent requests for a key that is being
+    computed wait for that computation instead of repeating it.
+    """
+
+    def __init__(self, max_items):
+        self.max_items = max_items
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached value of `key`, computing and storing it on a miss.
+
+        Parameters:
+        - key: hashable
+            The cache key.
+        - compute: callable
+            Called without arguments to produce the value on a miss.
+
+        Returns:
+        - The value.
+        """
+        while True:
+            with self._lock:
+                if key in self._items:
+                    self.hits += 1
+                    self._items.move_to_end(key)
+                    return self._items[key]
+                pending = self._pending.get(key)
+                if pending is None:
+                    self.misses += 1
+                    pending = self._pending[key] = threading.Event()
+                    break
+            # Another thread computes this key; use its value once stored
+            pending.wait()
+
+        try:
+            value = compute()
+            with self._lock:
+                self._items[key] = value
+                while len(self._items) > self.max_items:
+                    self._items.popitem(last=False)
+            return value
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.set()
+
+    def clear(self):
+        """
+        Remove every cached value.
+        """
+        with self._lock:
+            self._items.clear()
+
+    def stats(self):
+        """
+        Return the number of cached items, hits and misses.
+        """
+        return {'items': len(self._items), 'max_items': self.max_items, 'hits': self.hits, 'misses': self.misses}
+
+
+def _file_key(path):
+    # A file is re-read whenever it is replaced or modified
+    path = os.path.abspath(os.fspath(path))
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def read_dataset(path):
+    """
+    Read a CSV file, Parquet file or Parquet dataset directory into a DataFrame.
+    """
+    if is_parquet_path(path):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+class ProfileService:
+    """
+    Profile, compare and plot datasets on disk, keeping parsed datasets and results warm.
+
+    Datasets are keyed by path, modification time and size, so a changed file is read
+    again, and every result is cached under its dataset keys and parameters. This is the
+    engine behind `serve`, and can also be used directly from a long-lived process.
+
+    Parameters:
+    - max_datasets: int, optional
+        Parsed datasets kept in memory. Default is 8.
+    - max_results: int, optional
+        Profiles, comparisons and images kept in memory. Default is 256.
+    """
+
+    def __init__(self, max_datasets=DEFAULT_MAX_DATASETS, max_results=DEFAULT_MAX_RESULTS):
+        self.datasets = LRUCache(max_datasets)
+        self.results = LRUCache(max_results)
+        # pyplot keeps global state, so charts are drawn one at a time
+        self._plot_lock = threading.Lock()
+
+    def dataset(self, path):
+        """
+        Return the parsed dataset at `path`, reading it on a cache miss.
+        """
+        key = _file_key(path)
+        return self.datasets.get_or_compute(key, lambda: read_dataset(key[0]))
+
+    def profile(self, path, top_k=50):
+        """
+        Return the `profile_dataframe` profile of the dataset at `path`.
+        """
+        key = ('profile', _file_key(path), top_k)
+        return self.results.get_or_compute(key, lambda: profile_dataframe(self.dataset(path), top_k=top_k))
+
+    def compare(self, baseline, current, bins=10, top_k=50):
+        """
+        Return the `compare_profiles` drift report between two datasets as a dict of rows.
+        """
+        key = ('compare', _file_key(baseline), _file_key(current), bins, top_k)
+
+        def compute():
+            report = compare_profiles(self.profile(baseline, top_k), self.profile(current, top_k), bins=bins)
+            return json.loads(report.to_json(orient='index'))
+
+        return self.results.get_or_compute(key, compute)
+
+    def plot(self, path, kind, column, fmt='png', **chart_params):
+        """
+        Return the image bytes of one `render_charts` chart of the dataset at `path`.
+        """
+        key = ('plot', _file_key(path), kind, column, fmt, tuple(sorted(chart_params.items())))
+
+        def compute():
+            dataframe = self.dataset(path)
+            if column not in dataframe.columns:
+                raise KeyError(f"Column {column!r} not found in {path}.")
+            with self._plot_lock:
+                return render_charts(dataframe, kind, columns=[column], fmt=fmt, **chart_params)[column]
+
+        return self.results.get_or_compute(key, compute)
+
+    def stats(self):
+        """
+        Return the hit and miss counts of the dataset and result caches.
+        """
+        return {'datasets': self.datasets.stats(), 'results': self.results.stats()}
+
+    def clear(self):
+        """
+        Drop every cached dataset and result.
+        """
+        self.datasets.clear()
+        self.results.clear()
+
+
+class _RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # GET /profile?path=...  /compare?baseline=...&current=...  /plot?path=...&column=...  /stats
+    server_version = 'eda-quest'
+
+    def _param(self, params, name, default=None, convert=str):
+        if name not in params:
+            if default is None:
+                raise _RequestError(400, f"Missing query parameter {name!r}.")
+            return default
+        try:
+            return convert(params[name][-1])
+        except ValueError:
+            raise _RequestError(400, f"Invalid value for {name!r}: {params[name][-1]!r}.")
+
+    def _route(self, endpoint, params):
+        service = self.server.service
+        if endpoint == 'profile':
+            return service.profile(self._param(params, 'path'), top_k=self._param(params, 'top_k', 50, int))
+        if endpoint == 'compare':
+            return service.compare(self._param(params, 'baseline'), self._param(params, 'current'),
+                                   bins=self._param(params, 'bins', 10, int),
+                                   top_k=self._param(params, 'top_k', 50, int))
+        if endpoint == 'plot':
+            kind, fmt = self._param(params, 'kind', 'histogram'), self._param(params, 'fmt', 'png')
+            if kind not in CHART_KINDS:
+                raise _RequestError(400, f"Unknown chart kind {kind!r}; expected one of {', '.join(CHART_KINDS)}.")
+            if fmt not in IMAGE_TYPES:
+                raise _RequestError(400, f"Unknown image format {fmt!r}; expected one of {', '.join(IMAGE_TYPES)}.")
+            return service.plot(self._param(params, 'path'), kind, self._param(params, 'column'), fmt=fmt,
+                                bins=self._param(params, 'bins', 30, int)), IMAGE_TYPES[fmt]
+        if endpoint == 'stats':
+            return service.stats()
+        raise _RequestError(404, f"Unknown endpoint {endpoint!r}; use profile, compare, plot or stats.")
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        try:
+            result = self._route(url.path.strip('/'), parse_qs(url.query))
+        except _RequestError as error:
+            return self._send_json(error.status, {'error': str(error)})
+        except FileNotFoundError as error:
+            return self._send_json(404, {'error': f"File not found: {error.filename}"})
+        except KeyError as error:
+            return self._send_json(404, {'error': str(error.args[0])})
+        except Exception as error:
+            return self._send_json(500, {'error': f"{type(error).__name__}: {error}"})
+
+        if isinstance(result, tuple):
+            body, content_type = result
+            self._send(200, body, content_type)
+        else:
+            self._send_json(200, result)
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload).encode(), 'application/json')
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix socket clients have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _PoolMixIn:
+    # Hand every connection to a fixed pool of worker threads
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process, request, client_address)
+
+    def _process(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=True)
+
+
+class ProfileServer(_PoolMixIn, HTTPServer):
+    """
+    HTTP server answering profile, compare and plot requests from a worker pool.
+    """
+
+
+class UnixProfileServer(_PoolMixIn, socketserver.UnixStreamServer):
+    """
+    The same server listening on a Unix domain socket.
+    """
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, workers=4, service=None,
+                verbose=False):
+    """
+    Create a profiling server without starting it.
+
+    Endpoints (all GET, query parameters in brackets):
+    - /profile [path, top_k]: the JSON profile of a CSV or Parquet dataset.
+    - /compare [baseline, current, bins, top_k]: the JSON drift report between two datasets.
+    - /plot [path, column, kind, fmt, bins]: the image bytes of one chart.
+    - /stats: hit and miss counts of the caches.
+
+    Parameters:
+    - host: str, optional
+        Interface to listen on. Default is '127.0.0.1'.
+    - port: int, optional
+        TCP port; 0 picks a free one. Default is 8765.
+    - socket_path: str, optional
+        Listen on this Unix socket instead of TCP. Default is None.
+    - workers: int, optional
+        Number of worker threads serving requests. Default is 4.
+    - service: ProfileService, optional
+        Service holding the caches. Default is None (a new one).
+    - verbose: bool, optional
+        Whether to log every request. Default is False.
+
+    Returns:
+    - ProfileServer or UnixProfileServer
+        Call `serve_forever()` to start it and `shutdown()` then `server_close()` to stop it.
+    """
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = UnixProfileServer(socket_path, _Handler)
+    else:
+        server = ProfileServer((host, port), _Handler)
+    server.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='eda-quest')
+    server.service = service if service is not None else ProfileService()
+    server.verbose = verbose
+    return server
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, workers=4, max_datasets=DEFAULT_MAX_DATASETS,
+          max_results=DEFAULT_MAX_RESULTS, verbose=True):
+    """
+    Run the profiling service until interrupted.
+
+    The plotting libraries are loaded up front, so no request pays their import time.
+    See `make_server` for the endpoints and parameters.
+    """
+    from eda_quest.utils import plotting_modules
+    plotting_modules()
+
+    service = ProfileService(max_datasets=max_datasets, max_results=max_results)
+    server = make_server(host, port, socket_path=socket_path, workers=workers, service=service, verbose=verbose)
+    where = socket_path if socket_path is not None else '{}:{}'.format(*server.server_address[:2])
+    print(f"eda-quest service listening on {where} with {workers} workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path is not None and os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve eda-quest profiles, comparisons and plots.')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--socket', dest='socket_path', help='Unix socket path to listen on instead of TCP.')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--max-datasets', type=int, default=DEFAULT_MAX_DATASETS)
+    parser.add_argument('--max-results', type=int, default=DEFAULT_MAX_RESULTS)
+    parser.add_argument('--quiet', action='store_true', help='Do not log requests.')
+    args = parser.parse_args(argv)
+    if args.socket_path is not None and not hasattr(socket, 'AF_UNIX'):
+        parser.error('Unix sockets are not supported on this platform.')
+    serve(args.host, args.port, socket_path=args.socket_path, workers=args.workers,
+          max_datasets=args.max_datasets, max_results=args.max_results, verbose=not args.quiet)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,421 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import os
+import datetime
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from eda_quest.backends import get_backend
+from eda_quest.kernels import column_moments, column_quantiles
+from eda_quest.quality import feature_quality_report
+
+STORE_VERSION = 1
+
+# One row per profiled column of a table on a date
+STORE_SCHEMA = pa.schema([
+    ('table', pa.string()),
+    ('column', pa.string()),
+    ('date', pa.date32()),
+    ('type', pa.string()),
+    ('rows', pa.int64()),
+    ('nulls', pa.int64()),
+    ('null_rate', pa.float64()),
+    ('distinct', pa.int64()),
+    ('mean', pa.float64()),
+    ('std', pa.float64()),
+    ('min', pa.float64()),
+    ('p25', pa.float64()),
+    ('median', pa.float64()),
+    ('p75', pa.float64()),
+    ('max', pa.float64()),
+    ('binary', pa.bool_()),
+    ('low_cardinality', pa.bool_()),
+    ('special_characters', pa.bool_()),
+    ('inconsistent_capitalization', pa.bool_()),
+    ('similar_categories', pa.int64()),
+    ('all_numeric', pa.bool_()),
+], metadata={'eda_quest_store_version': str(STORE_VERSION)})
+
+# The index lists every segment with the tables and dates it holds
+INDEX_SCHEMA = pa.schema([
+    ('segment', pa.string()),
+    ('table', pa.string()),
+    ('min_date', pa.date32()),
+    ('max_date', pa.date32()),
+    ('rows', pa.int64()),
+])
+
+INDEX_FILE = 'index.arrow'
+SEGMENT_EXTENSION = '.arrow'
+
+# Statistics of `dataframe_summary`'s 'Summary Statistics' and the store fields they fill
+DESCRIBE_FIELDS = {'mean': 'mean', 'std': 'std', 'min': 'min', '25%': 'p25', '50%': 'median', '75%': 'p75',
+                   'max': 'max'}
+
+# Categorical checks of a `QualityReport` and the store fields they fill
+CHECK_FIELDS = {'Binary': 'binary', 'Low Cardinality': 'low_cardinality', 'Special Characters': 'special_characters',
+                'Inconsistent Capitalization': 'inconsistent_capitalization'}
+
+
+def _as_date(date):
+    if date is None:
+        return datetime.date.today()
+    if isinstance(date, str):
+        return datetime.date.fromisoformat(date)
+    if isinstance(date, datetime.datetime):
+        return date.date()
+    return date
+
+
+def profile_rows(table, num_rows, null_counts, distinct, describe=None, report=None, date=None):
+    """
+    Turn summary results into store rows, one per column.
+
+    Parameters:
+    - table: str
+        Name of the profiled table.
+    - num_rows: int
+        Number of rows of the table.
+    - null_counts: pd.Series
+        Missing values per column, e.g. `dataframe_summary`'s 'Missing Values'.
+    - distinct: pd.Series
+        Distinct values per column, e.g. `dataframe_summary`'s 'Number of Unique Values'.
+    - describe: pd.DataFrame, optional
+        `describe` statistics of the numeric columns. Default is None.
+    - report: QualityReport, optional
+        Categorical and numerical checks, e.g. from `visualize_missing_data`. Default is None.
+    - date: datetime.date or str, optional
+        Date of the profile. Default is None (today).
+
+    Returns:
+    - pyarrow.Table
+        Rows following `STORE_SCHEMA`.
+    """
+    describe = describe if describe is not None else pd.DataFrame()
+    categorical = report.categorical if report is not None else pd.DataFrame()
+    numerical = report.numerical if report is not None else pd.DataFrame()
+    records = []
+    for column in null_counts.index:
+        nulls = int(null_counts[column])
+        record = {field.name: None for field in STORE_SCHEMA}
+        record.update({
+            'table': table, 'column': str(column), 'date': _as_date(date),
+            'type': 'numeric' if column in describe.columns else 'categorical',
+            'rows': int(num_rows), 'nulls': nulls, 'null_rate': nulls / num_rows if num_rows else None,
+            'distinct': int(distinct[column]) if column in distinct.index else None,
+        })
+        if column in describe.columns:
+            for statistic, field in DESCRIBE_FIELDS.items():
+                value = describe.loc[statistic, column] if statistic in describe.index else None
+                record[field] = float(value) if value is not None and pd.notna(value) else None
+        if column in categorical.index:
+            checks = categorical.loc[column]
+            record.update({field: bool(checks[check]) for check, field in CHECK_FIELDS.items()})
+            record['similar_categories'] = len(checks['Similar Categories'])
+        if column in numerical.index:
+            record['all_numeric'] = bool(numerical.loc[column, 'All Numeric'])
+        records.append(record)
+    return pa.Table.from_pylist(records, schema=STORE_SCHEMA)
+
+
+def _describe(df, backend, numeric):
+    # The describe statistics of the numeric columns from the single-pass kernels
+    if not numeric:
+        return pd.DataFrame()
+    block = backend.to_pandas(df, numeric).to_numpy(dtype=np.float64, na_value=np.nan)
+    moments = column_moments(block)
+    quantiles = column_quantiles(block, [0.25, 0.5, 0.75])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.sqrt(moments['m2'] / (moments['count'] - 1))
+    return pd.DataFrame([moments['mean'], std, moments['min'], *quantiles, moments['max']],
+                        index=list(DESCRIBE_FIELDS), columns=numeric)
+
+
+class ProfileStore:
+    """
+    Append-only columnar store of table profiles, for queries across many tables.
+
+    Every append writes one uncompressed Arrow IPC segment holding one row per column
+    (see `STORE_SCHEMA`) and records the segment's tables and dates in a small index,
+    so queries open only the segments they need. Segments are memory-mapped and read
+    without copying. `compact` merges the segments into one sorted segment.
+
+    Appends from concurrent processes are not coordinated; use one writer at a time.
+
+    Parameters:
+    - directory: str
+        Directory holding the store. Created if missing.
+    """
+
+    def __init__(self, directory):
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    @property
+    def _index_path(self):
+        return os.path.join(self.directory, INDEX_FILE)
+
+    def index(self):
+        """
+        Return the segment index as a pyarrow Table.
+        """
+        if not os.path.exists(self._index_path):
+            return INDEX_SCHEMA.empty_table()
+        return self._read(self._index_path)
+
+    def _read(self, path):
+        with pa.memory_map(path) as source:
+            return pa.ipc.open_file(source).read_all()
+
+    def _write(self, table, path):
+        # Write next to the target and rename, so readers never see a partial file
+        temporary = path + '.tmp'
+        with pa.OSFile(temporary, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(temporary, path)
+
+    def _next_segment(self, index):
+        numbers = [int(name[:-len(SEGMENT_EXTENSION)]) for name in index.column('segment').to_pylist()]
+        return f'{max(numbers, default=0) + 1:08d}{SEGMENT_EXTENSION}'
+
+    def append_rows(self, rows):
+        """
+        Append rows following `STORE_SCHEMA`, e.g. from `profile_rows`, as a new segment.
+
+        Parameters:
+        - rows: pyarrow.Table
+            The rows to append.
+
+        Returns:
+        - str
+            Name of the segment written.
+        """
+        rows = rows.cast(STORE_SCHEMA)
+        index = self.index()
+        segment = self._next_segment(index)
+        self._write(rows, os.path.join(self.directory, segment))
+
+        # One index entry per table in the segment
+        tables = pc.unique(rows.column('table')).to_pylist()
+        entries = []
+        for table in tables:
+            dates = rows.filter(pc.equal(rows.column('table'), table)).column('date')
+            bounds = pc.min_max(dates).as_py()
+            entries.append({'segment': segment, 'table': table, 'min_date': bounds['min'],
+                            'max_date': bounds['max'], 'rows': len(dates)})
+        index = pa.concat_tables([index, pa.Table.from_pylist(entries, schema=INDEX_SCHEMA)])
+        self._write(index, self._index_path)
+        return segment
+
+    def append(self, table, df, date=None):
+        """
+        Profile a DataFrame and append its profile.
+
+        Numeric columns get the `dataframe_summary` statistics, and non-numeric columns
+        the categorical checks of `visualize_missing_data`, besides null and distinct counts.
+
+        Parameters:
+        - table: str
+            Name of the table.
+        - df: pd.DataFrame or polars.DataFrame
+            The table's data.
+        - date: datetime.date or str, optional
+            Date of the profile. Default is None (today).
+
+        Returns:
+        - str
+            Name of the segment written.
+        """
+        backend = get_backend(df)
+        numeric = backend.numeric_columns(df)
+        non_numeric = backend.non_numeric_columns(df)
+        frame = backend.to_pandas(df, non_numeric)
+        report = feature_quality_report(frame, categorical_features=non_numeric, numerical_features=numeric)
+        rows = profile_rows(table, backend.num_rows(df), backend.null_counts(df), backend.nunique(df),
+                            describe=_describe(df, backend, numeric), report=report, date=date)
+        return self.append_rows(rows)
+
+    def append_summary(self, table, summary, num_rows, report=None, date=None):
+        """
+        Append the results of `dataframe_summary` (and optionally `visualize_missing_data`).
+
+        Parameters:
+        - table: str
+            Name of the table.
+        - summary: dict
+            Output of `dataframe_summary`.
+        - num_rows: int
+            Number of rows of the table.
+        - report: QualityReport, optional
+            Output of `visualize_missing_data`. Default is None.
+        - date: datetime.date or str, optional
+            Date of the profile. Default is None (today).
+
+        Returns:
+        - str
+            Name of the segment written.
+        """
+        rows = profile_rows(table, num_rows, summary['Missing Values'], summary['Number of Unique Values'],
+                            describe=summary['Summary Statistics'], report=report, date=date)
+        return self.append_rows(rows)
+
+    def scan(self, tables=None, start=None, end=None):
+        """
+        Read the stored rows, opening only the segments the index points to.
+
+        Parameters:
+        - tables: list of str, optional
+            Tables to read. Default is None (all tables).
+        - start, end: datetime.date or str, optional
+            Inclusive date range. Default is None (unbounded).
+
+        Returns:
+        - pyarrow.Table
+            The matching rows, backed by the memory-mapped segments.
+        """
+        index = self.index()
+        mask = pc.is_valid(index.column('segment'))
+        if tables is not None:
+            mask = pc.and_(mask, pc.is_in(index.column('table'), value_set=pa.array(list(tables), pa.string())))
+        if start is not None:
+            mask = pc.and_(mask, pc.greater_equal(index.column('max_date'), pa.scalar(_as_date(start), pa.date32())))
+        if end is not None:
+            mask = pc.and_(mask, pc.less_equal(index.column('min_date'), pa.scalar(_as_date(end), pa.date32())))
+        segments = pc.unique(index.filter(mask).column('segment')).to_pylist()
+        if not segments:
+            return STORE_SCHEMA.empty_table()
+
+        rows = pa.concat_tables([self._read(os.path.join(self.directory, segment)) for segment in segments])
+        expression = pc.field('table').is_valid()
+        if tables is not None:
+            expression &= pc.field('table').isin(list(tables))
+        if start is not None:
+            expression &= pc.field('date') >= pa.scalar(_as_date(start), pa.date32())
+        if end is not None:
+            expression &= pc.field('date') <= pa.scalar(_as_date(end), pa.date32())
+        return rows.filter(expression)
+
+    def query(self, expression=None, tables=None, start=None, end=None, latest=False):
+        """
+        Select stored rows with an Arrow expression, e.g. `pc.field('null_rate') > 0.5`.
+
+        Parameters:
+        - expression: pyarrow.compute.Expression, optional
+            Filter on the `STORE_SCHEMA` fields. Default is None (all rows).
+        - tables, start, end: optional
+            Restrict the tables and dates read, as in `scan`.
+        - latest: bool, optional
+            Whether to keep only the most recent profile of every table column before
+            filtering. Default is False.
+
+        Returns:
+        - pd.DataFrame
+            The matching rows.
+        """
+        rows = self.scan(tables=tables, start=start, end=end)
+        if latest:
+            rows = _latest(rows)
+        if expression is not None:
+            rows = rows.filter(expression)
+        return rows.to_pandas()
+
+    def low_cardinality(self, max_distinct=10, latest=True, tables=None):
+        """
+        Find the columns with fewer than `max_distinct` distinct values.
+
+        Parameters:
+        - max_distinct: int, optional
+            Columns with fewer distinct values are returned. Default is 10.
+        - latest: bool, optional
+            Whether to look at the most recent profile of every column only. Default is True.
+        - tables: list of str, optional
+            Tables to search. Default is None (all tables).
+
+        Returns:
+        - pd.DataFrame
+            The matching rows.
+        """
+        return self.query(pc.field('distinct') < max_distinct, tables=tables, latest=latest)
+
+    def null_rate_jumps(self, threshold=0.1, tables=None, start=None, end=None):
+        """
+        Find columns whose null rate rose by more than `threshold` between two
+        consecutive profiles of their table.
+
+        Parameters:
+        - threshold: float, optional
+            Rise of the null rate, as a fraction of the rows (0.1 is 10 percentage points).
+            Default is 0.1.
+        - tables, start, end: optional
+            Restrict the tables and dates read, as in `scan`.
+
+        Returns:
+        - pd.DataFrame
+            'table', 'column', 'previous_date', 'date', 'previous_null_rate', 'null_rate'
+            and 'change' for every jump, largest change first.
+        """
+        rows = _sorted_by_key(self.scan(tables=tables, start=start, end=end))
+        keys = _key_codes(rows)
+        rates = rows.column('null_rate').to_numpy(zero_copy_only=False).astype(float)
+        change = rates[1:] - rates[:-1]
+        with np.errstate(invalid='ignore'):
+            jumps = np.flatnonzero((keys[1:] == keys[:-1]) & (change > threshold))
+        dates = rows.column('date')
+        result = pd.DataFrame({
+            'table': rows.column('table').take(jumps + 1).to_pylist(),
+            'column': rows.column('column').take(jumps + 1).to_pylist(),
+            'previous_date': dates.take(jumps).to_pylist(),
+            'date': dates.take(jumps + 1).to_pylist(),
+            'previous_null_rate': rates[jumps],
+            'null_rate': rates[jumps + 1],
+            'change': change[jumps],
+        })
+        return result.sort_values('change', ascending=False, ignore_index=True)
+
+    def compact(self):
+        """
+        Merge all segments into one, sorted by table, column and date.
+
+        Returns:
+        - str or None
+            Name of the new segment, None if the store is empty.
+        """
+        index = self.index()
+        old_segments = pc.unique(index.column('segment')).to_pylist()
+        if not old_segments:
+            return None
+        rows = _sorted_by_key(self.scan())
+        segment = self._next_segment(index)
+        self._write(rows, os.path.join(self.directory, segment))
+
+        bounds = rows.group_by('table').aggregate([('date', 'min'), ('date', 'max'), ('date', 'count')])
+        self._write(pa.table({
+            'segment': pa.array([segment] * bounds.num_rows, pa.string()),
+            'table': bounds.column('table'),
+            'min_date': bounds.column('date_min'),
+            'max_date': bounds.column('date_max'),
+            'rows': bounds.column('date_count').cast(pa.int64()),
+        }, schema=INDEX_SCHEMA), self._index_path)
+        for name in old_segments:
+            os.remove(os.path.join(self.directory, name))
+        return segment
+
+
+def _sorted_by_key(rows):
+    return rows.sort_by([('table', 'ascending'), ('column', 'ascending'), ('date', 'ascending')])
+
+
+def _key_codes(rows):
+    # One integer per (table, column) pair, for comparing neighbouring rows
+    keys = pc.binary_join_element_wise(rows.column('table'), rows.column('column'), '\x1f')
+    return pc.dictionary_encode(keys).combine_chunks().indices.to_numpy()
+
+
+def _latest(rows):
+    # The most recent row of every (table, column) pair
+    rows = _sorted_by_key(rows)
+    keys = _key_codes(rows)
+    last = np.flatnonzero(np.append(keys[1:] != keys[:-1], True)) if len(keys) else np.array([], dtype=np.int64)
+    return rows.take(last)
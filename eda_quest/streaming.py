@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import time
+import asyncio
+import pandas as pd
+from eda_quest.backends import get_backend
+from eda_quest.memory import STRING_SAMPLE_ROWS
+from eda_quest.quality import feature_quality_report
+from eda_quest.sampling import sampled_frame
+from eda_quest.utils import is_arrow_source
+
+# Problems flagged by the per-column missing-data checks, keyed by the check that finds them
+QUALITY_PROBLEMS = {
+    'Special Characters': 'special characters',
+    'Inconsistent Capitalization': 'inconsistent capitalization',
+    'Similar Categories': 'similar categories',
+}
+
+
+class ColumnResult:
+    """
+    Result for one column, yielded by `iter_summary` and `iter_missing` as soon as the
+    column is done.
+
+    Attributes:
+    - column: str
+        The column.
+    - position: int
+        1-based position of the column among those being processed.
+    - total: int
+        Number of columns being processed.
+    - stats: dict
+        The column's statistics.
+    - problems: list of str
+        Issues found in the column, e.g. 'missing values' or 'constant'; empty if none.
+    - progress: float
+        Estimated share of the work done, from 0 to 1, weighted by column size.
+    - elapsed: float
+        Seconds since the iteration started.
+    - remaining: float or None
+        Estimated seconds left, extrapolated from `elapsed` and `progress`.
+    """
+
+    def __init__(self, column, position, total, stats, problems, progress, elapsed):
+        self.column = column
+        self.position = position
+        self.total = total
+        self.stats = stats
+        self.problems = problems
+        self.progress = progress
+        self.elapsed = elapsed
+        self.remaining = elapsed * (1 - progress) / progress if progress > 0 else None
+
+    def to_dict(self):
+        """
+        Return the column's statistics and problems as one flat dict.
+        """
+        return {**self.stats, 'Problems': list(self.problems)}
+
+    def __repr__(self):
+        problems = ', '.join(self.problems) if self.problems else 'no problems'
+        return f"ColumnResult({self.column!r}: {self.position}/{self.total}, {self.progress:.0%} done, {problems})"
+
+
+def _source_columns(df):
+    # Column names and a reader of one column as a pandas Series, for every input type
+    if is_arrow_source(df):
+        from eda_quest.parquet import arrow_schema, open_parquet_files, read_column
+        schema = arrow_schema(df)
+        files = open_parquet_files(df)
+        return schema.names, lambda column: read_column(df, column, schema, files).to_pandas()
+    backend = get_backend(df)
+    return backend.columns(df), lambda column: backend.to_pandas(df, [column])[column]
+
+
+def _column_costs(df, columns):
+    # Relative cost of each column: its in-memory size for pandas frames, else uniform
+    if not isinstance(df, pd.DataFrame):
+        return [1.0] * len(columns)
+    usage = df[columns].memory_usage(index=False, deep=False)
+    head = df[columns].head(STRING_SAMPLE_ROWS)
+    deep = head.memory_usage(index=False, deep=True) / max(len(head), 1) * len(df)
+    # String and object columns are costed by the size of their values, not of their pointers
+    return [float(max(usage[column] if pd.api.types.is_numeric_dtype(df[column]) else deep[column], 1))
+            for column in columns]
+
+
+def _iterate(df, columns, compute):
+    names, read = _source_columns(df)
+    columns = names if columns is None else list(columns)
+    costs = _column_costs(df, columns)
+    total_cost, done = sum(costs), 0.0
+    start = time.perf_counter()
+    for position, (column, cost) in enumerate(zip(columns, costs), start=1):
+        stats, problems = compute(read(column))
+        done += cost
+        yield ColumnResult(column, position, len(columns), stats, problems, done / total_cost,
+                           time.perf_counter() - start)
+
+
+def _summary_stats(series):
+    count = int(series.count())
+    stats = {'Type': str(series.dtype), 'Count': count, 'Missing': int(len(series) - count),
+             'Percent Missing': (len(series) - count) / len(series) * 100 if len(series) else 0.0,
+             'Unique': int(series.nunique())}
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        described = series.describe()
+        stats.update({name: float(described[name]) if count else None
+                      for name in ['mean', 'std', 'min', '25%', '50%', '75%', 'max']})
+    else:
+        frequencies = series.value_counts()
+        stats.update({'top': frequencies.index[0] if len(frequencies) else None,
+                      'freq': int(frequencies.iloc[0]) if len(frequencies) else 0})
+
+    problems = []
+    if stats['Missing']:
+        problems.append('missing values')
+    if count and stats['Unique'] == 1:
+        problems.append('constant')
+    return stats, problems
+
+
+def _missing_stats(series):
+    missing = int(series.isnull().sum())
+    stats = {'Total Missing': missing, 'Percent Missing': missing / len(series) * 100 if len(series) else 0.0}
+    frame = series.to_frame()
+    numeric = pd.api.types.is_numeric_dtype(series)
+    report = feature_quality_report(frame, categorical_features=[] if numeric else [series.name],
+                                    numerical_features=[series.name] if numeric else [])
+    checks = report.to_dict()['numerical' if numeric else 'categorical'][series.name]
+    stats.update(checks)
+
+    problems = ['missing values'] if missing else []
+    if not numeric:
+        problems.extend(problem for check, problem in QUALITY_PROBLEMS.items() if checks[check])
+    return stats, problems
+
+
+def iter_summary(df, columns=None, fast=False, sample=None):
+    """
+    Summarise a frame column by column, yielding each column's result as soon as it is done.
+
+    Each result holds the column's type, count, missing values, distinct count and either
+    the `describe` statistics (numeric columns) or the most frequent value. Stop the
+    iteration at any point, e.g. at the first result with `problems`, and the remaining
+    columns are never read. Frame-wide results such as duplicated rows stay in
+    `dataframe_summary`.
+
+    Parameters:
+    - df: pd.DataFrame, polars.DataFrame, polars.LazyFrame, str, list or pyarrow.Table
+        The frame or Parquet source. Parquet columns are decoded one at a time.
+    - columns: list, optional
+        Columns to summarise, in order. Default is None (all columns).
+    - fast: bool, optional
+        Whether to summarise a cached random sample of 100,000 rows. Default is False.
+    - sample: int or DataFrameSample, optional
+        Sample size to use instead of the default, or a sample drawn beforehand. Default is None.
+
+    Yields:
+    - ColumnResult
+        The next column's statistics, problems and the progress estimate.
+    """
+    if not is_arrow_source(df):
+        df = sampled_frame(df, fast=fast, sample=sample)
+    yield from _iterate(df, columns, _summary_stats)
+
+
+def iter_missing(df, columns=None, fast=False, sample=None):
+    """
+    Run the missing-data and feature checks of `visualize_missing_data` column by column,
+    yielding each column's result as soon as it is done.
+
+    Each result holds the column's missing count and percentage together with the
+    categorical checks (special characters, cardinality, capitalization, similar
+    categories) or the numerical one ('All Numeric'). Object columns holding numbers
+    only are checked as categorical, as in `feature_quality_report`.
+
+    Parameters:
+    - df: pd.DataFrame, polars.DataFrame, polars.LazyFrame, str, list or pyarrow.Table
+        The frame or Parquet source. Parquet columns are decoded one at a time.
+    - columns: list, optional
+        Columns to check, in order. Default is None (all columns).
+    - fast: bool, optional
+        Whether to check a cached random sample of 100,000 rows. Default is False.
+    - sample: int or DataFrameSample, optional
+        Sample size to use instead of the default, or a sample drawn beforehand. Default is None.
+
+    Yields:
+    - ColumnResult
+        The next column's checks, problems and the progress estimate.
+    """
+    if not is_arrow_source(df):
+        df = sampled_frame(df, fast=fast, sample=sample)
+    yield from _iterate(df, columns, _missing_stats)
+
+
+async def _aiterate(results):
+    # Compute every next result in a worker thread so the event loop stays responsive
+    loop = asyncio.get_running_loop()
+    done = object()
+    try:
+        while True:
+            result = await loop.run_in_executor(None, next, results, done)
+            if result is done:
+                return
+            yield result
+    finally:
+        results.close()
+
+
+def aiter_summary(df, columns=None, fast=False, sample=None):
+    """
+    Asynchronous version of `iter_summary`, for use with `async for`.
+
+    Columns are computed in the event loop's default executor, so other tasks (and
+    Jupyter widgets) keep running between results.
+    """
+    return _aiterate(iter_summary(df, columns=columns, fast=fast, sample=sample))
+
+
+def aiter_missing(df, columns=None, fast=False, sample=None):
+    """
+    Asynchronous version of `iter_missing`, for use with `async for`.
+    """
+    return _aiterate(iter_missing(df, columns=columns, fast=fast, sample=sample))
+
+
+def _progress_line(result):
+    remaining = f", about {result.remaining:.1f}s left" if result.remaining is not None else ""
+    return f"{result.position}/{result.total} columns, {result.progress:.0%} done{remaining}"
+
+
+def display_progressively(results, stop_on_problem=False):
+    """
+    Show streamed results as they arrive and return them as a DataFrame.
+
+    In Jupyter, a single table is redrawn in place after every column, with a progress
+    line above it; elsewhere one line is printed per column.
+
+    Parameters:
+    - results: iterable of ColumnResult
+        Output of `iter_summary` or `iter_missing`.
+    - stop_on_problem: bool, optional
+        Whether to stop at the first column with problems. Default is False.
+
+    Returns:
+    - pd.DataFrame
+        One row per column received, indexed by column.
+    """
+    try:
+        from IPython import get_ipython
+        from IPython.display import display as ipython_display
+    except ImportError:
+        get_ipython = None
+    handle = None
+    rows = {}
+    for result in results:
+        rows[result.column] = result.to_dict()
+        if get_ipython is not None and get_ipython() is not None:
+            frame = pd.DataFrame.from_dict(rows, orient='index')
+            content = {'text/plain': _progress_line(result)}
+            if handle is None:
+                progress = ipython_display(content, raw=True, display_id=True)
+                handle = (progress, ipython_display(frame, display_id=True))
+            else:
+                handle[0].update(content, raw=True)
+                handle[1].update(frame)
+        else:
+            problems = ', '.join(result.problems) if result.problems else 'ok'
+            print(f"[{_progress_line(result)}] {result.column}: {problems}")
+        if stop_on_problem and result.problems:
+            break
+    if hasattr(results, 'close'):
+        results.close()
+    return pd.DataFrame.from_dict(rows, orient='index')
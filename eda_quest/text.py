@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+# Import the necessary libraries
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Character classes counted per column, as RE2 classes
+CHARACTER_CLASSES = {
+    'Uppercase': r'\p{Lu}',
+    'Lowercase': r'\p{Ll}',
+    'Digits': r'\p{Nd}',
+    'Whitespace': r'\s',
+    'Punctuation': r'\p{P}',
+}
+
+# Rewrites turning a value into its shape: 'Ab-123 x' -> 'Aa-9 a'
+SHAPE_REWRITES = [
+    (r'\p{Lu}+', 'A'),
+    (r'\p{Ll}+', 'a'),
+    (r'\p{Nd}+', '9'),
+    (r'\s+', ' '),
+]
+
+# Columns of the `text_profile` result
+TEXT_PROFILE_COLUMNS = [
+    'Count', 'Empty', 'Whitespace Only', 'Leading Whitespace', 'Trailing Whitespace',
+    'Min Length', 'Mean Length', 'Median Length', 'P95 Length', 'Max Length',
+] + [f'{name} Share' for name in CHARACTER_CLASSES] + ['Other Share', 'Top Shapes']
+
+
+def _string_array(df, column):
+    # The column as Arrow strings, whatever the frame type
+    if isinstance(df, pa.Table):
+        values = df.column(column)
+        return values if pa.types.is_string(values.type) or pa.types.is_large_string(values.type) \
+            else pc.cast(values, pa.string())
+    if type(df).__module__.startswith('polars'):
+        return pc.cast(df[column].to_arrow(), pa.string())
+    series = df[column]
+    try:
+        return pa.array(series, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed object columns: format the non-missing values as strings
+        return pa.array(series.where(series.isna(), series.astype(str)), type=pa.string(), from_pandas=True)
+
+
+def _text_columns(df):
+    if isinstance(df, pa.Table):
+        return [field.name for field in df.schema
+                if pa.types.is_string(field.type) or pa.types.is_large_string(field.type)]
+    if type(df).__module__.startswith('polars'):
+        import polars as pl
+        return [name for name, dtype in df.schema.items() if dtype == pl.Utf8]
+    return df.select_dtypes(include=['object', 'string']).columns.tolist()
+
+
+def shapes(values):
+    """
+    Map strings to their shape masks: uppercase runs become 'A', lowercase runs 'a',
+    digit runs '9' and whitespace runs a single space; other characters are kept.
+
+    Parameters:
+    - values: pyarrow.Array or pyarrow.ChunkedArray
+        String values.
+
+    Returns:
+    - pyarrow.Array or pyarrow.ChunkedArray
+        The shape of every value, e.g. 'Aa-9' for 'Zone-12'.
+    """
+    for pattern, replacement in SHAPE_REWRITES:
+        values = pc.replace_substring_regex(values, pattern=pattern, replacement=replacement)
+    return values
+
+
+def _column_profile(values, top_shapes):
+    count = len(values) - values.null_count
+    lengths = pc.utf8_length(values)
+    total_characters = pc.sum(lengths).as_py() or 0
+    quantiles = pc.quantile(lengths, q=[0.5, 0.95]).to_pylist() if count else [None, None]
+    min_max = pc.min_max(lengths).as_py()
+
+    # Everything else is computed once per distinct value and weighted by its frequency
+    distinct, frequencies = pc.value_counts(values).flatten()
+    valid = pc.is_valid(distinct)
+    distinct, frequencies = pc.filter(distinct, valid), pc.filter(frequencies, valid)
+
+    def weighted(per_value):
+        return pc.sum(pc.multiply(pc.cast(per_value, pa.int64()), frequencies)).as_py() or 0
+
+    profile = {
+        'Count': count,
+        'Empty': weighted(pc.equal(pc.utf8_length(distinct), 0)),
+        'Whitespace Only': weighted(pc.utf8_is_space(distinct)),
+        'Leading Whitespace': weighted(pc.match_substring_regex(distinct, pattern=r'^\s')),
+        'Trailing Whitespace': weighted(pc.match_substring_regex(distinct, pattern=r'\s$')),
+        'Min Length': min_max['min'],
+        'Mean Length': pc.mean(lengths).as_py(),
+        'Median Length': quantiles[0],
+        'P95 Length': quantiles[1],
+        'Max Length': min_max['max'],
+    }
+
+    # Character-class composition from per-value counts of the characters in each class
+    classified = 0
+    for name, pattern in CHARACTER_CLASSES.items():
+        characters = weighted(pc.count_substring_regex(distinct, pattern=pattern))
+        classified += characters
+        profile[f'{name} Share'] = characters / total_characters if total_characters else None
+    profile['Other Share'] = (total_characters - classified) / total_characters if total_characters else None
+
+    shape_counts = pa.table({'shape': shapes(distinct), 'count': frequencies}) \
+        .group_by('shape').aggregate([('count', 'sum')]) \
+        .sort_by([('count_sum', 'descending'), ('shape', 'ascending')])
+    profile['Top Shapes'] = list(zip(shape_counts.column('shape').to_pylist()[:top_shapes],
+                                     shape_counts.column('count_sum').to_pylist()[:top_shapes]))
+    return profile
+
+
+def text_profile(df, columns=None, top_shapes=5):
+    """
+    Profile string columns with vectorised Arrow string kernels.
+
+    For every column this reports empty, whitespace-only and leading/trailing-whitespace
+    counts, the length distribution, the share of characters in each character class
+    and the most common shape masks (e.g. 'Aa9-'), without a Python loop over rows.
+
+    Parameters:
+    - df: pd.DataFrame, polars.DataFrame or pyarrow.Table
+        The table to profile.
+    - columns: list, optional
+        Columns to profile. Default is None (all string / object columns).
+    - top_shapes: int, optional
+        Number of most common shapes reported per column. Default is 5.
+
+    Returns:
+    - pd.DataFrame
+        One row per column; 'Top Shapes' holds (shape, count) pairs.
+    """
+    if columns is None:
+        columns = _text_columns(df)
+    rows = {column: _column_profile(_string_array(df, column), top_shapes) for column in columns}
+    return pd.DataFrame.from_dict(rows, orient='index', columns=TEXT_PROFILE_COLUMNS) if rows \
+        else pd.DataFrame(columns=TEXT_PROFILE_COLUMNS)
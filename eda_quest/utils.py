@@ -2,8 +2,21 @@
 # -*- coding: utf-8 -*-
 
 # Import packages
+import os
+import glob
+import importlib
 import pandas as pd
 
+# Optional dependencies and the setup.py extra that provides each of them
+OPTIONAL_DEPENDENCIES = {
+    'matplotlib': 'plots',
+    'seaborn': 'plots',
+    'IPython': 'display',
+    'pyarrow': 'parquet',
+    'polars': 'polars',
+    'numba': 'numba',
+}
+
 def styled_dataframe(df):
     """
     Apply styling to a DataFrame for better visual aesthetics.
@@ -30,6 +43,60 @@ def styled_dataframe(df):
     
     return styled_df
 
+def optional_import(module):
+    """
+    Import an optional dependency on first use.
+
+    Parameters:
+    - module: str
+        Dotted module name, e.g. 'matplotlib.pyplot'.
+
+    Returns:
+    - module
+        The imported module.
+
+    Raises:
+    - ImportError
+        If the module is not installed, naming the extra that provides it.
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError as error:
+        extra = OPTIONAL_DEPENDENCIES.get(module.split('.')[0])
+        hint = f" Install it with `pip install edaquest[{extra}]`." if extra else ""
+        raise ImportError(f"{module} is required for this feature.{hint}") from error
+
+
+def plotting_modules():
+    """
+    Load matplotlib.pyplot and seaborn on first use.
+
+    Returns:
+    - tuple
+        The (matplotlib.pyplot, seaborn) modules.
+    """
+    return optional_import('matplotlib.pyplot'), optional_import('seaborn')
+
+
+def display(obj):
+    """
+    Display an object with IPython when it is available and fall back to print otherwise.
+
+    Parameters:
+    - obj: any
+        The object to display.
+
+    Returns:
+    - None
+    """
+    try:
+        from IPython.display import display as ipython_display
+    except ImportError:
+        print(obj)
+    else:
+        ipython_display(obj)
+
+
 def display_heading(heading):
     """
     Display a heading with a border.
@@ -44,4 +111,45 @@ def display_heading(heading):
     space = ' ' * 14
     print(f'\n{border}')
     print(f'{space}{heading}')
-    print(f'{border}\n')
\ No newline at end of file
+    print(f'{border}\n')
+
+def _is_parquet_source(path):
+    # Parquet files, and directories holding at least one Parquet file
+    from eda_quest.chunks import is_parquet_path
+    path = os.fspath(path)
+    if os.path.isdir(path):
+        return any(glob.iglob(os.path.join(path, '**', '*.parquet'), recursive=True))
+    return is_parquet_path(path)
+
+
+def is_arrow_source(data):
+    """
+    Check whether an input should be handled by the Parquet/Arrow code path.
+
+    Parameters:
+    - data: any
+        The object passed to an eda_quest function in place of a DataFrame.
+
+    Returns:
+    - bool
+        True for Parquet file or directory paths (or lists of them) and pyarrow Tables.
+
+    Raises:
+    - ValueError
+        For paths that are not Parquet files or directories of Parquet files.
+    """
+    if isinstance(data, (str, os.PathLike)):
+        paths = [data]
+    elif isinstance(data, (list, tuple)) and data and all(isinstance(item, (str, os.PathLike)) for item in data):
+        paths = list(data)
+    else:
+        return type(data).__module__.startswith('pyarrow') and type(data).__name__ == 'Table'
+
+    for path in paths:
+        if not _is_parquet_source(path):
+            raise ValueError(
+                f"Unsupported input {os.fspath(path)!r}: expected a DataFrame, a pyarrow Table, a Parquet "
+                f"file (.parquet, .pq) or a directory of Parquet files. Read CSV files with pandas, or stream "
+                f"them with `eda_quest.chunks.iter_chunks`."
+            )
+    return True
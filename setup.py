@@ -11,7 +11,14 @@ setup(
     author='Bhanu Thakur',
     packages=find_packages(),
     install_requires=[
-        'pandas',
-        'seaborn'
+        'numpy',
+        'pandas'
     ],
+    extras_require={
+        'plots': ['matplotlib', 'seaborn'],
+        'display': ['ipython'],
+        'parquet': ['pyarrow'],
+        'polars': ['polars', 'pyarrow'],
+        'numba': ['numba'],
+    },
 )
\ No newline at end of file
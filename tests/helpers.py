@@ -0,0 +1,21 @@
+import importlib.util
+import numpy as np
+import pandas as pd
+
+
+def installed(*modules):
+    # Check optional dependencies without importing them, like `numba_available`
+    return all(importlib.util.find_spec(module) is not None for module in modules)
+
+
+# Polars converts pandas frames through pyarrow, so its extra installs both
+PYARROW_AVAILABLE = installed('pyarrow')
+POLARS_AVAILABLE = installed('polars', 'pyarrow')
+
+
+def house_prices(rng, n, missing=0.2):
+    # Synthetic house-price columns shared by the tests; callers add the columns their test needs
+    return pd.DataFrame({
+        'SalePrice': rng.normal(180000, 40000, size=n),
+        'LotFrontage': np.where(rng.random(n) < missing, np.nan, rng.normal(70, 20, size=n)),
+    })
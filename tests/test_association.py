@@ -0,0 +1,93 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+from eda_quest.association import (
+    categorical_association_matrix,
+    correlation_ratios,
+    numeric_association_matrix,
+    rank_features,
+)
+
+
+class TestAssociation(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=200)
+        self.df = pd.DataFrame({
+            'x': x,
+            'y': 2 * x + rng.normal(scale=0.1, size=200),
+            'z': rng.normal(size=200),
+            'w': np.where(rng.random(200) < 0.1, np.nan, x ** 3),
+            'g': pd.Series(np.where(x > 0, 'pos', 'neg'), dtype=object),
+            'h': pd.Series(np.where(x > 0, 'a', 'b'), dtype=object),
+            'r': pd.Series(rng.choice(['u', 'v', 'w'], size=200), dtype=object),
+        })
+
+    def test_numeric_matrix_matches_pandas(self):
+        columns = ['x', 'y', 'z', 'w']
+        for method in ('pearson', 'spearman'):
+            result = numeric_association_matrix(self.df, columns, method=method, block_size=3)
+            expected = self.df[columns].corr(method=method)
+            # Spearman ranks once per column, so allow a small gap where 'w' has missing values
+            np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-9 if method == 'pearson' else 0.02)
+
+    def test_cramers_v(self):
+        result = categorical_association_matrix(self.df, ['g', 'h', 'r'], block_size=2)
+        self.assertAlmostEqual(result.loc['g', 'h'], 1.0)
+        self.assertLess(result.loc['g', 'r'], 0.3)
+        self.assertTrue(np.allclose(result.to_numpy(), result.to_numpy().T))
+
+    def test_cramers_v_matches_dense_table(self):
+        result = categorical_association_matrix(self.df.assign(r=self.df['r'].where(self.df['x'] < 1.5)), ['g', 'r'])
+        table = pd.crosstab(self.df['g'], self.df['r'].where(self.df['x'] < 1.5)).to_numpy(dtype=float)
+        n = table.sum()
+        expected = np.outer(table.sum(axis=1), table.sum(axis=0)) / n
+        chi2 = ((table - expected) ** 2 / expected).sum()
+        self.assertAlmostEqual(result.loc['g', 'r'], np.sqrt(chi2 / n / (min(table.shape) - 1)))
+
+    def test_identifier_columns_are_skipped(self):
+        n = 200_000
+        ids = pd.DataFrame({
+            'id1': pd.Series([f'a{i}' for i in range(n)], dtype=object),
+            'id2': pd.Series([f'b{i}' for i in range(n)], dtype=object),
+            'id3': pd.Series([f'c{i}' for i in range(n)], dtype=object),
+            'group': pd.Series(np.arange(n) % 3, dtype=object),
+            'value': np.arange(n, dtype=float),
+        })
+        result = categorical_association_matrix(ids, ['id1', 'id2', 'id3', 'group'])
+        self.assertTrue(np.isnan(result.loc['id1', 'id2']))
+        self.assertAlmostEqual(result.loc['group', 'group'], 1.0)
+        ratios = correlation_ratios(ids, ['id1', 'group'], ['value'])
+        self.assertTrue(np.isnan(ratios.loc['id1', 'value']))
+        self.assertLess(ratios.loc['group', 'value'], 0.01)
+
+    def test_correlation_ratio(self):
+        result = correlation_ratios(self.df, ['g', 'r'], ['x', 'z'])
+        grouped = self.df.groupby('g')['x']
+        between = (grouped.count() * (grouped.mean() - self.df['x'].mean()) ** 2).sum()
+        total = ((self.df['x'] - self.df['x'].mean()) ** 2).sum()
+        self.assertAlmostEqual(result.loc['g', 'x'], np.sqrt(between / total))
+
+    def test_correlation_ratio_with_large_offset(self):
+        shifted = self.df.assign(x=self.df['x'] + 1e9)
+        result = correlation_ratios(shifted, ['g'], ['x'])
+        self.assertAlmostEqual(result.loc['g', 'x'], correlation_ratios(self.df, ['g'], ['x']).loc['g', 'x'], places=5)
+
+    def test_rank_features(self):
+        ranked = rank_features(self.df, 'y', top_k=3)
+        self.assertEqual(ranked.index[0], 'x')
+        self.assertEqual(len(ranked), 3)
+        self.assertNotIn('z', ranked.index)
+
+    def test_rank_features_categorical_target(self):
+        ranked = rank_features(self.df, 'g')
+        self.assertEqual(ranked.index[0], 'h')
+        self.assertAlmostEqual(ranked['h'], 1.0)
+        matrix = categorical_association_matrix(self.df, ['g', 'r'])
+        self.assertAlmostEqual(ranked['r'], matrix.loc['g', 'r'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+from eda_quest.backends import get_backend, PandasBackend, PolarsBackend
+from eda_quest.eda import handle_missing_values
+from eda_quest.outlier import detect_outliers_iqr
+from tests.helpers import POLARS_AVAILABLE
+
+if POLARS_AVAILABLE:
+    import polars as pl
+
+
+def _as_objects(df):
+    # Normalise missing markers, which differ between pandas and Arrow-backed strings
+    return df.astype(object).where(df.notna(), None)
+
+
+@unittest.skipUnless(POLARS_AVAILABLE, 'polars is not installed')
+class TestBackends(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'A': [1.0, 2.0, np.nan, 4.0, 100.0, 2.0],
+            'B': pd.Series(['x', None, 'y', 'x', 'y', 'x'], dtype=object),
+            'C': [3, 1, 2, 3, 1, 3],
+            'D': [np.nan, np.nan, 1.5, np.nan, 2.5, 2.5],
+        })
+        self.pl_df = pl.from_pandas(self.df)
+
+    def test_dispatch(self):
+        self.assertIsInstance(get_backend(self.df), PandasBackend)
+        self.assertIsInstance(get_backend(self.pl_df), PolarsBackend)
+        self.assertIsInstance(get_backend(self.pl_df.lazy()), PolarsBackend)
+
+    def test_statistics_match(self):
+        pandas_backend, polars_backend = PandasBackend(), PolarsBackend()
+        pd.testing.assert_frame_equal(polars_backend.describe(self.pl_df), pandas_backend.describe(self.df))
+        pd.testing.assert_series_equal(polars_backend.nunique(self.pl_df), pandas_backend.nunique(self.df),
+                                       check_dtype=False)
+        pd.testing.assert_series_equal(polars_backend.null_counts(self.pl_df), pandas_backend.null_counts(self.df),
+                                       check_dtype=False)
+        self.assertEqual(polars_backend.duplicated_count(self.pl_df), pandas_backend.duplicated_count(self.df))
+
+    def test_imputation_matches(self):
+        for strategy in ('auto', 'impute'):
+            expected = handle_missing_values(self.df, strategy=strategy)
+            result = handle_missing_values(self.pl_df.lazy(), strategy=strategy)
+            self.assertIsInstance(result, pl.LazyFrame)
+            pd.testing.assert_frame_equal(result.collect().to_pandas(), expected, check_dtype=False)
+
+    def test_imputation_with_all_null_columns(self):
+        df = self.df.assign(E=[np.nan] * 6, F=pd.Series([None] * 6, dtype=object))
+        expected = PandasBackend().imputation_values(df, threshold=5)
+        result = PolarsBackend().imputation_values(pl.from_pandas(df), threshold=5)
+        self.assertEqual(sorted(result), sorted(expected))
+        self.assertTrue(np.isnan(expected['E']) and np.isnan(result['E']))
+        self.assertIsNone(expected['F'])
+        self.assertIsNone(result['F'])
+        for column in ('A', 'B', 'D'):
+            self.assertEqual(result[column], expected[column])
+
+    def test_drop_matches(self):
+        for kwargs in ({}, {'row_threshold': 2}, {'column_threshold': 2}, {'row_threshold': 2, 'column_threshold': 3}):
+            expected = handle_missing_values(self.df, strategy='drop', **kwargs).reset_index(drop=True)
+            result = handle_missing_values(self.pl_df, strategy='drop', **kwargs)
+            pd.testing.assert_frame_equal(_as_objects(result.to_pandas()), _as_objects(expected))
+
+    def test_outliers_match(self):
+        data = self.df['C'].astype(float).tolist() + [50.0]
+        expected = detect_outliers_iqr(pd.Series(data))
+        result = detect_outliers_iqr(pl.Series(data))
+        self.assertEqual(result.to_list(), expected.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
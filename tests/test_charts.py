@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+from eda_quest.charts import ChartCache, fingerprint, render_charts
+from tests.helpers import house_prices
+
+
+class TestRenderCharts(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(8)
+        n = 500
+        self.df = house_prices(rng, n, missing=0).assign(
+            Zone=pd.Series(rng.choice(['RL', 'RM', 'FV'], size=n), dtype=object),
+        )
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_only_changed_charts_are_rendered(self):
+        cache = ChartCache(self.tmp.name)
+        first = render_charts(self.df, 'histogram', cache=cache)
+        self.assertEqual(sorted(first), ['LotFrontage', 'SalePrice'])
+        self.assertTrue(first['SalePrice'].startswith(b'\x89PNG'))
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+        changed = self.df.copy()
+        changed.loc[0, 'LotFrontage'] = 500
+        second = render_charts(changed, 'histogram', cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        self.assertEqual(second['SalePrice'], first['SalePrice'])
+
+        # Plot parameters are part of the key
+        render_charts(self.df, 'histogram', columns=['SalePrice'], cache=cache, bins=10)
+        self.assertEqual(cache.misses, 4)
+
+    def test_bar_box_and_svg(self):
+        bars = render_charts(self.df, 'bar', cache=self.tmp.name, fmt='svg')
+        self.assertEqual(list(bars), ['Zone'])
+        self.assertIn(b'<svg', bars['Zone'])
+        boxes = render_charts(self.df, 'box', columns=['LotFrontage'])
+        self.assertTrue(boxes['LotFrontage'].startswith(b'\x89PNG'))
+        with self.assertRaises(ValueError):
+            render_charts(self.df, 'pie')
+
+    def test_eviction_keeps_cache_bounded(self):
+        cache = ChartCache(self.tmp.name, max_bytes=3000)
+        for index in range(5):
+            cache.put(fingerprint(index), b'x' * 1000)
+            os.utime(cache._path(fingerprint(index), 'png'), (index, index))
+        self.assertLessEqual(cache.size(), 3000)
+        self.assertIsNone(cache.get(fingerprint(0)))
+        self.assertIsNotNone(cache.get(fingerprint(4)))
+
+    def test_puts_under_the_bound_do_not_scan(self):
+        cache = ChartCache(self.tmp.name, max_bytes=10000)
+        with mock.patch('eda_quest.charts.os.scandir', wraps=os.scandir) as scandir:
+            for index in range(9):
+                cache.put(fingerprint(index), b'x' * 1000)
+            self.assertEqual(scandir.call_count, 0)
+            cache.put(fingerprint(0), b'x' * 500)
+            cache.put(fingerprint(9), b'x' * 1000)
+            cache.put(fingerprint(10), b'x' * 1000)
+            self.assertEqual(scandir.call_count, 1)
+        self.assertEqual(cache._size, cache.size())
+        self.assertLessEqual(cache.size(), 9000)
+
+    def test_fingerprint_is_stable(self):
+        counts = pd.Series([3, 1], index=['RL', 'RM'])
+        self.assertEqual(fingerprint({'a': 1, 'b': 2}, counts), fingerprint({'b': 2, 'a': 1}, counts.copy()))
+        self.assertNotEqual(fingerprint(np.arange(3)), fingerprint(np.arange(3.0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+from eda_quest.chunks import drop_missing_chunked, iter_chunks, write_chunks
+from eda_quest.eda import handle_missing_values
+from tests.helpers import PYARROW_AVAILABLE
+
+
+class TestChunkedDrop(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(2)
+        values = rng.normal(size=(53, 4))
+        values[rng.random((53, 4)) < 0.2] = np.nan
+        values[:40, 3] = np.nan
+        self.df = pd.DataFrame(values, columns=['a', 'b', 'c', 'd'])
+        self.df['e'] = np.arange(53)
+        self.csv = os.path.join(self.tmpdir.name, 'data.csv')
+        self.df.to_csv(self.csv, index=False)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def check(self, output, **kwargs):
+        expected = handle_missing_values(self.df, strategy='drop', **kwargs).reset_index(drop=True)
+        info = handle_missing_values(self.csv, strategy='drop', output=output, chunksize=10, **kwargs)
+        result = pd.concat(list(iter_chunks(output, chunksize=10)), ignore_index=True)
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+        self.assertEqual(info['Rows Written'], len(expected))
+        return info
+
+    def test_matches_in_memory(self):
+        for extension in ('csv', 'parquet') if PYARROW_AVAILABLE else ('csv',):
+            output = os.path.join(self.tmpdir.name, f'out.{extension}')
+            self.check(output)
+            self.check(output, row_threshold=2)
+            info = self.check(output, row_threshold=2, column_threshold=20)
+            self.assertEqual(info['Columns Dropped'], ['d'])
+            self.check(output, column_threshold=20)
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, 'pyarrow is not installed')
+    def test_parquet_source_uses_footers(self):
+        source = os.path.join(self.tmpdir.name, 'data.parquet')
+        self.df.to_parquet(source, row_group_size=16)
+        output = os.path.join(self.tmpdir.name, 'out.parquet')
+        drop_missing_chunked(source, output, column_threshold=20, chunksize=7)
+        self.assertEqual(pd.read_parquet(output).columns.tolist(), ['a', 'b', 'c', 'e'])
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, 'pyarrow is not installed')
+    def test_parquet_output_with_late_typed_column(self):
+        frame = pd.DataFrame({'a': np.arange(30.0), 's': pd.Series([None] * 10 + ['x', 'y'] * 10, dtype=object)})
+        output = os.path.join(self.tmpdir.name, 'out.parquet')
+        rows_written, _ = write_chunks([frame.iloc[:10], frame.iloc[10:]], output, ['a', 's'])
+        self.assertEqual(rows_written, 30)
+        written = pd.read_parquet(output)
+        self.assertEqual(written['s'].isnull().sum(), 10)
+        self.assertEqual(written['s'].dropna().tolist(), frame['s'].dropna().tolist())
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, 'pyarrow is not installed')
+    def test_parquet_dataset_with_missing_column(self):
+        dataset = os.path.join(self.tmpdir.name, 'dataset')
+        os.makedirs(dataset)
+        self.df.iloc[:30].to_parquet(os.path.join(dataset, 'part-0.parquet'))
+        self.df.iloc[30:].drop(columns=['b']).to_parquet(os.path.join(dataset, 'part-1.parquet'))
+        expected = self.df.copy()
+        expected.loc[30:, 'b'] = np.nan
+        output = os.path.join(self.tmpdir.name, 'out.parquet')
+        info = drop_missing_chunked(dataset, output, row_threshold=5, chunksize=7)
+        self.assertEqual(info['Rows Written'], len(expected))
+        pd.testing.assert_frame_equal(pd.read_parquet(output), expected, check_dtype=False)
+
+    def test_rejects_other_strategies(self):
+        with self.assertRaises(ValueError):
+            handle_missing_values(self.csv, strategy='auto', output='unused.csv')
+
+
+if __name__ == '__main__':
+    unittest.main()
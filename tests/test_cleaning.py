@@ -0,0 +1,95 @@
+import os
+import json
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+from eda_quest.cleaning import CapOutliers, CleaningPipeline, Downcast, Impute
+from eda_quest.eda import handle_missing_values
+from tests.helpers import PYARROW_AVAILABLE, house_prices
+
+
+class TestCleaningPipeline(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(9)
+        n = 3000
+        self.df = house_prices(rng, n, missing=0.1).assign(
+            YearBuilt=rng.integers(1900, 2010, size=n).astype(float),
+            GarageCars=np.concatenate([rng.integers(0, 4, size=n - 1), [40]]),
+            Zone=pd.Series(np.where(rng.random(n) < 0.05, None, rng.choice(['RL', 'RM', 'FV'], size=n)), dtype=object),
+        )
+        self.pipeline = CleaningPipeline([Impute(), CapOutliers(), Downcast(max_categories=10)])
+
+    def test_single_chunk_matches_step_by_step_cleaning(self):
+        cleaned = self.pipeline.fit(self.df).transform(self.df)
+        expected = handle_missing_values(self.df, strategy='impute')
+        # Columns without missing values, so the fences fitted on the input are the same
+        for column in ['YearBuilt', 'GarageCars']:
+            q1, q3 = expected[column].quantile([0.25, 0.75])
+            lower, upper = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+            np.testing.assert_allclose(cleaned[column].to_numpy(dtype=float), expected[column].clip(lower, upper))
+        self.assertEqual(cleaned['Zone'].isnull().sum(), 0)
+        self.assertEqual(str(cleaned['Zone'].dtype), 'category')
+        self.assertEqual(cleaned['YearBuilt'].dtype, np.int16)
+        self.assertEqual(cleaned['GarageCars'].dtype, np.int8)
+        self.assertEqual(cleaned['LotFrontage'].isnull().sum(), 0)
+
+    def test_chunked_fit_is_close_to_single_pass(self):
+        single = CleaningPipeline([Impute(), CapOutliers()]).fit(self.df).operations
+        chunked = CleaningPipeline([Impute(), CapOutliers()]).fit(self.df, chunksize=500).operations
+        self.assertAlmostEqual(chunked['LotFrontage']['fill'], single['LotFrontage']['fill'], places=6)
+        np.testing.assert_allclose(chunked['YearBuilt']['clip'], single['YearBuilt']['clip'], rtol=0.01)
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, 'pyarrow is not installed')
+    def test_serialised_pipeline_scores_files(self):
+        self.pipeline.fit(self.df)
+        with tempfile.TemporaryDirectory() as path:
+            self.pipeline.save(os.path.join(path, 'pipeline.json'))
+            loaded = CleaningPipeline.load(os.path.join(path, 'pipeline.json'))
+            self.assertEqual(loaded.to_dict(), self.pipeline.to_dict())
+
+            source = os.path.join(path, 'test.csv')
+            scoring = self.df.copy()
+            scoring.loc[0, 'YearBuilt'] = np.nan
+            scoring.to_csv(source, index=False)
+            output = os.path.join(path, 'clean.parquet')
+            result = loaded.transform(source, output=output, chunksize=700)
+            self.assertEqual(result['Rows Written'], len(self.df))
+            written = pd.read_parquet(output)
+            self.assertEqual(written['GarageCars'].max(), self.pipeline.operations['GarageCars']['clip'][1])
+
+    def test_unfitted_pipeline_raises(self):
+        with self.assertRaises(ValueError):
+            CleaningPipeline([Impute()]).transform(self.df)
+
+    def test_constant_imputation_needs_a_value(self):
+        with self.assertRaises(ValueError):
+            Impute(strategy='constant')
+        cleaned = CleaningPipeline([Impute(strategy='constant', value=0)]).fit_transform(self.df)
+        self.assertEqual(cleaned.loc[self.df['LotFrontage'].isnull(), 'LotFrontage'].unique().tolist(), [0.0])
+
+    def test_out_of_range_scoring_data_raises(self):
+        pipeline = CleaningPipeline([Downcast()]).fit(self.df)
+        self.assertEqual(pipeline.operations['GarageCars']['dtype'], 'int8')
+        for value in (300, 2.5):
+            scoring = self.df.astype({'GarageCars': float})
+            scoring.loc[0, 'GarageCars'] = value
+            with self.assertRaises(ValueError):
+                pipeline.transform(scoring)
+        scoring.loc[0, 'GarageCars'] = np.nan
+        self.assertEqual(str(pipeline.transform(scoring)['GarageCars'].dtype), 'Int8')
+
+    def test_column_labels_keep_their_type(self):
+        frame = self.df.drop(columns='SalePrice').set_axis([0, 1, 2.5, 'Zone'], axis=1)
+        pipeline = CleaningPipeline([Impute(columns=[0, 'Zone']), Downcast()]).fit(frame)
+        loaded = CleaningPipeline.from_dict(json.loads(json.dumps(pipeline.to_dict())))
+        self.assertEqual(list(loaded.operations), [0, 1, 2.5, 'Zone'])
+        pd.testing.assert_frame_equal(loaded.transform(frame), pipeline.transform(frame))
+        with self.assertRaises(ValueError):
+            CleaningPipeline([Impute()]).fit(frame.set_axis([('a', 1), 'b', 'c', 'd'], axis=1)).to_dict()
+
+
+if __name__ == '__main__':
+    unittest.main()
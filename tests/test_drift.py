@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+from eda_quest.drift import compare_profiles
+from eda_quest.profile import load_profile, profile_dataframe, save_profile
+
+
+class TestCompareProfiles(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        n = 5000
+        self.train = pd.DataFrame({
+            'stable': rng.normal(size=n),
+            'shifted': rng.normal(size=n),
+            'zone': pd.Series(rng.choice(['RL', 'RM', 'FV'], p=[0.6, 0.3, 0.1], size=n), dtype=object),
+            'dropped': rng.normal(size=n),
+        })
+        self.test = pd.DataFrame({
+            'stable': rng.normal(size=n),
+            'shifted': np.where(rng.random(n) < 0.2, np.nan, rng.normal(1.0, size=n)),
+            'zone': pd.Series(rng.choice(['RL', 'RM', 'FV'], p=[0.2, 0.3, 0.5], size=n), dtype=object),
+            'new': rng.normal(size=n),
+        })
+
+    def test_drift_report(self):
+        report = compare_profiles(profile_dataframe(self.train), profile_dataframe(self.test))
+        self.assertLess(report.loc['stable', 'PSI'], 0.02)
+        self.assertGreater(report.loc['shifted', 'PSI'], 0.25)
+        self.assertAlmostEqual(report.loc['shifted', 'KS'], 0.38, delta=0.05)
+        self.assertAlmostEqual(report.loc['shifted', 'Wasserstein'], 1.0, delta=0.1)
+        self.assertAlmostEqual(report.loc['shifted', 'Null Rate Delta'], 0.2, delta=0.02)
+        self.assertAlmostEqual(report.loc['zone', 'Category Shift'], 0.4, delta=0.03)
+        self.assertEqual(report.loc['zone', 'Largest Shift'], 'FV')
+        self.assertEqual(report.loc['dropped', 'Status'], 'removed')
+        self.assertEqual(report.loc['new', 'Status'], 'added')
+
+    def test_discrete_column_without_drift(self):
+        rng = np.random.default_rng(6)
+        cars = {name: pd.DataFrame({'GarageCars': rng.choice([0, 1, 2, 3], p=[0.05, 0.25, 0.55, 0.15], size=3000)})
+                for name in ('train', 'test')}
+        report = compare_profiles(profile_dataframe(cars['train']), profile_dataframe(cars['test']))
+        train, test = np.sort(cars['train']['GarageCars']), np.sort(cars['test']['GarageCars'])
+        exact_ks = np.max(np.abs(np.searchsorted(train, [0, 1, 2, 3], side='right') / len(train)
+                                 - np.searchsorted(test, [0, 1, 2, 3], side='right') / len(test)))
+        self.assertAlmostEqual(report.loc['GarageCars', 'KS'], exact_ks, delta=0.011)
+        self.assertLess(report.loc['GarageCars', 'PSI'], 0.02)
+
+    def test_persisted_profiles(self):
+        with tempfile.TemporaryDirectory() as path:
+            baseline, current = os.path.join(path, 'train.json'), os.path.join(path, 'test.json')
+            save_profile(profile_dataframe(self.train), baseline)
+            save_profile(profile_dataframe(self.test), current)
+            self.assertEqual(load_profile(baseline)['num_rows'], len(self.train))
+            report = compare_profiles(baseline, current)
+            self.assertEqual(report.index[0], 'zone')
+
+
+if __name__ == '__main__':
+    unittest.main()
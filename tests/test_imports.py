@@ -0,0 +1,29 @@
+import subprocess
+import sys
+import unittest
+
+# pyarrow is left out because recent pandas versions import it themselves
+HEAVY_MODULES = ['matplotlib', 'seaborn', 'IPython', 'polars']
+
+IMPORT_SCRIPT = """
+import sys
+import eda_quest.eda, eda_quest.outlier, eda_quest.plots, eda_quest.utils
+heavy = sorted(name for name in {modules!r} if name in sys.modules)
+print(','.join(heavy))
+"""
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def run_import(self):
+        # Fresh interpreter so that modules imported by other tests don't interfere
+        script = IMPORT_SCRIPT.format(modules=HEAVY_MODULES)
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+        return output.stdout.strip()
+
+    def test_heavy_dependencies_not_imported(self):
+        self.assertEqual(self.run_import(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import os
+import tempfile
+import tracemalloc
+import unittest
+import numpy as np
+import pandas as pd
+
+from eda_quest.chunks import imputation_values_chunked, null_counts_chunked
+from eda_quest.eda import dataframe_summary, handle_missing_values, visualize_missing_data
+from eda_quest.memory import estimate_peak, frame_footprint, last_plan, parse_budget, plan_operation, set_memory_budget
+from tests.helpers import POLARS_AVAILABLE, PYARROW_AVAILABLE, house_prices
+
+if POLARS_AVAILABLE:
+    import polars as pl
+
+
+class TestMemoryPlanner(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(6)
+        n = 20_000
+        self.df = house_prices(rng, n).assign(
+            Alley=pd.Series(np.where(rng.random(n) < 0.9, None, 'Pave'), dtype=object),
+        )
+
+    def tearDown(self):
+        set_memory_budget(None)
+
+    def test_parse_budget(self):
+        self.assertEqual(parse_budget('512MB'), 512 * 1024 ** 2)
+        self.assertEqual(parse_budget('1.5 gb'), int(1.5 * 1024 ** 3))
+        self.assertEqual(parse_budget(1000), 1000)
+        with self.assertRaises(ValueError):
+            parse_budget('lots')
+
+    @unittest.skipUnless(POLARS_AVAILABLE, 'polars is not installed')
+    def test_footprint_and_plans(self):
+        footprint = frame_footprint(self.df)
+        self.assertEqual(footprint['Numeric Bytes'], 2 * 8 * len(self.df))
+        self.assertEqual(frame_footprint(pl.from_pandas(self.df).lazy())['Rows'], len(self.df))
+        self.assertIsNone(plan_operation('dataframe_summary', self.df))
+        self.assertEqual(plan_operation('dataframe_summary', self.df, '1GB').strategy, 'in-memory')
+
+        estimate = estimate_peak('dataframe_summary', footprint)
+        plan = plan_operation('dataframe_summary', self.df, estimate // 4)
+        self.assertEqual(plan.strategy, 'sampled')
+        self.assertAlmostEqual(plan.rows, len(self.df) // 4, delta=2)
+        self.assertIs(last_plan(), plan)
+
+    def test_summary_is_sampled_over_budget(self):
+        result = dataframe_summary(self.df, plot_histograms=False, memory_budget=100_000)
+        plan = result['Execution Plan']
+        self.assertEqual(plan.strategy, 'sampled')
+        self.assertEqual(result['Sample Size']['Rows'], plan.rows)
+
+    def test_missing_heatmap_counts_stay_exact(self):
+        import matplotlib
+        matplotlib.use('Agg')
+        set_memory_budget('100KB')
+        report = visualize_missing_data(self.df, render=False)
+        self.assertEqual(last_plan().operation, 'visualize_missing_data')
+        self.assertEqual(last_plan().strategy, 'sampled')
+        self.assertIn('Alley', report.categorical.index)
+
+    @unittest.skipUnless(POLARS_AVAILABLE, 'polars is not installed')
+    def test_sampled_heatmap_of_polars_frames(self):
+        import matplotlib
+        matplotlib.use('Agg')
+        for frame in (pl.from_pandas(self.df), pl.from_pandas(self.df).lazy()):
+            report = visualize_missing_data(frame, render=False, memory_budget='100KB')
+            self.assertEqual(last_plan().strategy, 'sampled')
+            self.assertIn('Alley', report.categorical.index)
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, 'pyarrow is not installed')
+    def test_handle_missing_on_disk(self):
+        with self.assertRaises(MemoryError):
+            handle_missing_values(self.df, strategy='impute', memory_budget=1000)
+        expected = handle_missing_values(self.df, strategy='impute')
+        with tempfile.TemporaryDirectory() as path:
+            output = os.path.join(path, 'clean.parquet')
+            result = handle_missing_values(self.df, strategy='impute', memory_budget=1000, output=output, chunksize=3000)
+            self.assertEqual(result['Execution Plan'].strategy, 'on-disk')
+            self.assertEqual(result['Rows Written'], len(self.df))
+            written = pd.read_parquet(output)
+            pd.testing.assert_frame_equal(written, expected.reset_index(drop=True), check_dtype=False)
+
+            output = os.path.join(path, 'dropped.csv')
+            result = handle_missing_values(self.df, strategy='drop', column_threshold=10_000, memory_budget=1000,
+                                           output=output)
+            self.assertEqual(result['Columns Dropped'], ['Alley'])
+            self.assertEqual(result['Rows Written'], len(self.df))
+
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, 'pyarrow is not installed')
+    def test_over_budget_paths_stay_within_budget(self):
+        rng = np.random.default_rng(7)
+        n, budget = 200_000, 4 * 1024 ** 2
+        df = pd.DataFrame(np.where(rng.random((n, 10)) < 0.1, np.nan, rng.normal(size=(n, 10))),
+                          columns=[f'x{i}' for i in range(10)])
+        expected = handle_missing_values(df, strategy='impute')
+        with tempfile.TemporaryDirectory() as path:
+            output = os.path.join(path, 'clean.parquet')
+            tracemalloc.start()
+            try:
+                visualize_missing_data(df, heatmap=False, render=False, memory_budget='100KB')
+                handle_missing_values(df, strategy='impute', memory_budget=budget, output=output, chunksize=10_000)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            # The whole frame takes 16 MB; a full null mask alone would take 2 MB
+            self.assertLess(peak, budget)
+            written = pd.read_parquet(output)
+        # Means are exact; medians come from merged sketches and are only used when far from the mean
+        np.testing.assert_allclose(written.to_numpy(), expected.to_numpy(), rtol=1e-9)
+
+    def test_chunked_imputation_values(self):
+        df = self.df.assign(Zone=pd.Series(np.resize(['RM', 'RL', None, 'RL', 'RM'], len(self.df)), dtype=object),
+                            Skewed=np.where(np.arange(len(self.df)) % 7 == 0, np.nan,
+                                            np.random.default_rng(8).exponential(100, size=len(self.df))))
+        chunks = [df.iloc[start:start + 3000] for start in range(0, len(df), 3000)]
+        values = imputation_values_chunked(chunks, ['LotFrontage', 'SalePrice', 'Skewed'], threshold=5)
+        self.assertEqual(sorted(values), ['Alley', 'LotFrontage', 'Skewed', 'Zone'])
+        self.assertAlmostEqual(values['LotFrontage'], df['LotFrontage'].mean())
+        self.assertAlmostEqual(values['Skewed'], df['Skewed'].median(), delta=df['Skewed'].median() * 0.02)
+        # Ties between 'RL' and 'RM' go to the smallest value, as with `Series.mode`
+        self.assertEqual(values['Zone'], df['Zone'].mode()[0])
+        self.assertEqual(values['Alley'], 'Pave')
+        pd.testing.assert_series_equal(null_counts_chunked(chunks), df.isnull().sum())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import io
+from contextlib import redirect_stdout
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+
+from eda_quest.eda import handle_missing_values, visualize_missing_data
+from eda_quest.missingness import MissingnessIndex
+
+
+class TestMissingnessIndex(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        values = rng.normal(size=(37, 4))
+        values[rng.random((37, 4)) < 0.3] = np.nan
+        values[:, 3] = np.where(np.isnan(values[:, 0]), np.nan, 1.0)
+        self.df = pd.DataFrame(values, columns=['a', 'b', 'c', 'd'])
+        self.mask = self.df.isnull()
+
+    def test_counts(self):
+        index = MissingnessIndex.from_frame(self.df)
+        self.assertEqual(index.bits.shape, (4, 5))
+        self.assertTrue(index.column_null_counts().equals(self.mask.sum()))
+        np.testing.assert_array_equal(index.row_null_counts(), self.mask.sum(axis=1).to_numpy())
+        self.assertTrue(index.to_mask().equals(self.mask))
+
+    def test_chunked_build_matches(self):
+        chunks = [self.df.iloc[start:start + 5] for start in range(0, len(self.df), 5)]
+        index = MissingnessIndex.from_frame(chunks)
+        np.testing.assert_array_equal(index.bits, MissingnessIndex.from_frame(self.df).bits)
+
+    def test_patterns_and_cooccurrence(self):
+        index = MissingnessIndex.from_frame(self.df)
+        patterns = index.pattern_frequencies()
+        expected = self.mask.value_counts()
+        self.assertEqual(patterns['Count'].sum(), len(self.df))
+        self.assertEqual(patterns['Count'].iloc[0], expected.iloc[0])
+
+        both = self.mask.astype(int).T @ self.mask.astype(int)
+        self.assertTrue((index.cooccurrence().to_numpy() == both.to_numpy()).all())
+        np.testing.assert_allclose(index.nullity_correlation().to_numpy(),
+                                   self.mask.astype(float).corr().to_numpy(), atol=1e-9)
+
+    def test_wide_index_takes_fewer_rows_per_step(self):
+        wide = pd.DataFrame(np.where(np.random.default_rng(2).random((1000, 100)) < 0.2, np.nan, 1.0))
+        mask = wide.isnull().astype(int)
+        index = MissingnessIndex.from_frame(wide)
+        with mock.patch('eda_quest.missingness.CELLS_PER_STEP', 4096):
+            blocks = list(index._unpacked_steps())
+            cooccurrence = index.cooccurrence()
+        self.assertGreater(len(blocks), 1)
+        self.assertTrue(all(block.size <= 4096 for _, block in blocks))
+        self.assertTrue((cooccurrence.to_numpy() == (mask.T @ mask).to_numpy()).all())
+
+    def test_save_and_memory_map(self):
+        index = MissingnessIndex.from_frame(self.df)
+        with tempfile.TemporaryDirectory() as path:
+            index.save(path)
+            loaded = MissingnessIndex.load(path)
+            self.assertIsInstance(loaded.bits, np.memmap)
+            self.assertTrue(loaded.column_null_counts().equals(index.column_null_counts()))
+            del loaded
+
+
+    def test_mask_of_selected_rows(self):
+        index = MissingnessIndex.from_frame(self.df)
+        rows = np.array([0, 3, 8, 9, 20, 36])
+        np.testing.assert_array_equal(index.to_mask(rows=rows).to_numpy(), self.mask.to_numpy()[rows])
+
+    def test_drop_selection_matches_handle_missing_values(self):
+        index = MissingnessIndex.from_frame(self.df)
+        for kwargs in ({}, {'row_threshold': 2}, {'column_threshold': 12}, {'row_threshold': 2, 'column_threshold': 12}):
+            keep_rows, columns_to_drop = index.drop_selection(**kwargs)
+            expected = self.df.loc[keep_rows].drop(columns=columns_to_drop)
+            result = handle_missing_values(self.df, strategy='drop', missing_index=index, **kwargs)
+            pd.testing.assert_frame_equal(result, expected)
+        self.assertTrue(handle_missing_values(self.df, strategy='drop').equals(self.df.dropna()))
+
+    def test_index_shared_with_visualize_missing_data(self):
+        index = MissingnessIndex.from_frame(self.df)
+        with redirect_stdout(io.StringIO()) as output:
+            visualize_missing_data(self.df, heatmap=False, missing_index=index)
+        self.assertIn(str(self.mask.sum().max()), output.getvalue())
+        with self.assertRaises(ValueError):
+            visualize_missing_data(self.df.iloc[:10], heatmap=False, render=False, missing_index=index)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from eda_quest.outlier import box_summaries, detect_outliers_iqr, outlier_sample
+from eda_quest.plots import box_plots
+
+
+class TestBoxSummaries(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(4)
+        n = 2000
+        self.df = pd.DataFrame({
+            'LotArea': np.concatenate([rng.normal(10000, 2000, size=n - 5), [90000, 85000, -40000, 70000, 60000]]),
+            'GarageYrBlt': np.where(rng.random(n) < 0.05, np.nan, rng.integers(1950, 2010, size=n)),
+            'Zone': rng.choice(['RL', 'RM'], size=n),
+        })
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_matches_numpy(self):
+        summaries = box_summaries(self.df)
+        self.assertEqual(summaries.index.tolist(), ['LotArea', 'GarageYrBlt'])
+        for column in summaries.index:
+            values = self.df[column].dropna().to_numpy()
+            q1, median, q3 = np.percentile(values, [25, 50, 75])
+            row = summaries.loc[column]
+            self.assertAlmostEqual(row['q1'], q1)
+            self.assertAlmostEqual(row['median'], median)
+            self.assertAlmostEqual(row['q3'], q3)
+            inside = values[(values >= q1 - 1.5 * (q3 - q1)) & (values <= q3 + 1.5 * (q3 - q1))]
+            self.assertEqual(row['whislo'], inside.min())
+            self.assertEqual(row['whishi'], inside.max())
+            self.assertEqual(row['outliers'], len(values) - len(inside))
+
+    def test_detect_outliers_reuses_summaries(self):
+        summaries = box_summaries(self.df)
+        mask = detect_outliers_iqr(self.df, summaries=summaries)
+        self.assertEqual(mask['LotArea'].sum(), summaries.loc['LotArea', 'outliers'])
+        expected = detect_outliers_iqr(self.df['LotArea'])
+        self.assertTrue(mask['LotArea'].equals(expected))
+
+    def test_detect_outliers_frame_uses_global_fences(self):
+        numeric = self.df[['LotArea', 'GarageYrBlt']].fillna(1980)
+        q1, q3 = np.percentile(numeric, [25, 75])
+        expected = (numeric < q1 - 1.5 * (q3 - q1)) | (numeric > q3 + 1.5 * (q3 - q1))
+        self.assertTrue(detect_outliers_iqr(numeric).equals(expected))
+
+    def test_fliers_collected_with_summaries(self):
+        summaries = box_summaries(self.df, max_outliers=4)
+        for column in summaries.index:
+            expected = outlier_sample(self.df[column], summaries.loc[column], max_outliers=4)
+            np.testing.assert_array_equal(summaries.loc[column, 'fliers'], expected)
+        self.assertEqual(len(box_summaries(self.df, max_outliers=100).loc['LotArea', 'fliers']),
+                         summaries.loc['LotArea', 'outliers'])
+
+    def test_outlier_sample_is_capped(self):
+        summary = box_summaries(self.df, ['LotArea']).loc['LotArea']
+        drawn = outlier_sample(self.df['LotArea'], summary, max_outliers=4)
+        self.assertEqual(len(drawn), 4)
+        self.assertIn(90000, drawn)
+        self.assertIn(-40000, drawn)
+
+    def test_box_plots_single_column_and_row(self):
+        summaries = box_plots(self.df, numeric_columns=['LotArea'])
+        self.assertEqual(summaries.index.tolist(), ['LotArea'])
+        summaries = box_plots(self.df, plots_per_row=2)
+        self.assertEqual(len(summaries), 2)
+        box_plots(self.df, numeric_columns=['LotArea', 'GarageYrBlt'], plots_per_row=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
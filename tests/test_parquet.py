@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+
+from eda_quest.eda import dataframe_summary
+from tests.helpers import PYARROW_AVAILABLE
+
+if PYARROW_AVAILABLE:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from eda_quest.parquet import footer_statistics, missing_info, null_mask, resolve_parquet_files
+
+
+@unittest.skipUnless(PYARROW_AVAILABLE, 'pyarrow is not installed')
+class TestParquetFastPath(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.df = pd.DataFrame({
+            'A': [1.0, 2.0, None, 4.0, 5.0, 6.0],
+            'B': pd.Series(['x', None, 'y', 'x', None, 'z'], dtype=object),
+            'C': [7, 7, 7, 7, 7, 7],
+        })
+        # Split across two files with small row groups to exercise footer merging
+        for i, part in enumerate([self.df.iloc[:3], self.df.iloc[3:]]):
+            table = pa.Table.from_pandas(part, preserve_index=False)
+            pq.write_table(table, os.path.join(self.tmpdir.name, f'part-{i}.parquet'), row_group_size=2)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_non_parquet_paths_rejected(self):
+        csv_path = os.path.join(self.tmpdir.name, 'houses.csv')
+        self.df.to_csv(csv_path, index=False)
+        empty_dir = os.path.join(self.tmpdir.name, 'empty')
+        os.mkdir(empty_dir)
+        for source in (csv_path, empty_dir, [csv_path]):
+            with self.assertRaises(ValueError) as context:
+                dataframe_summary(source)
+            self.assertIn('Parquet', str(context.exception))
+
+    def test_resolve_directory(self):
+        files = resolve_parquet_files(self.tmpdir.name)
+        self.assertEqual([os.path.basename(f) for f in files], ['part-0.parquet', 'part-1.parquet'])
+
+    def test_footer_statistics(self):
+        stats = footer_statistics(self.tmpdir.name)
+        self.assertEqual(stats.loc['A', 'Rows'], 6)
+        self.assertEqual(stats.loc['A', 'Null Count'], 1)
+        self.assertEqual(stats.loc['B', 'Null Count'], 2)
+        self.assertEqual(stats.loc['A', 'Min'], 1.0)
+        self.assertEqual(stats.loc['A', 'Max'], 6.0)
+        self.assertEqual(stats.loc['B', 'Max'], 'z')
+
+    def test_summary_matches_pandas(self):
+        expected = self.df.describe()
+        for source in (self.tmpdir.name, pa.Table.from_pandas(self.df, preserve_index=False)):
+            result = dataframe_summary(source)
+            np.testing.assert_allclose(result['Summary Statistics'].to_numpy(dtype=float),
+                                       expected.to_numpy(dtype=float))
+            self.assertEqual(result['Missing Values'].tolist(), [1, 2, 0])
+            self.assertEqual(result['Number of Unique Values'].tolist(), [5, 3, 1])
+            self.assertIsNone(result['Number of Duplicates'])
+
+    def test_summary_opens_each_file_once(self):
+        with mock.patch('eda_quest.parquet.pq.ParquetFile', wraps=pq.ParquetFile) as opened:
+            result = dataframe_summary(self.tmpdir.name)
+        self.assertEqual(opened.call_count, 2)
+        self.assertEqual(result['Number of Unique Values'].tolist(), [5, 3, 1])
+
+    def test_missing_info_and_mask(self):
+        info = missing_info(self.tmpdir.name)
+        self.assertEqual(info.index.tolist(), ['B', 'A'])
+        self.assertAlmostEqual(info.loc['B', 'Percent Missing'], 100 * 2 / 6)
+
+        mask = null_mask(self.tmpdir.name)
+        self.assertTrue(mask.equals(self.df.isnull()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+from eda_quest.pipeline import profile_files
+from eda_quest.profile import merge_profiles, profile_dataframe
+
+
+class TestProfileFiles(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.frames, self.paths = [], []
+        for day in range(4):
+            n = 700 + 50 * day
+            frame = pd.DataFrame({
+                'Price': np.where(rng.random(n) < 0.1, np.nan, rng.normal(100 + day, 15, size=n)),
+                'Zone': pd.Series(rng.choice(['RL', 'RM', 'FV'], size=n), dtype=object),
+            })
+            path = os.path.join(self.tmp.name, f'day{day}.csv')
+            frame.to_csv(path, index=False)
+            self.frames.append(frame)
+            self.paths.append(path)
+        self.full = pd.concat(self.frames, ignore_index=True)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def check(self, profile):
+        expected = profile_dataframe(self.full)
+        self.assertEqual(profile['num_rows'], len(self.full))
+        price, expected_price = profile['columns']['Price'], expected['columns']['Price']
+        self.assertEqual(price['nulls'], expected_price['nulls'])
+        self.assertAlmostEqual(price['mean'], expected_price['mean'])
+        self.assertAlmostEqual(price['m2'], expected_price['m2'], delta=1e-6 * expected_price['m2'])
+        self.assertEqual(price['min'], expected_price['min'])
+        self.assertAlmostEqual(price['sketch'][50], expected_price['sketch'][50], delta=1.0)
+        self.assertEqual(profile['columns']['Zone']['top'], expected['columns']['Zone']['top'])
+        self.assertEqual(profile['columns']['Zone']['distinct'], 3)
+
+    def test_matches_single_pass_profile(self):
+        profile, files = profile_files(self.paths, chunksize=300, read_workers=2, profile_workers=2,
+                                       max_pending=2, return_files=True)
+        self.check(profile)
+        self.assertEqual(files[self.paths[1]]['num_rows'], len(self.frames[1]))
+
+    def test_in_process_profiling(self):
+        self.check(profile_files(self.paths, chunksize=250, profile_workers=0))
+
+    def test_read_errors_are_raised(self):
+        with self.assertRaises(FileNotFoundError):
+            profile_files(self.paths + [os.path.join(self.tmp.name, 'missing.csv')], profile_workers=0)
+
+    def test_merge_missing_column(self):
+        merged = merge_profiles([profile_dataframe(self.frames[0]),
+                                 profile_dataframe(self.frames[1].drop(columns='Price'))])
+        self.assertEqual(merged['columns']['Price']['nulls'],
+                         self.frames[0]['Price'].isnull().sum() + len(self.frames[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+from eda_quest.chunks import iter_chunks
+from eda_quest.eda import dataframe_summary
+from eda_quest.profile import grouped_summary, merge_quantile_sketches, merge_sketch_rows, SKETCH_GRID
+from tests.helpers import POLARS_AVAILABLE
+
+if POLARS_AVAILABLE:
+    import polars as pl
+
+
+class TestGroupedSummary(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        n = 400
+        self.df = pd.DataFrame({
+            'Neighborhood': rng.choice(['NAmes', 'CollgCr', 'OldTown'], size=n),
+            'Year': rng.choice([2008, 2009], size=n),
+            'Price': np.where(rng.random(n) < 0.1, np.nan, rng.normal(180000, 40000, size=n)),
+            'Zone': pd.Series(rng.choice(['RL', 'RM', None], size=n), dtype=object),
+        })
+
+    def expected(self, neighborhood, column):
+        return self.df.loc[self.df['Neighborhood'] == neighborhood, column]
+
+    def test_matches_per_group_slices(self):
+        result = grouped_summary(self.df, 'Neighborhood', columns=['Price', 'Zone'])
+        for neighborhood in ['NAmes', 'CollgCr', 'OldTown']:
+            price = self.expected(neighborhood, 'Price')
+            row = result.loc[(neighborhood, 'Price')]
+            self.assertEqual(row['count'], price.count())
+            self.assertEqual(row['nulls'], price.isnull().sum())
+            self.assertAlmostEqual(row['mean'], price.mean())
+            self.assertAlmostEqual(row['std'], price.std())
+            self.assertAlmostEqual(row['50%'], price.median())
+            zone = result.loc[(neighborhood, 'Zone')]
+            self.assertEqual(zone['distinct'], self.expected(neighborhood, 'Zone').nunique())
+
+    @unittest.skipUnless(POLARS_AVAILABLE, 'polars is not installed')
+    def test_multiple_keys_and_polars(self):
+        result = grouped_summary(self.df, ['Neighborhood', 'Year'])
+        self.assertEqual(result.index.names, ['Neighborhood', 'Year', 'column'])
+        polars_result = grouped_summary(pl.from_pandas(self.df), ['Neighborhood', 'Year'])
+        pd.testing.assert_frame_equal(polars_result, result, check_index_type=False, check_dtype=False)
+
+    def test_streaming_matches(self):
+        chunks = [self.df.iloc[start:start + 90] for start in range(0, len(self.df), 90)]
+        streamed = grouped_summary(chunks, 'Neighborhood')
+        exact = grouped_summary(self.df, 'Neighborhood')
+        exact_stats = ['count', 'nulls', 'mean', 'std', 'min', 'max', 'distinct']
+        pd.testing.assert_frame_equal(streamed[exact_stats], exact[exact_stats], check_dtype=False)
+        # Quantiles come from merged sketches
+        np.testing.assert_allclose(streamed['50%'].dropna(), exact['50%'].dropna(), rtol=0.03)
+
+    def test_streaming_distinct_counts(self):
+        rng = np.random.default_rng(4)
+        df = pd.DataFrame({
+            'Zone': pd.Series(rng.choice(['RL', 'RM', None], size=3000), dtype=object),
+            'Id': rng.integers(0, 1500, size=3000),
+            'Code': pd.Series(rng.choice(['a', 'b', 'c', 'd'], size=3000), dtype=object),
+        })
+        df.loc[100:199, 'Id'] = np.nan
+        # The first chunk reads 'Id' as integers, the others as floats
+        chunks = [df.iloc[:100].astype({'Id': 'int64'})] + \
+            [df.iloc[start:start + 250] for start in range(100, len(df), 250)]
+        streamed = grouped_summary(chunks, 'Zone')
+        expected = df.groupby('Zone', dropna=False)[['Id', 'Code']].nunique()
+        for zone in expected.index:
+            for column in ['Id', 'Code']:
+                self.assertEqual(streamed.loc[(zone, column), 'distinct'], expected.loc[zone, column])
+
+    def test_streaming_column_typed_late(self):
+        with tempfile.TemporaryDirectory() as path:
+            source = os.path.join(path, 'houses.csv')
+            pool = pd.Series([None] * 100 + ['Gd', 'Ex'] * 150, dtype=object)
+            self.df.assign(PoolQC=pool.iloc[:len(self.df)].to_numpy()).to_csv(source, index=False)
+            streamed = grouped_summary(iter_chunks(source, chunksize=100), 'Neighborhood')
+        exact = grouped_summary(self.df.assign(PoolQC=pool.iloc[:len(self.df)].to_numpy()), 'Neighborhood')
+        pool_rows = streamed.xs('PoolQC', level='column')
+        self.assertTrue(pool_rows['mean'].isnull().all())
+        pd.testing.assert_series_equal(pool_rows['distinct'], exact.xs('PoolQC', level='column')['distinct'])
+        np.testing.assert_allclose(streamed.xs('Price', level='column')['mean'],
+                                   exact.xs('Price', level='column')['mean'])
+
+    def test_merge_sketch_rows(self):
+        rng = np.random.default_rng(5)
+        parts = [np.sort(rng.normal(size=(6, 50)), axis=1), np.sort(rng.exponential(size=(6, 80)), axis=1)]
+        sketches = [np.quantile(part, SKETCH_GRID, axis=1).T for part in parts]
+        counts = [np.array([50, 50, 0, 50, 0, 50]), np.array([80, 0, 80, 80, 0, 80])]
+        merged = merge_sketch_rows(sketches[0], sketches[1], counts[0], counts[1])
+        for row in range(6):
+            expected = merge_quantile_sketches([sketches[0][row], sketches[1][row]], [counts[0][row], counts[1][row]])
+            np.testing.assert_allclose(merged[row], expected)
+
+    def test_dataframe_summary_by_path(self):
+        with tempfile.TemporaryDirectory() as path:
+            source = os.path.join(path, 'houses.csv')
+            self.df.to_csv(source, index=False)
+            result = dataframe_summary(source, by='Neighborhood')
+            self.assertEqual(result.loc[('NAmes', 'Price'), 'count'], self.expected('NAmes', 'Price').count())
+
+    def test_merge_quantile_sketches(self):
+        rng = np.random.default_rng(4)
+        a, b = rng.normal(size=5000), rng.normal(2, size=3000)
+        merged = merge_quantile_sketches([np.quantile(a, SKETCH_GRID), np.quantile(b, SKETCH_GRID)], [5000, 3000],
+                                         probs=[0.1, 0.5, 0.9])
+        np.testing.assert_allclose(merged, np.quantile(np.concatenate([a, b]), [0.1, 0.5, 0.9]), atol=0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
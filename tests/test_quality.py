@@ -0,0 +1,57 @@
+import json
+import unittest
+import numpy as np
+import pandas as pd
+
+from eda_quest.eda import visualize_missing_data
+from eda_quest.quality import feature_quality_report
+
+
+class TestFeatureQualityReport(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'city': pd.Series(['New York', 'new york', 'Boston', None, 'boston!'], dtype=object),
+            'flag': pd.Series(['Yes', 'No', 'Yes', 'No', 'Yes'], dtype=object),
+            'code': pd.Series([str(i) for i in range(5)], dtype=object),
+            'price': [1.0, 2.0, np.nan, 4.0, 5.0],
+        })
+
+    def test_categorical_checks(self):
+        report = feature_quality_report(self.df)
+        categorical = report.categorical
+        self.assertEqual(categorical.loc['city', 'Unique Values'], 5)
+        self.assertTrue(categorical.loc['city', 'Special Characters'])
+        self.assertTrue(categorical.loc['city', 'Inconsistent Capitalization'])
+        self.assertEqual(categorical.loc['city', 'Similar Categories'], [('New York', 'new york')])
+        self.assertTrue(categorical.loc['flag', 'Binary'])
+        self.assertFalse(categorical.loc['flag', 'Special Characters'])
+        self.assertFalse(categorical.loc['flag', 'Inconsistent Capitalization'])
+        self.assertTrue(report.numerical.loc['price', 'All Numeric'])
+
+    def test_non_numeric_entries(self):
+        report = feature_quality_report(self.df, categorical_features=[], numerical_features=['code', 'flag'])
+        self.assertTrue(report.numerical.loc['code', 'All Numeric'])
+        self.assertFalse(report.numerical.loc['flag', 'All Numeric'])
+
+    def test_exports(self):
+        report = feature_quality_report(self.df)
+        frame = report.to_frame()
+        self.assertEqual(frame.loc['price', 'Feature Type'], 'numerical')
+        self.assertIsNone(frame.loc['price', 'Binary'])
+        data = json.loads(report.to_json())
+        self.assertEqual(data['categorical']['flag']['Unique Values'], 2)
+        self.assertEqual(data['categorical']['city']['Similar Categories'], [['New York', 'new york']])
+
+    def test_json_with_missing_values(self):
+        df = self.df.assign(zone=pd.Series(['RL', np.nan, 'RM', pd.NA, 'RL'], dtype=object))
+        data = json.loads(feature_quality_report(df, categorical_features=['zone']).to_json(allow_nan=False))
+        self.assertEqual(sorted(data['categorical']['zone']['Sample Values'], key=str), [None, None, 'RL', 'RM'])
+
+    def test_visualize_missing_data_returns_report(self):
+        report = visualize_missing_data(self.df, heatmap=False, render=False)
+        self.assertEqual(sorted(report.categorical.index), ['city', 'code', 'flag'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+from eda_quest.eda import dataframe_summary
+from eda_quest.sampling import clear_sample_cache, draw_sample
+from tests.helpers import POLARS_AVAILABLE
+
+if POLARS_AVAILABLE:
+    import polars as pl
+
+
+class TestDrawSample(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        n = 200_000
+        self.df = pd.DataFrame({
+            'Price': np.where(rng.random(n) < 0.25, np.nan, rng.normal(50, 10, size=n)),
+            'Zone': pd.Series(rng.choice(['RL', 'RM', 'C'], p=[0.7, 0.295, 0.005], size=n), dtype=object),
+        })
+
+    def tearDown(self):
+        clear_sample_cache()
+
+    def test_sample_is_cached(self):
+        sample = draw_sample(self.df, size=5000)
+        self.assertEqual(len(sample.frame), 5000)
+        self.assertTrue(sample.frame.index.is_monotonic_increasing)
+        self.assertIs(draw_sample(self.df, size=5000), sample)
+        self.assertIsNot(draw_sample(self.df, size=5000, seed=1), sample)
+
+    def test_intervals_cover_population_values(self):
+        sample = draw_sample(self.df, size=20_000)
+        means = sample.estimate_means()
+        self.assertLess(means.loc['Price', 'Lower'], self.df['Price'].mean())
+        self.assertGreater(means.loc['Price', 'Upper'], self.df['Price'].mean())
+        nulls = sample.estimate_null_rates()
+        self.assertLess(nulls.loc['Price', 'Lower'], self.df['Price'].isnull().mean())
+        self.assertGreater(nulls.loc['Price', 'Upper'], self.df['Price'].isnull().mean())
+        self.assertEqual(nulls.loc['Zone', 'Std Error'], 0)
+        frequencies = sample.estimate_frequencies('Zone')
+        self.assertEqual(frequencies.index[0], 'RL')
+        share = (self.df['Zone'] == 'RM').mean()
+        self.assertTrue(frequencies.loc['RM', 'Lower'] < share < frequencies.loc['RM', 'Upper'])
+
+    def test_stratified_sample_keeps_rare_groups(self):
+        sample = draw_sample(self.df, size=300, stratify='Zone')
+        counts = sample.frame['Zone'].value_counts()
+        self.assertGreaterEqual(counts['C'], 1)
+        frequencies = sample.estimate_frequencies('Zone')
+        # Strata shares are known exactly, so the frequencies carry no sampling error
+        self.assertAlmostEqual(frequencies.loc['C', 'Estimate'], (self.df['Zone'] == 'C').mean())
+        self.assertAlmostEqual(frequencies.loc['C', 'Std Error'], 0)
+
+    def test_whole_frame_has_exact_estimates(self):
+        small = self.df.head(100)
+        means = draw_sample(small, size=1000).estimate_means()
+        self.assertAlmostEqual(means.loc['Price', 'Estimate'], small['Price'].mean())
+        self.assertAlmostEqual(means.loc['Price', 'Std Error'], 0)
+
+    @unittest.skipUnless(POLARS_AVAILABLE, 'polars is not installed')
+    def test_polars_and_fast_summary(self):
+        sample = draw_sample(pl.from_pandas(self.df).lazy(), size=1000)
+        self.assertIsInstance(sample.frame, pd.DataFrame)
+        self.assertEqual(len(sample.frame), 1000)
+
+        result = dataframe_summary(self.df, plot_histograms=False, sample=2000)
+        self.assertEqual(result['Sample Size'], {'Rows': 2000, 'Population Rows': len(self.df)})
+        self.assertEqual(result['Summary Statistics'].loc['count', 'Price'], 2000 - result['Missing Values']['Price'])
+        self.assertIn('Price', result['Estimates']['Means'].index)
+
+
+if __name__ == '__main__':
+    unittest.main()
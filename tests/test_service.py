@@ -0,0 +1,192 @@
+import os
+import json
+import socket
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from http.client import HTTPConnection
+from urllib.parse import urlencode
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+from eda_quest.drift import compare_profiles
+from eda_quest.profile import profile_dataframe
+from eda_quest.service import LRUCache, ProfileService, make_server
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.get_or_compute('a', lambda: 1)
+        cache.get_or_compute('b', lambda: 2)
+        cache.get_or_compute('a', lambda: 0)
+        cache.get_or_compute('c', lambda: 3)
+        self.assertEqual(cache.get_or_compute('a', lambda: 0), 1)
+        self.assertEqual(cache.get_or_compute('b', lambda: 4), 4)
+        self.assertEqual(cache.stats()['items'], 2)
+
+    def test_concurrent_misses_compute_once(self):
+        cache, calls, release = LRUCache(4), [], threading.Event()
+
+        def compute():
+            calls.append(1)
+            release.wait()
+            return 'value'
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('key', compute)))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['value'] * 5)
+        self.assertEqual(len(calls), 1)
+
+    def test_failed_computation_is_not_cached(self):
+        cache = LRUCache(4)
+
+        def fail():
+            raise RuntimeError('boom')
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_compute('key', fail)
+        self.assertEqual(cache.get_or_compute('key', lambda: 5), 5)
+
+
+class ServiceTestCase(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(12)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.baseline = os.path.join(self.tmp.name, 'baseline.csv')
+        self.current = os.path.join(self.tmp.name, 'current.csv')
+        for path, shift in ((self.baseline, 0), (self.current, 10)):
+            pd.DataFrame({
+                'Price': rng.normal(100 + shift, 15, size=800),
+                'Zone': rng.choice(['RL', 'RM', 'FV'], size=800),
+            }).to_csv(path, index=False)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+
+class TestProfileService(ServiceTestCase):
+
+    def test_profile_is_cached(self):
+        service = ProfileService()
+        first = service.profile(self.baseline)
+        self.assertIs(service.profile(self.baseline), first)
+        expected = profile_dataframe(pd.read_csv(self.baseline))
+        self.assertEqual(first['num_rows'], expected['num_rows'])
+        self.assertAlmostEqual(first['columns']['Price']['mean'], expected['columns']['Price']['mean'])
+        self.assertEqual(service.stats()['datasets']['misses'], 1)
+
+    def test_changed_file_is_reread(self):
+        service = ProfileService()
+        service.profile(self.baseline)
+        pd.DataFrame({'Price': [1.0, 2.0], 'Zone': ['RL', 'RM']}).to_csv(self.baseline, index=False)
+        self.assertEqual(service.profile(self.baseline)['num_rows'], 2)
+
+    def test_compare_reuses_profiles(self):
+        service = ProfileService()
+        service.profile(self.baseline)
+        report = service.compare(self.baseline, self.current)
+        expected = compare_profiles(profile_dataframe(pd.read_csv(self.baseline)),
+                                    profile_dataframe(pd.read_csv(self.current)))
+        self.assertAlmostEqual(report['Price']['PSI'], expected.loc['Price', 'PSI'])
+        self.assertEqual(service.stats()['datasets']['misses'], 2)
+
+    def test_plot_returns_image_bytes(self):
+        service = ProfileService()
+        image = service.plot(self.baseline, 'histogram', 'Price')
+        self.assertTrue(image.startswith(b'\x89PNG'))
+        with self.assertRaises(KeyError):
+            service.plot(self.baseline, 'histogram', 'Missing')
+
+
+class TestHTTPServer(ServiceTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.server = make_server(port=0, workers=3)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = 'http://{}:{}'.format(*self.server.server_address[:2])
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        super().tearDown()
+
+    def get(self, endpoint, **params):
+        with urllib.request.urlopen(f'{self.base_url}/{endpoint}?{urlencode(params)}') as response:
+            return response.headers['Content-Type'], response.read()
+
+    def test_profile_and_compare(self):
+        content_type, body = self.get('profile', path=self.baseline)
+        self.assertEqual(content_type, 'application/json')
+        self.assertEqual(json.loads(body)['num_rows'], 800)
+        _, body = self.get('compare', baseline=self.baseline, current=self.current)
+        self.assertGreater(json.loads(body)['Price']['PSI'], 0.1)
+        _, body = self.get('stats')
+        self.assertEqual(json.loads(body)['results']['hits'], 1)
+
+    def test_plot(self):
+        content_type, body = self.get('plot', path=self.baseline, column='Zone', kind='bar', fmt='svg')
+        self.assertEqual(content_type, 'image/svg+xml')
+        self.assertIn(b'<svg', body)
+
+    def test_concurrent_requests(self):
+        bodies = []
+        threads = [threading.Thread(target=lambda: bodies.append(self.get('profile', path=self.current)[1]))
+                   for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(bodies)), 1)
+        self.assertEqual(self.server.service.stats()['results']['misses'], 1)
+
+    def test_errors(self):
+        for endpoint, params, status in (('profile', {}, 400),
+                                         ('profile', {'path': os.path.join(self.tmp.name, 'none.csv')}, 404),
+                                         ('plot', {'path': self.baseline, 'column': 'Price', 'kind': 'pie'}, 400),
+                                         ('unknown', {}, 404)):
+            with self.assertRaises(urllib.error.HTTPError) as context:
+                self.get(endpoint, **params)
+            self.assertEqual(context.exception.code, status)
+            self.assertIn('error', json.loads(context.exception.read()))
+            context.exception.close()
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix sockets are not supported')
+class TestUnixSocketServer(ServiceTestCase):
+
+    def test_profile_over_unix_socket(self):
+        path = os.path.join(self.tmp.name, 'eda.sock')
+        server = make_server(socket_path=path, workers=2)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            connection = HTTPConnection('localhost')
+            connection.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.sock.connect(path)
+            connection.request('GET', f'/profile?{urlencode({"path": self.baseline})}')
+            response = connection.getresponse()
+            self.assertEqual(response.status, 200)
+            self.assertEqual(json.loads(response.read())['num_rows'], 800)
+            connection.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == '__main__':
+    unittest.main()
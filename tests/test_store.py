@@ -0,0 +1,114 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+import numpy as np
+import pandas as pd
+
+from eda_quest.eda import dataframe_summary
+from eda_quest.quality import feature_quality_report
+from tests.helpers import PYARROW_AVAILABLE, house_prices
+
+if PYARROW_AVAILABLE:
+    import pyarrow.compute as pc
+    from eda_quest.store import STORE_SCHEMA, ProfileStore, profile_rows
+
+
+@unittest.skipUnless(PYARROW_AVAILABLE, 'pyarrow is not installed')
+class TestProfileStore(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(15)
+        n = 500
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ProfileStore(self.tmp.name)
+        self.df = house_prices(rng, n, missing=0).assign(
+            Zone=pd.Series(rng.choice(['RL', 'rl', 'RM'], size=n), dtype=object),
+            Neighborhood=pd.Series([f'N{i % 25}' for i in range(n)], dtype=object),
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_append_matches_summary(self):
+        self.store.append('houses', self.df, date='2024-03-01')
+        rows = self.store.query().set_index('column')
+        self.assertEqual(len(rows), 4)
+        described = self.df.describe()
+        self.assertAlmostEqual(rows.loc['SalePrice', 'mean'], described.loc['mean', 'SalePrice'])
+        self.assertAlmostEqual(rows.loc['SalePrice', 'std'], described.loc['std', 'SalePrice'])
+        self.assertAlmostEqual(rows.loc['LotFrontage', 'median'], described.loc['50%', 'LotFrontage'])
+        self.assertEqual(rows.loc['Zone', 'distinct'], 3)
+        self.assertTrue(rows.loc['Zone', 'inconsistent_capitalization'])
+        self.assertEqual(rows.loc['Zone', 'type'], 'categorical')
+        self.assertEqual(str(rows.loc['Zone', 'date']), '2024-03-01')
+
+    def test_append_summary(self):
+        with redirect_stdout(io.StringIO()):
+            summary = dataframe_summary(self.df, plot_histograms=False)
+        report = feature_quality_report(self.df, categorical_features=['Zone', 'Neighborhood'])
+        self.store.append_summary('houses', summary, len(self.df), report=report, date='2024-03-01')
+        rows = self.store.query().set_index('column')
+        self.assertAlmostEqual(rows.loc['SalePrice', 'p75'], summary['Summary Statistics'].loc['75%', 'SalePrice'])
+        self.assertEqual(rows.loc['Neighborhood', 'distinct'], 25)
+
+    def test_null_rate_jumps(self):
+        self.store.append('houses', self.df, date='2024-03-01')
+        changed = self.df.copy()
+        changed.loc[:99, 'LotFrontage'] = np.nan
+        changed.loc[:9, 'SalePrice'] = np.nan
+        self.store.append('houses', changed, date='2024-03-02')
+        self.store.append('sales', self.df, date='2024-03-02')
+
+        jumps = self.store.null_rate_jumps(threshold=0.1)
+        self.assertEqual(jumps[['table', 'column']].values.tolist(), [['houses', 'LotFrontage']])
+        self.assertAlmostEqual(jumps.loc[0, 'change'], 0.2)
+        self.assertEqual(len(self.store.null_rate_jumps(threshold=0.01)), 2)
+
+    def test_low_cardinality_uses_latest_profile(self):
+        self.store.append('houses', self.df.assign(Zone='RL'), date='2024-03-01')
+        self.store.append('houses', self.df.assign(Zone=[f'Z{i}' for i in range(len(self.df))]), date='2024-03-02')
+        self.store.append('sales', self.df, date='2024-03-01')
+        latest = self.store.low_cardinality(max_distinct=10)
+        self.assertEqual(latest[['table', 'column']].values.tolist(), [['sales', 'Zone']])
+        everything = self.store.low_cardinality(max_distinct=10, latest=False)
+        self.assertEqual(len(everything), 2)
+
+    def test_index_restricts_segments(self):
+        for day in range(1, 4):
+            self.store.append('houses', self.df, date=f'2024-03-0{day}')
+            self.store.append('sales', self.df, date=f'2024-03-0{day}')
+        self.assertEqual(self.store.index().num_rows, 6)
+        rows = self.store.scan(tables=['sales'], start='2024-03-02')
+        self.assertEqual(rows.num_rows, 8)
+        self.assertEqual(set(rows.column('table').to_pylist()), {'sales'})
+        expression = pc.field('column') == 'Zone'
+        self.assertEqual(len(self.store.query(expression, end='2024-03-01')), 2)
+
+    def test_compact(self):
+        for day in range(1, 4):
+            self.store.append('houses', self.df, date=f'2024-03-0{day}')
+        before = self.store.query()
+        segment = self.store.compact()
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), sorted(['index.arrow', segment]))
+        after = self.store.query()
+        self.assertEqual(len(after), len(before))
+        self.assertEqual(after['table'].tolist(), sorted(after['table'].tolist()))
+        self.store.append('houses', self.df, date='2024-03-04')
+        self.assertEqual(len(self.store.query()), 16)
+
+    def test_empty_store(self):
+        self.assertEqual(len(self.store.query()), 0)
+        self.assertEqual(len(self.store.null_rate_jumps()), 0)
+        self.assertEqual(len(self.store.low_cardinality()), 0)
+        self.assertIsNone(self.store.compact())
+
+    def test_profile_rows_schema(self):
+        rows = profile_rows('t', 2, pd.Series({'a': 1}), pd.Series({'a': 1}), date='2024-01-01')
+        self.assertEqual(rows.schema, STORE_SCHEMA)
+        self.assertEqual(rows.column('null_rate').to_pylist(), [0.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import asyncio
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+import numpy as np
+import pandas as pd
+
+from eda_quest.streaming import (ColumnResult, aiter_missing, aiter_summary, display_progressively, iter_missing,
+                                 iter_summary)
+from tests.helpers import PYARROW_AVAILABLE, house_prices
+
+
+class TestStreaming(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(14)
+        n = 1000
+        self.df = house_prices(rng, n).assign(
+            Zone=pd.Series(rng.choice(['RL', 'rl', 'RM'], size=n), dtype=object),
+            Utilities=pd.Series(['AllPub'] * n, dtype=object),
+        )
+
+    def test_summary_matches_describe(self):
+        results = list(iter_summary(self.df))
+        self.assertEqual([result.column for result in results], list(self.df.columns))
+        self.assertEqual([result.position for result in results], [1, 2, 3, 4])
+        described = self.df.describe()
+        lot = results[1].stats
+        self.assertEqual(lot['Missing'], int(self.df['LotFrontage'].isnull().sum()))
+        for name in ['mean', 'std', 'min', '50%', 'max']:
+            self.assertAlmostEqual(lot[name], described.loc[name, 'LotFrontage'])
+        self.assertEqual(results[2].stats['Unique'], 3)
+        self.assertEqual(results[1].problems, ['missing values'])
+        self.assertEqual(results[3].problems, ['constant'])
+
+    def test_progress_is_monotonic(self):
+        progress = [result.progress for result in iter_summary(self.df)]
+        self.assertEqual(progress, sorted(progress))
+        self.assertAlmostEqual(progress[-1], 1.0)
+        self.assertGreater(progress[0], 0.0)
+
+    def test_stop_at_first_problem(self):
+        read = []
+        results = iter_missing(self.df)
+        for result in results:
+            read.append(result.column)
+            if result.problems:
+                break
+        results.close()
+        self.assertEqual(read, ['SalePrice', 'LotFrontage'])
+
+    def test_missing_checks(self):
+        results = {result.column: result for result in iter_missing(self.df, columns=['Zone', 'LotFrontage'])}
+        self.assertEqual(list(results), ['Zone', 'LotFrontage'])
+        self.assertTrue(results['Zone'].stats['Inconsistent Capitalization'])
+        self.assertIn('similar categories', results['Zone'].problems)
+        self.assertAlmostEqual(results['LotFrontage'].stats['Percent Missing'],
+                               self.df['LotFrontage'].isnull().mean() * 100)
+
+    def test_async_iteration(self):
+        async def collect(results):
+            return [result async for result in results]
+
+        summary = asyncio.run(collect(aiter_summary(self.df)))
+        missing = asyncio.run(collect(aiter_missing(self.df, columns=['Zone'])))
+        self.assertEqual(len(summary), 4)
+        self.assertIsInstance(summary[0], ColumnResult)
+        self.assertEqual([result.column for result in missing], ['Zone'])
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, 'pyarrow is not installed')
+    def test_parquet_source(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'houses.parquet')
+            self.df.to_parquet(path)
+            results = list(iter_summary(path, columns=['LotFrontage']))
+        self.assertEqual(results[0].stats['Missing'], int(self.df['LotFrontage'].isnull().sum()))
+
+    def test_display_progressively(self):
+        with redirect_stdout(io.StringIO()) as output:
+            frame = display_progressively(iter_summary(self.df), stop_on_problem=True)
+        self.assertEqual(frame.index.tolist(), ['SalePrice', 'LotFrontage'])
+        self.assertIn('2/4 columns', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import pandas as pd
+
+from tests.helpers import POLARS_AVAILABLE, PYARROW_AVAILABLE
+
+if PYARROW_AVAILABLE:
+    import pyarrow as pa
+    from eda_quest.text import text_profile
+if POLARS_AVAILABLE:
+    import polars as pl
+
+
+@unittest.skipUnless(PYARROW_AVAILABLE, 'pyarrow is not installed')
+class TestTextProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'Code': pd.Series(['AB-12', 'CD-345', 'ef-6', None, 'GH-78'], dtype=object),
+            'Note': pd.Series(['', '   ', ' padded', 'trailing ', 'Fine text'], dtype=object),
+            'Mixed': pd.Series([1, 'x', None, 2.5, 'y'], dtype=object),
+            'Price': [1.0, 2.0, 3.0, 4.0, 5.0],
+        })
+
+    def test_counts_and_lengths(self):
+        profile = text_profile(self.df)
+        self.assertEqual(profile.index.tolist(), ['Code', 'Note', 'Mixed'])
+        note = profile.loc['Note']
+        self.assertEqual(note['Count'], 5)
+        self.assertEqual(note['Empty'], 1)
+        self.assertEqual(note['Whitespace Only'], 1)
+        self.assertEqual(note['Leading Whitespace'], 2)
+        self.assertEqual(note['Trailing Whitespace'], 2)
+        self.assertEqual(note['Max Length'], 9)
+        code = profile.loc['Code']
+        self.assertEqual(code['Count'], 4)
+        self.assertAlmostEqual(code['Mean Length'], (5 + 6 + 4 + 5) / 4)
+        self.assertEqual(profile.loc['Mixed', 'Count'], 4)
+
+    def test_character_classes_and_shapes(self):
+        code = text_profile(self.df, columns=['Code']).loc['Code']
+        self.assertAlmostEqual(code['Uppercase Share'], 6 / 20)
+        self.assertAlmostEqual(code['Lowercase Share'], 2 / 20)
+        self.assertAlmostEqual(code['Digits Share'], 8 / 20)
+        self.assertAlmostEqual(code['Punctuation Share'], 4 / 20)
+        self.assertEqual(code['Top Shapes'], [('A-9', 3), ('a-9', 1)])
+
+    @unittest.skipUnless(POLARS_AVAILABLE, 'polars is not installed')
+    def test_polars_and_arrow_inputs(self):
+        expected = text_profile(self.df, columns=['Code', 'Note'])
+        frame = self.df[['Code', 'Note']]
+        for data in (pl.from_pandas(frame), pa.Table.from_pandas(frame)):
+            result = text_profile(data)
+            self.assertEqual(result.index.tolist(), ['Code', 'Note'])
+            self.assertEqual(result.loc['Code', 'Top Shapes'], expected.loc['Code', 'Top Shapes'])
+            self.assertEqual(result.loc['Note', 'Empty'], expected.loc['Note', 'Empty'])
+
+    def test_no_text_columns(self):
+        self.assertEqual(len(text_profile(self.df[['Price']])), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()